@@ -0,0 +1,79 @@
+# coding=utf-8
+"""Benchmark the parsing of large .ddy files containing many weather stations.
+
+The .ddy files of the test fixtures are concatenated into a single file of
+several MB, which is then imported with DDY.from_ddy_file. The time to scan the
+same text with the regular expressions formerly used by DDY.from_ddy_file is
+also reported for reference.
+
+Run from the root of the repository with:
+
+    python benchmarks/ddy_benchmark.py
+"""
+from __future__ import division, print_function
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ladybug.ddy import DDY  # noqa: E402
+from ladybug.idfutil import parse_idf_objects  # noqa: E402
+
+DDY_FOLDER = os.path.join(
+    os.path.dirname(__file__), '..', 'tests', 'fixtures', 'ddy')
+DDY_FILES = ('chicago.ddy', 'tokyo.ddy')
+TARGET_SIZES = (1, 4)  # size of the concatenated files in MB
+LOC_PATTERN = re.compile(r"(Site:Location,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
+DDAY_PATTERN = re.compile(
+    r"(SizingPeriod:DesignDay,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
+
+
+def station_text():
+    """Get the text of all the fixture .ddy files concatenated together."""
+    ddy_txt = []
+    for ddy_file in DDY_FILES:
+        with open(os.path.join(DDY_FOLDER, ddy_file), 'rb') as ddy_data:
+            ddy_txt.append(ddy_data.read().decode('utf-8', 'ignore'))
+    return '\n'.join(ddy_txt)
+
+
+def write_multi_station_ddy(folder, size_mb):
+    """Write a .ddy file of roughly size_mb with many repeated stations."""
+    stations = station_text()
+    count = int(size_mb * 1024 * 1024 / len(stations)) + 1
+    file_path = os.path.join(folder, 'stations_{}mb.ddy'.format(size_mb))
+    with open(file_path, 'wb') as ddy_data:
+        ddy_data.write('\n'.join([stations] * count).encode('utf-8'))
+    return file_path
+
+
+def best_time(func, repeat=3):
+    """Get the best time in seconds to run a function once."""
+    return min(timeit.repeat(func, repeat=repeat, number=1))
+
+
+if __name__ == '__main__':
+    temp_folder = tempfile.mkdtemp()
+    try:
+        print('{:>8} {:>12} {:>14} {:>14} {:>14}'.format(
+            'size MB', 'design days', 'from_ddy (s)', 'tokenize (s)', 'regex (s)'))
+        for size in TARGET_SIZES:
+            ddy_path = write_multi_station_ddy(temp_folder, size)
+            with open(ddy_path, 'rb') as ddy_data:
+                ddy_txt = ddy_data.read().decode('utf-8')
+
+            ddy = DDY.from_ddy_file(ddy_path)
+            ddy_time = best_time(lambda: DDY.from_ddy_file(ddy_path))
+            token_time = best_time(lambda: list(parse_idf_objects(
+                ddy_txt, ('Site:Location', 'SizingPeriod:DesignDay'))))
+            regex_time = best_time(lambda: (
+                LOC_PATTERN.findall(ddy_txt), DDAY_PATTERN.findall(ddy_txt)), 1)
+            print('{:>8} {:>12} {:>14.3f} {:>14.3f} {:>14.3f}'.format(
+                size, len(ddy.design_days), ddy_time, token_time, regex_time))
+    finally:
+        shutil.rmtree(temp_folder)
@@ -0,0 +1,51 @@
+# coding=utf-8
+"""Benchmark the time that it takes to import ladybug in a new Python process.
+
+Each statement is run in a fresh interpreter so that nothing is cached in
+sys.modules between runs. An optional limit in milliseconds can be input
+for the import of ladybug, in which case the script exits with an error when
+the best time is above the limit. This is useful to catch regressions in
+continuous integration.
+
+Run from the root of the repository with:
+
+    python benchmarks/import_benchmark.py [limit_ms]
+"""
+from __future__ import division, print_function
+
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STATEMENTS = (
+    'import ladybug',
+    'import ladybug.datatype',
+    'from ladybug.datatype import TYPESDICT',
+    'import ladybug.epw',
+    'import ladybug.sunpath',
+)
+TIMER = 'import time; _st = time.time(); {}; print(time.time() - _st)'
+
+
+def import_time(statement, repeat=7):
+    """Get the best time in seconds to run an import statement in a new process."""
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', TIMER.format(statement)], cwd=ROOT_DIR)
+        times.append(float(output.decode('utf-8').strip().split()[-1]))
+    return min(times)
+
+
+if __name__ == '__main__':
+    limit = float(sys.argv[1]) if len(sys.argv) > 1 else None
+    results = []
+    print('{:<45} {:>10}'.format('statement', 'time (ms)'))
+    for stmt in STATEMENTS:
+        run_time = import_time(stmt) * 1000
+        results.append(run_time)
+        print('{:<45} {:>10.1f}'.format(stmt, run_time))
+    if limit is not None and results[0] > limit:
+        sys.exit('Importing ladybug took {:.1f} ms, which is above the limit of '
+                 '{:.1f} ms.'.format(results[0], limit))
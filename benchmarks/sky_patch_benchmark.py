@@ -0,0 +1,53 @@
+# coding=utf-8
+"""Benchmark the binning of annual sun positions into the patches of a sky dome.
+
+The hourly sun positions of a year are binned into the Tregenza and Reinhart
+patches both by finding the closest patch vector to each sun vector and with
+the direct patch lookup of ViewSphere.dome_patch_totals.
+
+Run from the root of the repository with:
+
+    python benchmarks/sky_patch_benchmark.py
+"""
+from __future__ import division, print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ladybug.sunpath import Sunpath  # noqa: E402
+from ladybug.analysisperiod import AnalysisPeriod  # noqa: E402
+from ladybug.viewsphere import view_sphere  # noqa: E402
+
+
+def closest_patch_totals(vectors, values, patch_vectors):
+    """Bin vectors into patches by comparing each vector with every patch vector."""
+    totals = [0] * len(patch_vectors)
+    for (x, y, z), val in zip(vectors, values):
+        if z < 0:
+            continue
+        dots = [x * p.x + y * p.y + z * p.z for p in patch_vectors]
+        totals[dots.index(max(dots))] += val
+    return totals
+
+
+def best_time(func, repeat=3):
+    """Get the best time in seconds to run a function once."""
+    return min(timeit.repeat(func, repeat=repeat, number=1))
+
+
+if __name__ == '__main__':
+    suns = Sunpath(42.37, -71.02, -5).calculate_sun_collection(
+        AnalysisPeriod().datetimes)
+    vectors = suns.sun_vectors_reversed
+    values = [1] * len(vectors)
+    print('{:>10} {:>12} {:>14}'.format('sky', 'closest (s)', 'lookup (s)'))
+    for name, div, patch_vecs in (('Tregenza', 1, view_sphere.tregenza_dome_vectors),
+                                  ('Reinhart', 2, view_sphere.reinhart_dome_vectors)):
+        closest_time = best_time(
+            lambda: closest_patch_totals(vectors, values, patch_vecs), 1)
+        lookup_time = best_time(
+            lambda: view_sphere.dome_patch_totals(vectors, values, div))
+        print('{:>10} {:>12.3f} {:>14.4f}'.format(name, closest_time, lookup_time))
@@ -0,0 +1,74 @@
+# coding=utf-8
+"""Benchmark the drawing of the sunpath geometry and the batch sun positions.
+
+The geometry of a sunpath is drawn both with an empty geometry cache (as when a
+location is requested for the first time) and with the unit sun positions of
+the location already found in the cache.
+
+The annual hourly sun positions of several sites are computed both with a Sun
+object for each hour of each site and with Sunpath.calculate_sun_collection_batch.
+
+Run from the root of the repository with:
+
+    python benchmarks/sunpath_benchmark.py
+"""
+from __future__ import division, print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ladybug.analysisperiod import AnalysisPeriod  # noqa: E402
+from ladybug.sunpath import Sunpath  # noqa: E402
+
+LOCATIONS = ((42.37, -71.02, -5), (-33.95, 151.18, 10), (69.68, 18.92, 1))
+SITE_COUNT = 20
+
+
+def draw_sunpath(latitude, longitude, time_zone, projection='Stereographic'):
+    """Draw all of the 3D and 2D geometry of a sunpath."""
+    sp = Sunpath(latitude, longitude, time_zone)
+    sp.hourly_analemma_polyline3d()
+    sp.monthly_day_arc3d()
+    sp.hourly_analemma_polyline2d(projection)
+    sp.monthly_day_polyline2d(projection)
+
+
+def cold_draw(location):
+    """Draw the sunpath geometry after clearing the geometry cache."""
+    Sunpath._geometries.clear()
+    draw_sunpath(*location)
+
+
+def batch_sites():
+    """Get a list of sites spread across three time zones of North America."""
+    return [(30 + i % 15, -75 - i, -5 - i % 3) for i in range(SITE_COUNT)]
+
+
+def site_suns(sites, datetimes):
+    """Compute the sun positions of several sites with a Sun for each datetime."""
+    for site in sites:
+        sp = Sunpath(*site)
+        [sp.calculate_sun_from_date_time(dt) for dt in datetimes]
+
+
+def best_time(func, repeat=5, number=10):
+    """Get the best time in milliseconds to run a function once."""
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1000
+
+
+if __name__ == '__main__':
+    print('{:>24} {:>12} {:>12}'.format('location', 'cold (ms)', 'cached (ms)'))
+    for loc in LOCATIONS:
+        cold_time = best_time(lambda: cold_draw(loc))
+        warm_time = best_time(lambda: draw_sunpath(*loc))
+        print('{:>24} {:>12.2f} {:>12.2f}'.format(str(loc), cold_time, warm_time))
+
+    sites, datetimes = batch_sites(), AnalysisPeriod().datetimes
+    suns_time = best_time(lambda: site_suns(sites, datetimes), 1, 1) / 1000
+    batch_time = best_time(
+        lambda: Sunpath.calculate_sun_collection_batch(sites), 1, 1) / 1000
+    print('\n{} annual sites: {:.2f} s with Sun objects, {:.2f} s in batch'.format(
+        SITE_COUNT, suns_time, batch_time))
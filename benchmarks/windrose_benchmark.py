@@ -0,0 +1,49 @@
+# coding=utf-8
+"""Benchmark the construction of WindRose colored meshes.
+
+Run from the root of the repository with:
+
+    python benchmarks/windrose_benchmark.py
+"""
+from __future__ import division, print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ladybug.epw import EPW  # noqa: E402
+from ladybug.legend import LegendParameters  # noqa: E402
+from ladybug.windrose import WindRose  # noqa: E402
+
+EPW_PATH = os.path.join(
+    os.path.dirname(__file__), '..', 'tests', 'fixtures', 'epw', 'tokyo.epw')
+DIRECTION_COUNTS = (8, 16, 36, 72)
+
+
+def colored_mesh_time(epw, number_of_directions, repeat=5, number=5):
+    """Get the best time in seconds to build the colored mesh of a WindRose."""
+    w_rose = WindRose(epw.wind_direction, epw.wind_speed, number_of_directions)
+    w_rose.show_zeros = True
+    w_rose.frequency_hours = 20
+    w_rose.legend_parameters = LegendParameters(segment_count=10)
+
+    def build_mesh():
+        w_rose._stacked_data = None  # clear the cache to time the full computation
+        w_rose._mesh_data = None
+        return w_rose.colored_mesh
+
+    mesh = build_mesh()
+    best = min(timeit.repeat(build_mesh, repeat=repeat, number=number)) / number
+    return best, mesh
+
+
+if __name__ == '__main__':
+    epw = EPW(EPW_PATH)
+    print('{:>10} {:>10} {:>10} {:>12}'.format(
+        'directions', 'vertices', 'faces', 'time (ms)'))
+    for count in DIRECTION_COUNTS:
+        run_time, mesh = colored_mesh_time(epw, count)
+        print('{:>10} {:>10} {:>10} {:>12.2f}'.format(
+            count, len(mesh.vertices), len(mesh.faces), run_time * 1000))
@@ -6,17 +6,55 @@ import ladybug.datacollectionimmutable
 from ladybug.logutil import get_logger
 
 import importlib
-import pkgutil
+import os
+import sys
 
 # set up the logger
 logger = get_logger(__name__)
 
+
+def _extension_names():
+    """Get the names of all ladybug extensions that can be imported from the sys.path.
+
+    Folders on the sys.path are only listed once and only the items that start
+    with ladybug_ are checked, which avoids creating an importer for every
+    module of the environment. Other items on the sys.path (eg. zip archives
+    and eggs) are searched using pkgutil.
+    """
+    ext_names = []
+    for path in sys.path:
+        path = path or os.curdir
+        if os.path.isdir(path):
+            names = []
+            try:
+                f_names = os.listdir(path)
+            except OSError:  # unreadable folder; pkgutil also skips these
+                continue
+            for f_name in f_names:
+                if not f_name.startswith('ladybug_'):
+                    continue
+                f_path = os.path.join(path, f_name)
+                if os.path.isdir(f_path):  # extension package
+                    if os.path.isfile(os.path.join(f_path, '__init__.py')):
+                        names.append(f_name)
+                elif f_name.endswith(('.py', '.pyc', '.pyd', '.so')):  # module
+                    names.append(f_name.split('.')[0])
+        elif os.path.isfile(path):
+            import pkgutil
+            names = [mod[1] for mod in pkgutil.iter_modules([path])]
+        else:
+            continue
+        for name in sorted(names):
+            if name.startswith('ladybug_') and name.count('_') == 1 \
+                    and name not in ext_names:
+                ext_names.append(name)
+    return ext_names
+
+
 #  find and import ladybug extensions
 #  this is a critical step to add additional functionalities to ladybug core library.
 extensions = {}
-for finder, name, ispkg in pkgutil.iter_modules():
-    if not name.startswith('ladybug_') or name.count('_') > 1:
-        continue
+for name in _extension_names():
     try:
         extensions[name] = importlib.import_module(name)
     except Exception:
@@ -11,6 +11,8 @@ try:
 except ImportError:
     from collections import Iterable  # python >= 3.8
 from string import ascii_lowercase
+from bisect import bisect_right
+from itertools import compress, cycle
 import math
 
 try:
@@ -29,7 +31,8 @@ class BaseCollection(object):
             the list of values.
     """
 
-    __slots__ = ('_header', '_values', '_datetimes', '_validated_a_period')
+    __slots__ = ('_header', '_values', '_datetimes', '_datetimes_hash',
+                 '_validated_a_period')
     _collection_type = None
     _mutable = True
     _enumeration = None
@@ -45,6 +48,7 @@ class BaseCollection(object):
 
         self._header = header
         self._datetimes = tuple(datetimes)
+        self._datetimes_hash = None
         self.values = values
         self._validated_a_period = False
 
@@ -379,7 +383,11 @@ class BaseCollection(object):
         """
         if self._collection_type != data_collection._collection_type:
             return False
-        elif len(self.values) != len(data_collection.values):
+        elif self.datetimes is data_collection.datetimes:  # shared datetimes
+            return True
+        elif len(self._values) != len(data_collection._values):
+            return False
+        elif self._get_datetimes_hash() != data_collection._get_datetimes_hash():
             return False
         elif self.datetimes != data_collection.datetimes:
             return False
@@ -706,22 +714,33 @@ class BaseCollection(object):
             val += step
 
     @staticmethod
-    def histogram(values, bins, key=None):
+    def histogram(values, bins, key=None, output='values'):
         """Compute the frequency histogram from a list of values.
 
         The data is binned inclusive of the lower bound but exclusive of the upper bound
         for intervals. See usage for example of losing the last number in the following
         dataset because of exclusive upper bound.
 
+        Each value is placed in its bin in a single pass, using index arithmetic
+        when the bins have a uniform width and a binary search otherwise.
+
         Args:
             values: Set of numerical data as a list.
             bins: A monotonically increasing array of uniform-width bin edges, excluding
                 the rightmost edge.
             key: Optional parameter to define key to bin values by, as a function. If not
                 provided, the histogram will be binned by the value.
+            output: Text to note what is returned for each bin. Choose from the
+                following. (Default: values).
+
+                * values - A list of the values in the bin, sorted by key.
+                * counts - The number of values in the bin.
+                * indices - A list of the indices of the values in the bin, in
+                    the order that the values were input.
 
         Returns:
-            A list of lists representing the ordered values binned by frequency.
+            A list representing the ordered values binned by frequency. Each item
+            is a list of values, a count or a list of indices depending on the output.
 
         Usage:
 
@@ -739,37 +758,47 @@ class BaseCollection(object):
                     ['a', 'b', 'c', 'd', 'e', 'f']),
                     (0, 1, 2), key=lambda k: k[0])
             # >> [[(0, 'a'), (0, 'b'), (0.9, 'c')], [(1, 'd'), (1.5, 'e'), (1.99, 'f')]]
-        """
-        if key is None:
-            def key(v):
-                return v
-
-        vals = sorted(values, key=key)
-        min_bound, max_bound = min(bins), max(bins)
-        bin_bound_num = len(bins)
-
-        # Init histogram bins
-        hist = [[] for i in range(bin_bound_num - 1)]
-        bin_index = 0
 
-        for val in vals:
-            k = key(val)
+            # Counts of values in each bin
+            histogram([0, 0, 0.9, 1, 1.5, 1.99, 2, 3], (0, 1, 2, 3), output='counts')
+            # >> [3, 3, 1]
+        """
+        BaseCollection._check_histogram_output(output)
+        bins = list(bins)
+        edges = sorted(bins)
+        bin_count = len(edges) - 1
+        min_bound, max_bound = edges[0], edges[-1]
+        width = (max_bound - min_bound) / bin_count if bin_count > 0 else 0
+        uniform = width > 0 and edges == bins and all(
+            abs(edges[i] - (min_bound + i * width)) <= width * 1e-9
+            for i in xrange(1, bin_count + 1))
+
+        # place each value (or its index) into its bin
+        bin_vals = [[] for i in xrange(bin_count)]
+        get_vals = output == 'values'
+        for count, val in enumerate(values):
+            k = key(val) if key is not None else val
             # Ignore values out of range
-            if k < min_bound or k > max_bound:
+            if not min_bound <= k < max_bound:
                 continue
+            if uniform:  # get the bin from the width and correct any rounding
+                i = min(int((k - min_bound) / width), bin_count - 1)
+                if k < edges[i]:
+                    i -= 1
+                elif k >= edges[i + 1]:
+                    i += 1
+            else:
+                i = bisect_right(edges, k, 0, bin_count) - 1
+            bin_vals[i].append(val if get_vals else count)
 
-            # This loop will iterate through the bin upper bounds.
-            # If the value is within the bounds, the lower bound
-            # of the bin_index is updated, and the loop is broken
-            for i in range(bin_index, bin_bound_num - 1):
-                if k < bins[i + 1]:
-                    hist[i].append(val)
-                    bin_index = i
-                    break
-        return hist
+        if output == 'counts':
+            return [len(b) for b in bin_vals]
+        elif output == 'indices':
+            return bin_vals
+        return [sorted(b, key=key) for b in bin_vals]
 
     @staticmethod
-    def histogram_circular(values, bins, hist_range=None, key=None):
+    def histogram_circular(values, bins, hist_range=None, key=None, output='values'):
         """Compute the frequency histogram from a list of circular values.
 
         Circular values refers to a set of values where there is no distinction between
@@ -777,6 +806,10 @@ class BaseCollection(object):
         time. The data is binned inclusive of the lower bound but exclusive of the upper
         bound for intervals.
 
+        Each value is placed in its bin in a single pass by measuring its distance
+        around the circle from the first bin edge. This uses index arithmetic when
+        the bins have a uniform width and a binary search otherwise.
+
         Args:
             values: Set of numerical data as a list.
             bins: An array of uniform-width bin edges, excluding the rightmost edge.
@@ -786,9 +819,17 @@ class BaseCollection(object):
                 ``(min(key(values)), max(key(values))+1)``.
             key: Optional parameter to define key to bin values by, as a function. If not
                 provided, the histogram will be binned by the value.
+            output: Text to note what is returned for each bin. Choose from the
+                following. (Default: values).
+
+                * values - A list of the values in the bin, sorted by key.
+                * counts - The number of values in the bin.
+                * indices - A list of the indices of the values in the bin, in
+                    the order that the values were input.
 
         Returns:
-            A list of lists representing the ordered values binned by frequency.
+            A list representing the ordered values binned by frequency. Each item
+            is a list of values, a count or a list of indices depending on the output.
 
         Usage:
 
@@ -799,47 +840,81 @@ class BaseCollection(object):
             histogram_circular([358, 359, 0, 1, 2, 3], (358, 0, 3))
             # >> [[358, 359], [0, 1, 2]]
         """
-        if key is None:
-            def key(v):
-                return v
-
-        vals = sorted(values, key=key)
-
+        BaseCollection._check_histogram_output(output)
+        vals = list(values)
+        keys = [key(val) for val in vals] if key is not None else vals
         if hist_range is None:
-            hist_range = (key(vals[0]), key(vals[-1]) + 1)
-
-        bin_bound_num = len(bins) - 1
-
-        # Init histogram bins
-        hist = [[] for i in range(bin_bound_num)]
-        for val in vals:
-            k = key(val)
-
+            hist_range = (min(keys), max(keys) + 1)
+        range_min, range_max = hist_range
+        span = range_max - range_min
+        bins = list(bins)
+        bin_count = len(bins) - 1
+
+        # measure the distance of each bin edge around the circle from the first edge
+        edges, is_circular = [0], True
+        for i in xrange(bin_count):
+            step = bins[i + 1] - bins[i] if bins[i] < bins[i + 1] \
+                else bins[i + 1] - bins[i] + span
+            if step <= 0:
+                is_circular = False  # degenerate bin that cannot be measured
+            edges.append(edges[-1] + step)
+        is_circular = is_circular and 0 < edges[-1] <= span and \
+            all(range_min <= b <= range_max for b in bins)
+        width = edges[-1] / bin_count if bin_count > 0 else 0
+        uniform = is_circular and all(
+            abs(edges[i] - i * width) <= width * 1e-9 for i in xrange(1, bin_count + 1))
+
+        # place the index of each value into its bin
+        bin_vals = [[] for i in xrange(bin_count)]
+        for count, k in enumerate(keys):
             # Ignore values out of range
-            if k < hist_range[0] or k >= hist_range[1]:
+            if k < range_min or k >= range_max:
                 continue
-
-            # This loop will iterate through the bin upper bounds.
-            # If the value is within the bounds, the loop is broken.
-            # Since values at the end of the list can still be binned
-            # into the earlier histogram bars for circular
-            # data, we don't update the bin_index.
-            for i in range(bin_bound_num):
-                if bins[i] < bins[i + 1]:
-                    if k >= bins[i] and k < bins[i + 1]:
-                        hist[i].append(val)
-                        break
+            if is_circular:
+                dist = k - bins[0] if k >= bins[0] else k - bins[0] + span
+                if uniform:
+                    i = min(int(dist / width), bin_count - 1)
                 else:
-                    # If the interval starts data from the end of the list,
-                    # split the conditional checks into two to check two
-                    # intervals.
-                    interval1 = (k <= hist_range[1] and k >= bins[i])
-                    interval2 = (k < bins[i + 1] and k >= hist_range[0])
-                    if interval1 or interval2:
-                        hist[i].append(val)
+                    i = bisect_right(edges, dist, 0, bin_count) - 1
+                lower, upper = bins[i], bins[i + 1]
+                if (lower <= k < upper) if lower < upper else \
+                        (lower <= k <= range_max or range_min <= k < upper):
+                    bin_vals[i].append(count)
+                    continue
+                # check the neighboring bins against the edges to correct rounding
+                for j in (i + 1, i - 1):
+                    if 0 <= j < bin_count and BaseCollection._in_circular_bin(
+                            k, bins[j], bins[j + 1], hist_range):
+                        bin_vals[j].append(count)
+                        break
+            else:  # check each bin in order
+                for j in xrange(bin_count):
+                    if BaseCollection._in_circular_bin(
+                            k, bins[j], bins[j + 1], hist_range):
+                        bin_vals[j].append(count)
                         break
 
-        return hist
+        if output == 'counts':
+            return [len(b) for b in bin_vals]
+        elif output == 'indices':
+            return bin_vals
+        return [[vals[i] for i in sorted(b, key=lambda i: keys[i])] for b in bin_vals]
+
+    @staticmethod
+    def _in_circular_bin(k, lower, upper, hist_range):
+        """Check whether a key value falls in a bin of a circular histogram."""
+        if lower < upper:
+            return lower <= k < upper
+        # If the interval starts data from the end of the list,
+        # split the conditional checks into two to check two intervals.
+        return lower <= k <= hist_range[1] or hist_range[0] <= k < upper
+
+    @staticmethod
+    def _check_histogram_output(output):
+        """Check that a histogram output is valid."""
+        if output not in ('values', 'counts', 'indices'):
+            raise ValueError('Histogram output "{}" is not acceptable. Choose from: '
+                             'values, counts, indices'.format(output))
 
     def _filter_by_statement(self, statement):
         """Filter the data collection based on a conditional statement."""
@@ -858,10 +933,25 @@ class BaseCollection(object):
         except TypeError:
             raise TypeError("pattern is not a list of Booleans. Got {}".format(
                 type(pattern)))
-        _filt_values = [d for i, d in enumerate(self._values) if pattern[i % _len]]
-        _filt_datetimes = [d for i, d in enumerate(self.datetimes) if pattern[i % _len]]
+        if _len == 0:
+            raise ValueError('pattern must contain at least one value.')
+        _filt_values = list(compress(self._values, cycle(pattern)))
+        _filt_datetimes = list(compress(self.datetimes, cycle(pattern)))
         return _filt_values, _filt_datetimes
 
+    def _get_datetimes_hash(self):
+        """Get a hash of the datetimes, which is cached after the first request.
+
+        Collections with different hashes are never aligned with one another. None
+        will be returned if the datetimes cannot be hashed.
+        """
+        if self._datetimes_hash is None:
+            try:
+                self._datetimes_hash = hash(self.datetimes)
+            except TypeError:  # datetimes contain unhashable lists
+                return None
+        return self._datetimes_hash
+
     def _check_values(self, values):
         """Check values whenever they come through the values setter."""
         assert isinstance(values, Iterable) and not \
@@ -4,7 +4,8 @@ from __future__ import division
 
 from .dt import DateTime
 
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import timedelta
 import sys
 if (sys.version_info >= (3, 0)):
     xrange = range
@@ -58,6 +59,11 @@ class AnalysisPeriod(object):
     MONTHNAMES = {1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
                   7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'}
 
+    # process-wide table of the time axes shared by all equal analysis periods
+    # keys are analysis period keys and values are lists of [moys, datetimes]
+    _time_axes = OrderedDict()
+    MAXTIMEAXES = 256
+
     __slots__ = (
         '_is_leap_year', '_st_time', '_num_of_days_each_month', '_is_overnight',
         '_is_reversed', '_timestep', '_minute_intervals', '_end_time',
@@ -112,9 +118,10 @@ class AnalysisPeriod(object):
         self._timestep = timestep
         self._minute_intervals = timedelta(1 / (24.0 * self.timestep))
 
-        # _timestamps_data is a dictionary for datetimes.
-        # key values will be minute of year
-        self._timestamps_data = None  # set to None for now and calculate upon request
+        # _timestamps_data is a tuple of minutes of the year and _datetimes is a tuple
+        # of DateTimes built from them. Both are retrieved upon request from the
+        # time axis that is shared by all equal analysis periods.
+        self._timestamps_data = None
         self._datetimes = None
 
     @classmethod
@@ -242,31 +249,30 @@ class AnalysisPeriod(object):
     @property
     def datetimes(self):
         """A sorted list of hourly datetimes in this analysis period."""
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(self._datetimes)
+        if self._datetimes is None:
+            time_axis = self._time_axis()
+            if time_axis[1] is None:
+                time_axis[1] = self._calculate_datetimes(time_axis[0])
+            self._datetimes = time_axis[1]
+        return self._datetimes
 
     @property
     def moys(self):
         """A sorted list of hourly minutes of year in this analysis period as integers.
         """
         if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(self._timestamps_data)
+            self._timestamps_data = self._time_axis()[0]
+        return self._timestamps_data
 
     @property
     def hoys(self):
         """A sorted list of hours of year in this analysis period."""
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(moy / 60.0 for moy in self._timestamps_data)
+        return tuple(moy / 60.0 for moy in self.moys)
 
     @property
     def hoys_int(self):
         """A sorted list of hours of year in this analysis period as integers."""
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(int(moy / 60.0) for moy in self._timestamps_data)
+        return tuple(moy // 60 for moy in self.moys)
 
     @property
     def doys_int(self):
@@ -355,9 +361,7 @@ class AnalysisPeriod(object):
         Returns:
             A boolean. True if time is included in analysis period
         """
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return time.moy in self._timestamps_data
+        return time.moy in self.moys
 
     def duplicate(self):
         """Return a copy of the analysis period."""
@@ -379,50 +383,91 @@ class AnalysisPeriod(object):
             'type': 'AnalysisPeriod'
         }
 
-    def _calc_timestamps(self, st_time, end_time):
-        """Calculate timesteps between start time and end time.
+    def _calc_timestamps(self, moys, st_doy, st_step, end_doy, end_step, day_steps):
+        """Add minutes of the year between start day and end day to a list of moys.
 
-        Use this method only when start time month is before end time month.
+        Use this method only when start day is on or before end day.
+
+        Args:
+            moys: A list to which the minutes of the year will be appended.
+            st_doy: Integer for the day of the year on which the timestamps start.
+            st_step: Integer for the timestep of the start day before which
+                there are no timestamps.
+            end_doy: Integer for the day of the year on which the timestamps end.
+            end_step: Integer for the timestep of the end day after which
+                there are no timestamps. Ignored if it lies in the last hour of the day.
+            day_steps: A list of integers for the timesteps of the day that are
+                possible hours of this analysis period.
         """
-        # calculate based on minutes
-        # I have to convert the object to DateTime because of how Dynamo
-        # works: https://github.com/DynamoDS/Dynamo/issues/6683
-        # Do not modify this line to datetime
-        curr = datetime(st_time.year, st_time.month, st_time.day, st_time.hour,
-                        st_time.minute, self.is_leap_year)
-        end_time = datetime(end_time.year, end_time.month, end_time.day,
-                            end_time.hour, end_time.minute, self.is_leap_year)
-
-        while curr <= end_time:
-            if self.is_possible_hour(curr.hour + (curr.minute / 60.0)):
-                time = DateTime(curr.month, curr.day, curr.hour, curr.minute,
-                                self.is_leap_year)
-                self._timestamps_data.append(time.moy)
-                self._datetimes.append(time)
-            curr += self.minute_intervals
-
-        if self.timestep != 1 and curr.hour == 23 and self.is_possible_hour(0):
-            # This is for cases that timestep is more than one
-            # and last hour of the day is part of the calculation
-            curr = end_time
-            for _ in list(xrange(self.timestep))[1:]:
-                curr += self.minute_intervals
-                time = DateTime(curr.month, curr.day, curr.hour, curr.minute,
-                                self.is_leap_year)
-                self._timestamps_data.append(time.moy)
-                self._datetimes.append(time)
+        mins_per_step = int(60 / self.timestep)
+        if end_step >= 23 * self.timestep:
+            end_step = 24 * self.timestep
+        offsets = [step * mins_per_step for step in day_steps]
+        st_offsets = [step * mins_per_step for step in day_steps if step >= st_step]
+        end_offsets = [step * mins_per_step for step in day_steps if step <= end_step]
+        if st_doy == end_doy:
+            end_offsets = [off for off in st_offsets if off <= end_step * mins_per_step]
+            st_offsets = []
+
+        base = (st_doy - 1) * 1440
+        moys.extend([base + off for off in st_offsets])
+        for _ in xrange(st_doy, end_doy - 1):
+            base += 1440
+            moys.extend([base + off for off in offsets])
+        base = (end_doy - 1) * 1440
+        moys.extend([base + off for off in end_offsets])
+
+    def _time_axis(self):
+        """Get the time axis that is shared by all analysis periods equal to this one.
+
+        Returns:
+            A list with two items. The first is a tuple of the minutes of the year
+            in this analysis period. The second is a tuple of DateTimes for these
+            minutes or None if the DateTimes have not yet been requested.
+        """
+        key = self.__key()
+        try:
+            return self._time_axes[key]
+        except KeyError:
+            time_axis = [self._calculate_timestamps(), None]
+            if len(self._time_axes) >= self.MAXTIMEAXES:
+                self._time_axes.popitem(last=False)
+            self._time_axes[key] = time_axis
+            return time_axis
 
     def _calculate_timestamps(self):
-        """Return a list of Ladybug DateTimes in this analysis period."""
-        self._timestamps_data = []
-        self._datetimes = []
+        """Calculate a tuple of the minutes of the year in this analysis period.
+
+        The minutes are generated from the start and end of the analysis period
+        using the timesteps of a single day that are possible hours of the period.
+        """
+        moys = []
+        timestep = self.timestep
+        day_steps = [step for step in xrange(24 * timestep)
+                     if self.is_possible_hour(step / timestep)]
+        st_step, end_step = self.st_hour * timestep, self.end_hour * timestep
         if not self._is_reversed:
-            self._calc_timestamps(self.st_time, self.end_time)
+            self._calc_timestamps(moys, self.st_time.doy, st_step,
+                                  self.end_time.doy, end_step, day_steps)
         else:
-            self._calc_timestamps(
-                self.st_time, DateTime.from_last_hour(self.is_leap_year))
-            self._calc_timestamps(
-                DateTime.from_first_hour(self.is_leap_year), self.end_time)
+            last_doy = 366 if self.is_leap_year else 365
+            self._calc_timestamps(moys, self.st_time.doy, st_step,
+                                  last_doy, 23 * timestep, day_steps)
+            self._calc_timestamps(moys, 1, 0, self.end_time.doy, end_step, day_steps)
+        return tuple(moys)
+
+    def _calculate_datetimes(self, moys):
+        """Calculate a tuple of Ladybug DateTimes from minutes of the year."""
+        leap_year = self.is_leap_year
+        day_dates = []
+        for month, days in enumerate(self._num_of_days_each_month):
+            day_dates.extend((month + 1, day) for day in xrange(1, days + 1))
+        datetimes = []
+        for moy in moys:
+            doy, mod = divmod(moy, 1440)
+            month, day = day_dates[doy]
+            datetimes.append(DateTime(month, day, mod // 60, mod % 60, leap_year))
+        return tuple(datetimes)
 
     def _calc_daystamps(self, st_time, end_time):
         """Calculate days of the year between start time and end time.
@@ -440,7 +485,7 @@ class AnalysisPeriod(object):
 
         The length will be number of hours * timestep.
         """
-        if self.st_hour == 1 and self.end_hour == 23:  # use fast method
+        if self.st_hour == 0 and self.end_hour == 23:  # use fast method
             if not self._is_reversed:
                 return (self.end_time.int_hoy + 1 - self.st_time.int_hoy) * self.timestep
             else:
@@ -450,9 +495,7 @@ class AnalysisPeriod(object):
                     DateTime.from_first_hour(self.is_leap_year).int_hoy
                 return ((first + second + 2) * self.timestep)
         else:
-            if self._timestamps_data is None:
-                self._calculate_timestamps()
-            return len(self._timestamps_data)
+            return len(self.moys)
 
     def __str__(self):
         """Return analysis period as a string."""
@@ -279,6 +279,37 @@ class Compass(object):
         # move the point back to its original location and scale
         return Point2D(proj_pt[0] * radius + origin.x, proj_pt[1] * radius + origin.y)
 
+    @staticmethod
+    def points3d_to_orthographic(points):
+        """Get a list of Point2D for an array of Point3D using orthographic projection.
+
+        Args:
+            points: An array of ladybug_geometry Point3D to be projected into
+                2D space via orthographic projection.
+        """
+        return [Point2D(pt.x, pt.y) for pt in points]
+
+    @staticmethod
+    def points3d_to_stereographic(points, radius=100, origin=Point3D()):
+        """Get a list of Point2D for an array of Point3D using stereographic projection.
+
+        Args:
+            points: An array of ladybug_geometry Point3D to be projected into
+                2D space via stereographic projection.
+            radius: A positive number for the radius of the sphere on which the
+                points exist. (Default: 100).
+            origin: An optional ladybug_geometry Point3D representing the origin
+                of the coordinate system in which the projection is happening.
+                (eg. the center of the compass).
+        """
+        o_x, o_y, o_z = origin.x, origin.y, origin.z
+        pts_2d = []
+        for pt in points:
+            rad_z = radius + (pt.z - o_z)
+            pts_2d.append(Point2D((pt.x - o_x) / rad_z * radius + o_x,
+                                  (pt.y - o_y) / rad_z * radius + o_y))
+        return pts_2d
+
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
         return (self.radius, hash(self.center), self.north_angle, self.spacing_factor)
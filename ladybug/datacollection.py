@@ -88,6 +88,7 @@ class HourlyDiscontinuousCollection(BaseCollection):
 
         self._header = header
         self._datetimes = tuple(datetimes)
+        self._datetimes_hash = None
         self.values = values
         self._validated_a_period = False
 
@@ -274,44 +275,35 @@ class HourlyDiscontinuousCollection(BaseCollection):
         """
         return self._time_interval_operation('monthlyperhour', 'percentile', percentile)
 
-    def interpolate_holes(self):
-        """Linearly interpolate over holes in this collection to make it continuous.
+    def interpolate_holes(self, method='linear'):
+        """Interpolate over holes in this collection to make it continuous.
+
+        Args:
+            method: Text for the interpolation scheme used to fill the holes.
+                Choose from the following. (Default: linear).
+
+                * linear - straight lines between the values on each side of a hole.
+                * cubic - a cubic Hermite spline with finite difference tangents.
+                * monotone - a cubic Hermite spline that does not overshoot
+                    the values on each side of a hole (Fritsch-Carlson).
 
         Returns:
             continuous_collection -- A HourlyContinuousCollection with the same data
-            as this collection but with missing data filled by means of a
-            linear interpolation.
+            as this collection but with missing data filled by means of
+            interpolation.
         """
         # validate analysis_period and use the resulting period to generate datetimes
         assert self.validated_a_period, 'validated_a_period property must be' \
             ' True to use interpolate_holes(). Run validate_analysis_period().'
-        mins_per_step = int(60 / self.header.analysis_period.timestep)
-        new_datetimes = self.header.analysis_period.datetimes
-        new_values = []
+        self._check_interpolation_method(method)
+        new_moys = self.header.analysis_period.moys
+        moy_indices = {moy: i for i, moy in enumerate(new_moys)}
+        knots = [moy_indices[dt.moy] for dt in self.datetimes]
 
-        # if the first steps are a hole, duplicate the first value.
-        i = 0
-        if new_datetimes[0] != self.datetimes[0]:
-            n_steps = int((self.datetimes[0].moy - new_datetimes[0].moy) / mins_per_step)
-            new_values.extend([self._values[0]] * n_steps)
-            i = n_steps - 1
-
-        # go through the values interpolating any holes.
-        for j in xrange(len(self._values)):
-            if new_datetimes[i] == self.datetimes[j]:  # there is no hole.
-                new_values.append(self._values[j])
-                i += 1
-            else:  # there is a hole between this step and the previous step.
-                n_steps = int(
-                    (self.datetimes[j].moy - new_datetimes[i].moy) / mins_per_step)
-                intp_vals = self._xxrange(self._values[j - 1], self._values[j], n_steps)
-                new_values.extend(list(intp_vals)[1:] + [self._values[j]])
-                i += n_steps
-
-        # if the last steps are a hole duplicate the last value.
-        if len(new_values) != len(new_datetimes):
-            n_steps = len(new_datetimes) - len(new_values)
-            new_values.extend([self._values[-1]] * n_steps)
+        # interpolate between the existing values and extend the ends of the data
+        new_values = [self._values[0]] * knots[0]
+        new_values.extend(self._interpolate_knots(knots, self._values, method))
+        new_values.extend([self._values[-1]] * (len(new_moys) - knots[-1] - 1))
 
         # build the new continuous data collection.
         return HourlyContinuousCollection(self.header.duplicate(), new_values)
@@ -339,7 +331,53 @@ class HourlyDiscontinuousCollection(BaseCollection):
         new_ap, new_values, new_datetimes = self._timestep_cull(timestep)
         self.header._analysis_period = new_ap
         self._values = new_values
-        self._datetimes = new_datetimes
+        self._datetimes = tuple(new_datetimes)
+        self._datetimes_hash = None
+
+    def aggregate_to_timestep(self, timestep=1, operation=None):
+        """Get a collection aggregated to a coarser timestep.
+
+        Each value of the new collection is computed from all of the values of this
+        collection that fall within its timestep. For data that is averaged or
+        cumulative over each timestep (not point_in_time), these are the values
+        from the start of the new timestep up to the start of the next one. For
+        point_in_time data, the values are those centered on the new timestep.
+
+        Args:
+            timestep: Target timestep as an integer. The current timestep must be
+                divisible by the target timestep. (Default: 1).
+            operation: Text for the operation used to aggregate the values within
+                each new timestep. Choose from: average, total, max, min. The
+                default will use total if the DataType is cumulative over
+                time and average otherwise.
+
+        Return:
+            A new Hourly Discontinuous Collection with data aggregated to the
+            input timestep.
+        """
+        funct, operation, _, shift = self._check_aggregation(timestep, operation)
+
+        # group the values by the moy at the start of each new timestep
+        a_per = self.header.analysis_period
+        mins_per_step = int(60 / timestep)
+        shift_mins = shift * int(60 / a_per.timestep)
+        mins_per_year = 527040 if a_per.is_leap_year else 525600
+        data_dict = OrderedDict()
+        for val, dt in zip(self._values, self.datetimes):
+            moy = (dt.moy + shift_mins) % mins_per_year
+            step_moy = moy - moy % mins_per_step
+            try:
+                data_dict[step_moy].append(val)
+            except KeyError:
+                data_dict[step_moy] = [val]
+        new_values = [funct(vals) for vals in data_dict.values()]
+        new_datetimes = [DateTime.from_moy(moy, a_per.is_leap_year) for moy in data_dict]
+
+        # build the new data collection
+        new_header = self._aggregated_header(timestep, operation)
+        new_coll = HourlyDiscontinuousCollection(new_header, new_values, new_datetimes)
+        new_coll._validated_a_period = self._validated_a_period and shift == 0
+        return new_coll
 
     def validate_analysis_period(self):
         """Get a collection where the header analysis_period aligns with datetimes.
@@ -443,10 +481,90 @@ class HourlyDiscontinuousCollection(BaseCollection):
             'type': self.__class__.__name__
         }
 
-    def _xxrange(self, start, end, step_count):
-        """Generate n values between start and end."""
-        _step = (end - start) / float(step_count)
-        return (start + (i * _step) for i in xrange(int(step_count)))
+    @staticmethod
+    def _check_interpolation_method(method):
+        """Check that an interpolation method is one of the acceptable options."""
+        methods = ('linear', 'cubic', 'monotone')
+        assert method in methods, 'Interpolation method "{}" is not valid. ' \
+            'Choose from: {}'.format(method, methods)
+
+    @staticmethod
+    def _hermite_tangents(knots, values, method):
+        """Get the tangents at each knot of a cubic Hermite spline.
+
+        Args:
+            knots: A list of increasing integers for the indices of the values.
+            values: A list of numbers that align with the knots.
+            method: Either 'cubic' for finite difference tangents or 'monotone' for
+                Fritsch-Carlson tangents that preserve the monotonicity of the data.
+        """
+        count = len(knots)
+        if count < 2:
+            return [0] * count
+        h = [knots[k + 1] - knots[k] for k in xrange(count - 1)]
+        d = [(values[k + 1] - values[k]) / h[k] for k in xrange(count - 1)]
+        tangents = [d[0]]
+        if method == 'cubic':
+            for k in xrange(1, count - 1):
+                tangents.append((values[k + 1] - values[k - 1]) / (h[k - 1] + h[k]))
+        else:
+            for k in xrange(1, count - 1):
+                if d[k - 1] * d[k] <= 0:
+                    tangents.append(0)
+                else:
+                    w1, w2 = 2 * h[k] + h[k - 1], h[k] + 2 * h[k - 1]
+                    tangents.append((w1 + w2) / (w1 / d[k - 1] + w2 / d[k]))
+        tangents.append(d[-1])
+        return tangents
+
+    @staticmethod
+    def _interpolate_knots(knots, values, method='linear', tangents=None):
+        """Get a list of values at every integer index from the first to the last knot.
+
+        The interpolation weights depend only on the position within a gap between
+        knots. So they are computed once per gap length and reused for every gap
+        of the same length, which is all of them when the knots are evenly spaced.
+
+        Args:
+            knots: A list of increasing integers for the indices of the values.
+            values: A list of numbers that align with the knots.
+            method: Text for the interpolation method. Either 'linear', 'cubic'
+                or 'monotone'. (Default: linear).
+            tangents: An optional list of tangents that align with the knots, which
+                will be used for the cubic methods instead of those computed
+                from the knots and values.
+
+        Returns:
+            A list of values with a length of knots[-1] - knots[0] + 1.
+        """
+        new_values = []
+        if method == 'linear':
+            for k in xrange(len(knots) - 1):
+                start, gap = values[k], knots[k + 1] - knots[k]
+                _step = (values[k + 1] - start) / gap
+                new_values.extend([start + i * _step for i in xrange(gap)])
+        else:
+            if tangents is None:
+                tangents = HourlyDiscontinuousCollection._hermite_tangents(
+                    knots, values, method)
+            weights = {}
+            for k in xrange(len(knots) - 1):
+                gap = knots[k + 1] - knots[k]
+                try:
+                    gap_weights = weights[gap]
+                except KeyError:  # compute the Hermite basis functions for the gap
+                    gap_weights = []
+                    for i in xrange(gap):
+                        t = i / gap
+                        t2, t3 = t * t, t * t * t
+                        gap_weights.append((2 * t3 - 3 * t2 + 1, (t3 - 2 * t2 + t) * gap,
+                                            3 * t2 - 2 * t3, (t3 - t2) * gap))
+                    weights[gap] = gap_weights
+                y0, y1, m0, m1 = values[k], values[k + 1], tangents[k], tangents[k + 1]
+                new_values.extend([h00 * y0 + h10 * m0 + h01 * y1 + h11 * m1
+                                   for h00, h10, h01, h11 in gap_weights])
+        new_values.append(values[-1])
+        return new_values
 
     def _filter_by_moys_slow(self, moys):
         """Filter the Data Collection with a slow method that always works."""
@@ -473,6 +591,52 @@ class HourlyDiscontinuousCollection(BaseCollection):
                                 timestep, a_per.is_leap_year)
         return new_ap, new_values, new_datetimes
 
+    def _check_aggregation(self, timestep, operation):
+        """Check the inputs of aggregate_to_timestep and get the aggregation function.
+
+        Returns:
+            A tuple with four elements.
+
+            -   funct: The function to be applied to the values of each timestep.
+
+            -   operation: The name of the operation.
+
+            -   n_steps: The number of current timesteps in each new timestep.
+
+            -   shift: The number of current timesteps that precede the start of
+                each new timestep in its aggregation window.
+        """
+        a_per = self.header.analysis_period
+        valid_s = a_per.VALIDTIMESTEPS.keys()
+        assert timestep in valid_s, \
+            'timestep {} is not valid. Choose from: {}'.format(timestep, valid_s)
+        assert a_per.timestep % timestep == 0, \
+            'Current timestep({}) must be divisible by target timestep({})' \
+            .format(a_per.timestep, timestep)
+        if operation is None:
+            operation = 'total' if self.header.data_type.cumulative else 'average'
+        functs = {'average': self._average, 'total': self._total,
+                  'max': max, 'min': min}
+        try:
+            funct = functs[operation]
+        except KeyError:
+            raise ValueError('Invalid input value for operation: {}. Choose from: '
+                             '{}'.format(operation, tuple(functs.keys())))
+        n_steps = a_per.timestep // timestep
+        shift = int(n_steps / 2) if self.header.data_type.point_in_time else 0
+        return funct, operation, n_steps, shift
+
+    def _aggregated_header(self, timestep, operation):
+        """Get a header for a collection aggregated to a coarser timestep."""
+        a_per = self.header.analysis_period
+        new_header = self.header.duplicate()
+        new_header._analysis_period = AnalysisPeriod(
+            a_per.st_month, a_per.st_day, a_per.st_hour,
+            a_per.end_month, a_per.end_day, a_per.end_hour,
+            timestep, a_per.is_leap_year)
+        new_header.metadata['operation'] = operation
+        return new_header
+
     def _check_analysis_period(self, analysis_period):
         assert self.header.analysis_period.timestep == analysis_period.timestep,\
             'analysis_period timestep must match that on the'\
@@ -582,6 +746,7 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         self._header = header
         self.values = values
         self._datetimes = None
+        self._datetimes_hash = None
         self._validated_a_period = True
 
     @classmethod
@@ -609,15 +774,15 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
             self._datetimes = self.header.analysis_period.datetimes
         return self._datetimes
 
-    def interpolate_holes(self):
+    def interpolate_holes(self, method='linear'):
         """All continuous collections do not have holes in the data set.
 
         Therefore, there is no need to run this method on a continuous collection.
         """
         return self.duplicate()
 
-    def interpolate_to_timestep(self, timestep, cumulative=None):
-        """Interpolate data for a finer timestep using a linear interpolation.
+    def interpolate_to_timestep(self, timestep, cumulative=None, method='linear'):
+        """Interpolate data for a finer timestep.
 
         Args:
             timestep: Target timestep as an integer. Target timestep must be
@@ -628,6 +793,13 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
                 that timestep (instead of over the hour). The default will
                 check the DataType to see if this type of data is typically
                 cumulative over time.
+            method: Text for the interpolation scheme. Choose from the
+                following. (Default: linear).
+
+                * linear - straight lines between consecutive values.
+                * cubic - a cubic Hermite spline with finite difference tangents.
+                * monotone - a cubic Hermite spline that does not overshoot
+                    consecutive values (Fritsch-Carlson).
 
         Return:
             A continuous hourly data collection with data interpolated to
@@ -639,23 +811,28 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         if cumulative is not None:
             assert isinstance(cumulative, bool), \
                 'Expected Boolean. Got {}'.format(type(cumulative))
+        self._check_interpolation_method(method)
+        n_steps = timestep // self.header.analysis_period.timestep
 
-        # generate new data
-        _new_values = []
+        # generate new data, wrapping the last value back to the first one
         _data_length = len(self._values)
-        for d in xrange(_data_length):
-            for _v in self._xxrange(self[d], self[(d + 1) % _data_length], timestep):
-                _new_values.append(_v)
-
-        # divide cumulative values by the timestep
+        knots = list(xrange(0, (_data_length + 1) * n_steps, n_steps))
+        values = list(self._values) + [self._values[0]]
+        tangents = None
+        if method != 'linear' and _data_length > 1:  # use periodic end tangents
+            pad_values = [self._values[-1]] + values + [self._values[1 % _data_length]]
+            pad_knots = [-n_steps] + knots + [knots[-1] + n_steps]
+            tangents = self._hermite_tangents(pad_knots, pad_values, method)[1:-1]
+        _new_values = self._interpolate_knots(knots, values, method, tangents)[:-1]
+
+        # divide cumulative values by the number of new steps in each old step
         native_cumulative = self.header.data_type.cumulative
         if cumulative or (cumulative is None and native_cumulative):
-            for i, d in enumerate(_new_values):
-                _new_values[i] = d / timestep
+            _new_values = [d / n_steps for d in _new_values]
 
-        # shift data by a half-hour if data is averaged or cumulative over an hour
+        # shift data by a half-step if data is averaged or cumulative over a step
         if not self.header.data_type.point_in_time:
-            shift_dist = int(timestep / 2)
+            shift_dist = int(n_steps / 2)
             _new_values = _new_values[-shift_dist:] + _new_values[:-shift_dist]
 
         # build a new header
@@ -667,6 +844,44 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         _new_header._analysis_period = _new_a_per
         return HourlyContinuousCollection(_new_header, _new_values)
 
+    def aggregate_to_timestep(self, timestep=1, operation=None):
+        """Get a collection aggregated to a coarser timestep.
+
+        Each value of the new collection is computed from all of the values of this
+        collection that fall within its timestep. For data that is averaged or
+        cumulative over each timestep (not point_in_time), these are the values
+        from the start of the new timestep up to the start of the next one. For
+        point_in_time data, the values are those centered on the new timestep
+        and the values at the end of the collection wrap around to the start.
+
+        Args:
+            timestep: Target timestep as an integer. The current timestep must be
+                divisible by the target timestep. (Default: 1).
+            operation: Text for the operation used to aggregate the values within
+                each new timestep. Choose from: average, total, max, min. The
+                default will use total if the DataType is cumulative over
+                time and average otherwise.
+
+        Return:
+            A continuous hourly data collection with data aggregated to the
+            input timestep.
+        """
+        funct, operation, n_steps, shift = self._check_aggregation(timestep, operation)
+
+        # group the values of each new timestep with one strided slice per sub-step
+        values = list(self._values)
+        if shift != 0:
+            values = values[-shift:] + values[:-shift]
+        if n_steps == 1:
+            new_values = values
+        else:
+            step_vals = zip(*[values[i::n_steps] for i in xrange(n_steps)])
+            new_values = [funct(vals) for vals in step_vals]
+
+        # build the new data collection
+        new_header = self._aggregated_header(timestep, operation)
+        return HourlyContinuousCollection(new_header, new_values)
+
     def filter_by_conditional_statement(self, statement):
         """Filter the Data Collection based on a conditional statement.
 
@@ -897,9 +1112,11 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         """
         if self._collection_type != data_collection._collection_type:
             return False
-        elif len(self.values) != len(data_collection.values):
+        elif len(self._values) != len(data_collection._values):
             return False
-        elif self.header.analysis_period != data_collection.header.analysis_period:
+        a_per, other_a_per = self.header.analysis_period, \
+            data_collection.header.analysis_period
+        if a_per is not other_a_per and a_per != other_a_per:
             return False
         return True
 
@@ -1038,6 +1255,7 @@ class DailyCollection(BaseCollection):
 
         self._header = header
         self._datetimes = tuple(datetimes)
+        self._datetimes_hash = None
         self.values = values
         self._validated_a_period = False
 
@@ -1261,6 +1479,7 @@ class MonthlyCollection(BaseCollection):
 
         self._header = header
         self._datetimes = tuple(datetimes)
+        self._datetimes_hash = None
         self.values = values
         self._validated_a_period = False
 
@@ -1403,6 +1622,7 @@ class MonthlyPerHourCollection(BaseCollection):
 
         self._header = header
         self._datetimes = tuple(datetimes)
+        self._datetimes_hash = None
         self.values = values
         self._validated_a_period = False
 
@@ -15,12 +15,41 @@ Properties:
 
     TYPESDICT: A dictionary containing pointers to the classes of each data type.
     The keys of this dictionary are the data type names.
+
+Note that, in Python 3.7 and above, the modules of the data types are only
+imported once one of the properties above (or one of the modules) is first
+accessed. This keeps the import of ladybug fast when data types are not needed.
 """
+import importlib
+import sys
 
 from .base import _DataTypeEnumeration
 
-_data_types = _DataTypeEnumeration(import_modules=True)
-TYPES = _data_types.types
-BASETYPES = _data_types.base_types
-UNITS = _data_types.units
-TYPESDICT = _data_types.types_dict
+_ENUMERATIONS = ('TYPES', 'BASETYPES', 'UNITS', 'TYPESDICT')
+
+
+def _enumerate_data_types():
+    """Import all data type modules and set the global properties of this module."""
+    global TYPES, BASETYPES, UNITS, TYPESDICT
+    _data_types = _DataTypeEnumeration(import_modules=True)
+    TYPES = _data_types.types
+    BASETYPES = _data_types.base_types
+    UNITS = _data_types.units
+    TYPESDICT = _data_types.types_dict
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        """Import the data type modules upon first access of the global properties."""
+        if name in _ENUMERATIONS:
+            _enumerate_data_types()
+            return globals()[name]
+        if not name.startswith('_'):  # get a data type module that is not imported
+            try:
+                return importlib.import_module('.{}'.format(name), __name__)
+            except ImportError:
+                pass
+        raise AttributeError(
+            'module {} has no attribute {}'.format(__name__, name))
+else:  # older versions of Python cannot lazily get module attributes
+    _enumerate_data_types()
@@ -63,7 +63,7 @@ class DataTypeBase(object):
         assert 'name' in data, 'Required keyword "name" is missing!'
         assert 'data_type' in data, 'Required keyword "data_type" is missing!'
         if cls._type_enumeration is None:
-            cls._type_enumeration = _DataTypeEnumeration(import_modules=False)
+            cls._type_enumeration = _DataTypeEnumeration(import_modules=True)
 
         if data['data_type'] == 'GenericType':
             assert 'base_unit' in data, \
@@ -4,9 +4,9 @@ from __future__ import division
 from .location import Location
 from .designday import DesignDay
 from .futil import write_to_file
+from .idfutil import parse_idf_objects
 
 import os
-import re
 import platform
 import codecs
 
@@ -24,6 +24,7 @@ class DDY(object):
         * design_days
     """
     __slots__ = ('_location', '_design_days', '_file_path')
+    _idf_types = ('Site:Location', 'SizingPeriod:DesignDay')
 
     def __init__(self, location, design_days):
         assert isinstance(location, Location), 'Expected' \
@@ -77,23 +78,28 @@ class DDY(object):
             ddywin = codecs.open(file_path, 'r', encoding='utf-8', errors='ignore')
 
         # extract all location and design day definitions from the file
-        loc_p = re.compile(r"(Site:Location,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
-        dday_p = re.compile(r"(SizingPeriod:DesignDay,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
         try:
             ddytxt = ddywin.read()
-            loc_matches = loc_p.findall(ddytxt)
-            dday_matches = dday_p.findall(ddytxt)
         except Exception as e:  # the file likely doesn't exist
             import traceback
             raise Exception('{}\n{}'.format(e, traceback.format_exc()))
         else:
+            loc_fields, dday_fields = None, []
+            for obj_type, ep_fields in parse_idf_objects(ddytxt, cls._idf_types):
+                if obj_type.lower() == 'site:location':
+                    if loc_fields is None:
+                        loc_fields = ep_fields
+                else:
+                    dday_fields.append(ep_fields)
+
             # check to be sure a location and a design day was found
-            assert len(loc_matches) > 0, 'No location objects found in .ddy file.'
-            assert len(dday_matches) > 0, 'No design day objects found in .ddy file.'
+            assert loc_fields is not None, 'No location objects found in .ddy file.'
+            assert len(dday_fields) > 0, 'No design day objects found in .ddy file.'
 
             # build design day and location objects
-            location = Location.from_idf(loc_matches[0][0])
-            ddays = [DesignDay.from_idf(match[0], location) for match in dday_matches]
+            location = Location._from_idf_fields(loc_fields)
+            ddays = [DesignDay._from_idf_fields(fields, location)
+                     for fields in dday_fields]
         finally:
             ddywin.close()
 
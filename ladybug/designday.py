@@ -2,6 +2,7 @@
 from __future__ import division
 
 from .location import Location
+from .idfutil import parse_idf_string
 
 from .dt import DateTime, Date
 from .header import Header
@@ -18,8 +19,8 @@ from .skymodel import ashrae_revised_clear_sky, \
 from .psychrometrics import rel_humid_from_db_dpt, dew_point_from_db_hr, \
     dew_point_from_db_enth, dew_point_from_db_wb
 
+from collections import OrderedDict
 import math
-import re
 import sys
 if (sys.version_info > (3, 0)):
     xrange = range
@@ -59,7 +60,13 @@ class DesignDay(object):
         * hourly_horizontal_infrared
     """
     __slots__ = ('_name', '_day_type', '_location', '_dry_bulb_condition',
-                 '_humidity_condition', '_wind_condition', '_sky_condition')
+                 '_humidity_condition', '_wind_condition', '_sky_condition',
+                 '_hourly_cache')
+
+    # analysis periods and hourly datetimes shared by all design days
+    _analysis_periods = OrderedDict()  # keyed by month and day
+    _hourly_datetimes = OrderedDict()  # keyed by start moy and leap year
+    MAXSHAREDDAYS = 732
 
     # possible day types
     DAY_TYPES = ('SummerDesignDay', 'WinterDesignDay', 'Sunday', 'Monday',
@@ -112,6 +119,7 @@ class DesignDay(object):
 
     def __init__(self, name, day_type, location, dry_bulb_condition, humidity_condition,
                  wind_condition, sky_condition):
+        self._hourly_cache = {}
         self.name = str(name)
         self.day_type = day_type
         self.location = location
@@ -165,51 +173,56 @@ class DesignDay(object):
             location: A Ladybug Location object, used to interpret the sky condition
                 over the course of the design day.
         """
-        # format the object into a list of properties
-        idf_string = idf_string.strip()
-        assert idf_string.startswith('SizingPeriod:DesignDay'), 'Expected SizingPeriod' \
-            ':DesignDay but received a different object: {}'.format(idf_string)
-        idf_string = idf_string.replace(';', ',')
-        idf_string = re.sub(r'!.*\n', '', idf_string)
-        ep_fields = [e_str.strip() for e_str in idf_string.split(',')]
+        _, ep_fields = parse_idf_string(idf_string, 'SizingPeriod:DesignDay')
+        return cls._from_idf_fields(ep_fields, location)
+
+    @classmethod
+    def _from_idf_fields(cls, ep_fields, location):
+        """Initialize from the fields of an EnergyPlus SizingPeriod:DesignDay.
 
+        Args:
+            ep_fields: A list of text fields for the SizingPeriod:DesignDay
+                (excluding the EnergyPlus object type).
+            location: A Ladybug Location object, used to interpret the sky condition
+                over the course of the design day.
+        """
         # extract primary properties
-        name = ep_fields[1]
-        day_type = ep_fields[4]
+        name = ep_fields[0]
+        day_type = ep_fields[3]
 
         # extract dry bulb temperatures
         dry_bulb_condition = DryBulbCondition(
-            float(ep_fields[5]), float(ep_fields[6]), ep_fields[7], ep_fields[8])
+            float(ep_fields[4]), float(ep_fields[5]), ep_fields[6], ep_fields[7])
 
         # extract humidity conditions
-        h_type = ep_fields[9]
-        h_val = 0 if ep_fields[10] == '' else float(ep_fields[10])
-        rain = True if ep_fields[18].lower() == 'yes' else False
-        snow = True if ep_fields[19].lower() == 'yes' else False
+        h_type = ep_fields[8]
+        h_val = 0 if ep_fields[9] == '' else float(ep_fields[9])
+        rain = True if ep_fields[17].lower() == 'yes' else False
+        snow = True if ep_fields[18].lower() == 'yes' else False
         if h_type == 'HumidityRatio':
-            h_val = float(ep_fields[12])
+            h_val = float(ep_fields[11])
         elif h_type == 'Enthalpy':
-            h_val = float(ep_fields[13])
+            h_val = float(ep_fields[12])
         humidity_condition = HumidityCondition(
-            h_type, h_val, float(ep_fields[15]), rain, snow, ep_fields[11])
+            h_type, h_val, float(ep_fields[14]), rain, snow, ep_fields[10])
 
         # extract wind conditions
-        wind_condition = WindCondition(float(ep_fields[16]), float(ep_fields[17]))
+        wind_condition = WindCondition(float(ep_fields[15]), float(ep_fields[16]))
 
         # extract the sky conditions
-        sky_model = ep_fields[21]
-        dl_save = True if ep_fields[20].lower() == 'yes' else False
-        date_obj = Date(int(ep_fields[2]), int(ep_fields[3]))
+        sky_model = ep_fields[20]
+        dl_save = True if ep_fields[19].lower() == 'yes' else False
+        date_obj = Date(int(ep_fields[1]), int(ep_fields[2]))
         if sky_model == 'ASHRAEClearSky':
-            sky_condition = ASHRAEClearSky(date_obj, float(ep_fields[26]), dl_save)
+            sky_condition = ASHRAEClearSky(date_obj, float(ep_fields[25]), dl_save)
         elif sky_model == 'ASHRAETau':
-            sky_condition = ASHRAETau(date_obj, float(ep_fields[24]),
-                                      float(ep_fields[25]), dl_save)
+            sky_condition = ASHRAETau(date_obj, float(ep_fields[23]),
+                                      float(ep_fields[24]), dl_save)
         else:
             sky_condition = _SkyCondition(date_obj, dl_save)
         if sky_model == 'Schedule':
-            sky_condition.beam_schedule = ep_fields[22]
-            sky_condition.diffuse_schedule = ep_fields[23]
+            sky_condition.beam_schedule = ep_fields[21]
+            sky_condition.diffuse_schedule = ep_fields[22]
 
         return cls(name, day_type, location, dry_bulb_condition,
                    humidity_condition, wind_condition, sky_condition)
@@ -353,6 +366,7 @@ class DesignDay(object):
         assert isinstance(data, Location), 'Expected' \
             ' Location type. Got {}'.format(type(data))
         self._location = data
+        self._hourly_cache = {}
 
     @property
     def dry_bulb_condition(self):
@@ -364,6 +378,7 @@ class DesignDay(object):
         assert isinstance(data, DryBulbCondition), 'Expected' \
             ' DryBulbCondition type. Got {}'.format(type(data))
         self._dry_bulb_condition = data
+        self._hourly_cache = {}
 
     @property
     def humidity_condition(self):
@@ -375,6 +390,7 @@ class DesignDay(object):
         assert isinstance(data, HumidityCondition), 'Expected' \
             ' HumidityCondition type. Got {}'.format(type(data))
         self._humidity_condition = data
+        self._hourly_cache = {}
 
     @property
     def wind_condition(self):
@@ -397,49 +413,53 @@ class DesignDay(object):
         assert isinstance(data, _SkyCondition), 'Expected ASHRAEClearSky or' \
             ' ASHRAETau type. Got {}'.format(type(data))
         self._sky_condition = data
+        self._hourly_cache = {}
 
     @property
     def analysis_period(self):
         """Get the analysisperiod of the design day."""
-        return AnalysisPeriod(
-            self.sky_condition.date.month,
-            self.sky_condition.date.day,
-            0,
-            self.sky_condition.date.month,
-            self.sky_condition.date.day,
-            23)
+        month, day = self.sky_condition.date.month, self.sky_condition.date.day
+        try:
+            return DesignDay._analysis_periods[(month, day)]
+        except KeyError:
+            a_period = AnalysisPeriod(month, day, 0, month, day, 23)
+            if len(DesignDay._analysis_periods) >= DesignDay.MAXSHAREDDAYS:
+                DesignDay._analysis_periods.popitem(last=False)
+            DesignDay._analysis_periods[(month, day)] = a_period
+            return a_period
 
     @property
     def hourly_datetimes(self):
         """Get a list of hourly DateTime objects for the DesignDay."""
         start_moy = self.sky_condition.date.doy * 1440
         lp_yr = self.sky_condition.date.leap_year
-        return tuple(DateTime.from_moy(start_moy + (i * 60), lp_yr) for i in xrange(24))
+        try:
+            return DesignDay._hourly_datetimes[(start_moy, lp_yr)]
+        except KeyError:
+            datetimes = tuple(DateTime.from_moy(start_moy + (i * 60), lp_yr)
+                              for i in xrange(24))
+            if len(DesignDay._hourly_datetimes) >= DesignDay.MAXSHAREDDAYS:
+                DesignDay._hourly_datetimes.popitem(last=False)
+            DesignDay._hourly_datetimes[(start_moy, lp_yr)] = datetimes
+            return datetimes
 
     @property
     def hourly_dry_bulb(self):
         """A data collection containing hourly dry bulb temperature over they day."""
         return self._get_daily_data_collections(
-            temperature.DryBulbTemperature(), 'C',
-            self._dry_bulb_condition.hourly_values)
+            temperature.DryBulbTemperature(), 'C', self._dry_bulb_values())
 
     @property
     def hourly_dew_point(self):
         """A data collection containing hourly dew points over they day."""
-        dpt_data = self._humidity_condition.hourly_dew_point_values(
-            self._dry_bulb_condition)
         return self._get_daily_data_collections(
-            temperature.DewPointTemperature(), 'C', dpt_data)
+            temperature.DewPointTemperature(), 'C', self._dew_point_values())
 
     @property
     def hourly_relative_humidity(self):
         """A data collection containing hourly relative humidity over they day."""
-        dpt_data = self._humidity_condition.hourly_dew_point_values(
-            self._dry_bulb_condition)
-        rh_data = [rel_humid_from_db_dpt(x, y) for x, y in zip(
-            self._dry_bulb_condition.hourly_values, dpt_data)]
         return self._get_daily_data_collections(
-            fraction.RelativeHumidity(), '%', rh_data)
+            fraction.RelativeHumidity(), '%', self._relative_humidity_values())
 
     @property
     def hourly_barometric_pressure(self):
@@ -465,8 +485,7 @@ class DesignDay(object):
         """Three data collections containing hourly direct normal, diffuse horizontal,
         and global horizontal radiation.
         """
-        dir_norm, diff_horiz, glob_horiz = \
-            self._sky_condition.radiation_values(self._location)
+        dir_norm, diff_horiz, glob_horiz = self._radiation_values()
 
         dir_norm_data = self._get_daily_data_collections(
             energyintensity.DirectNormalRadiation(), 'Wh/m2', dir_norm)
@@ -487,18 +506,65 @@ class DesignDay(object):
     def hourly_horizontal_infrared(self):
         """A data collection containing hourly horizontal infrared intensity in W/m2.
         """
-        sky_cover = self._sky_condition.hourly_sky_cover
-        db_temp = self._dry_bulb_condition.hourly_values
-        dp_temp = self._humidity_condition.hourly_dew_point_values(
-            self._dry_bulb_condition)
+        return self._get_daily_data_collections(
+            energyflux.HorizontalInfraredRadiationIntensity(), 'W/m2',
+            self._horizontal_infrared_values())
+
+    @staticmethod
+    def hourly_profiles(design_days):
+        """Generate the hourly profiles of several design days at once.
 
-        horiz_ir = []
-        for i in xrange(len(sky_cover)):
-            horiz_ir.append(
-                calc_horizontal_infrared(sky_cover[i], db_temp[i], dp_temp[i]))
+        Inputs that are shared between the design days are only computed once.
+        For example, the solar altitudes of design days at the same location and
+        date or the dew points of design days with identical conditions. The
+        profiles are also remembered by each of the design days such that getting
+        its hourly properties afterwards does not compute them again.
 
-        return self._get_daily_data_collections(
-            energyflux.HorizontalInfraredRadiationIntensity(), 'W/m2', horiz_ir)
+        Args:
+            design_days: A list of DesignDay objects.
+
+        Returns:
+            A generator that yields a dictionary of data collections for each
+            of the design_days. The dictionaries have the following keys.
+
+            -   dry_bulb
+            -   dew_point
+            -   relative_humidity
+            -   direct_normal_radiation
+            -   diffuse_horizontal_radiation
+            -   global_horizontal_radiation
+            -   horizontal_infrared
+        """
+        shared_profiles, shared_altitudes = {}, {}
+        for des_day in design_days:
+            assert isinstance(des_day, DesignDay), 'Expected DesignDay for ' \
+                'hourly_profiles. Got {}.'.format(type(des_day))
+            # use the profiles of previous design days with identical conditions
+            states = des_day._profile_states()
+            for name, state in states.items():
+                try:
+                    des_day._hourly_cache[name] = shared_profiles[state]
+                except KeyError:
+                    pass
+
+            dir_norm, diff_horiz, glob_horiz = des_day._radiation_values(shared_altitudes)
+            profiles = {
+                'dry_bulb': des_day.hourly_dry_bulb,
+                'dew_point': des_day.hourly_dew_point,
+                'relative_humidity': des_day.hourly_relative_humidity,
+                'horizontal_infrared': des_day.hourly_horizontal_infrared,
+                'direct_normal_radiation': des_day._get_daily_data_collections(
+                    energyintensity.DirectNormalRadiation(), 'Wh/m2', dir_norm),
+                'diffuse_horizontal_radiation': des_day._get_daily_data_collections(
+                    energyintensity.DiffuseHorizontalRadiation(), 'Wh/m2',
+                    diff_horiz),
+                'global_horizontal_radiation': des_day._get_daily_data_collections(
+                    energyintensity.GlobalHorizontalRadiation(), 'Wh/m2', glob_horiz)
+            }
+            for name in states:  # cached states hold copies of the conditions
+                cached_state, values = des_day._hourly_cache[name]
+                shared_profiles[cached_state] = (cached_state, values)
+            yield profiles
 
     def to_idf(self):
         """Get this object as an EnergyPlus IDF SizingPeriod:DesignDay string."""
@@ -577,6 +643,106 @@ class DesignDay(object):
             des_day_dict['location'] = self.location.to_dict()
         return des_day_dict
 
+    def _profile_states(self, duplicate=False):
+        """Get a dictionary with the state of the inputs of each hourly profile.
+
+        Each state is a tuple of the name of the profile followed by each of the
+        objects that are used to compute the profile. States are compared by the
+        values of these objects.
+
+        Args:
+            duplicate: Boolean to note whether the states should contain copies
+                of the objects, which are not affected by later edits to the
+                conditions of this design day. (Default: False).
+        """
+        db_cond, hu_cond = self._dry_bulb_condition, self._humidity_condition
+        sky_cond, location = self._sky_condition, self._location
+        if duplicate:
+            db_cond, hu_cond = db_cond.duplicate(), hu_cond.duplicate()
+            sky_cond, location = sky_cond.duplicate(), location.duplicate()
+        return {
+            'dry_bulb': ('dry_bulb', db_cond),
+            'dew_point': ('dew_point', db_cond, hu_cond),
+            'relative_humidity': ('relative_humidity', db_cond, hu_cond),
+            'radiation': ('radiation', sky_cond, location),
+            'horizontal_infrared': ('horizontal_infrared', sky_cond, db_cond, hu_cond)
+        }
+
+    def _cached_values(self, name, compute):
+        """Get the values of an hourly profile, only computing them if inputs changed.
+
+        The profiles are remembered along with copies of the objects used to
+        compute them. So they are recomputed when a condition is edited in place
+        as well as when a new condition is assigned to this design day.
+
+        Args:
+            name: Text for the name of the hourly profile.
+            compute: A function without arguments that computes the profile.
+        """
+        state = self._profile_states()[name]
+        try:
+            cached_state, values = self._hourly_cache[name]
+            if cached_state == state:
+                return values
+        except KeyError:
+            pass
+        values = compute()
+        self._hourly_cache[name] = (self._profile_states(True)[name], values)
+        return values
+
+    def _dry_bulb_values(self):
+        """Get a tuple of the hourly dry bulb temperatures."""
+        return self._cached_values(
+            'dry_bulb', lambda: tuple(self._dry_bulb_condition.hourly_values))
+
+    def _dew_point_values(self):
+        """Get a tuple of the hourly dew point temperatures."""
+        return self._cached_values(
+            'dew_point', lambda: tuple(self._humidity_condition.hourly_dew_point_values(
+                self._dry_bulb_condition)))
+
+    def _relative_humidity_values(self):
+        """Get a tuple of the hourly relative humidity."""
+        return self._cached_values(
+            'relative_humidity', lambda: tuple(
+                rel_humid_from_db_dpt(x, y) for x, y in
+                zip(self._dry_bulb_values(), self._dew_point_values())))
+
+    def _radiation_values(self, shared_altitudes=None):
+        """Get tuples of the hourly direct, diffuse and global radiation.
+
+        Args:
+            shared_altitudes: An optional dictionary of solar altitudes that are
+                shared between design days. If the altitudes for the location
+                and sky condition date of this design day are in the dictionary,
+                they will be used. Otherwise, they will be computed and added to it.
+        """
+        def compute():
+            sky = self._sky_condition
+            if shared_altitudes is None:
+                rad = sky.radiation_values(self._location)
+            else:
+                key = (self._location, sky._date, sky._daylight_savings)
+                try:
+                    altitudes = shared_altitudes[key]
+                except KeyError:
+                    altitudes = sky._solar_altitudes(self._location)
+                    key = (self._location.duplicate(),) + key[1:]
+                    shared_altitudes[key] = altitudes
+                rad = sky._radiation_from_altitudes(altitudes)
+            return tuple(tuple(vals) for vals in rad)
+        return self._cached_values('radiation', compute)
+
+    def _horizontal_infrared_values(self):
+        """Get a tuple of the hourly horizontal infrared intensity."""
+        def compute():
+            sky_cover = self._sky_condition.hourly_sky_cover
+            db_temp = self._dry_bulb_values()
+            dp_temp = self._dew_point_values()
+            return tuple(calc_horizontal_infrared(sky_cover[i], db_temp[i], dp_temp[i])
+                         for i in xrange(len(sky_cover)))
+        return self._cached_values('horizontal_infrared', compute)
+
     def _get_daily_data_collections(self, data_type, unit, values):
         """Return an empty data collection."""
         data_header = Header(data_type=data_type, unit=unit,
@@ -1174,6 +1340,13 @@ class _SkyCondition(object):
         """Get a copy of this object."""
         return self.__copy__()
 
+    def _solar_altitudes(self, location, timestep=1):
+        """Get a list of solar altitudes at each timestep of the design day."""
+        # create sunpath and get altitude at every timestep of the design day
+        sp = Sunpath.from_location(location)
+        dates = self._get_datetimes(timestep)
+        return list(sp.calculate_sun_collection(dates).altitudes)
+
     def _get_datetimes(self, timestep=1):
         """List of datetimes based on design day date and timestep.
 
@@ -1211,7 +1384,7 @@ class _SkyCondition(object):
 
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
-        return (hash(self._date), self._daylight_savings, self.beam_schedule,
+        return (self._date, self._daylight_savings, self.beam_schedule,
                 self.diffuse_schedule)
 
     def __hash__(self):
@@ -1305,13 +1478,10 @@ class ASHRAEClearSky(_SkyCondition):
 
     def radiation_values(self, location, timestep=1):
         """Get arrays of direct, diffuse, and global radiation at each timestep."""
-        # create sunpath and get altitude at every timestep of the design day
-        sp = Sunpath.from_location(location)
-        altitudes = []
-        dates = self._get_datetimes(timestep)
-        for t_date in dates:
-            sun = sp.calculate_sun_from_date_time(t_date)
-            altitudes.append(sun.altitude)
+        return self._radiation_from_altitudes(self._solar_altitudes(location, timestep))
+
+    def _radiation_from_altitudes(self, altitudes):
+        """Get arrays of direct, diffuse, and global radiation from solar altitudes."""
         dir_norm, diff_horiz = ashrae_clear_sky(
             altitudes, self._date.month, self._clearness)
         glob_horiz = [dhr + dnr * math.sin(math.radians(alt)) for
@@ -1332,7 +1502,7 @@ class ASHRAEClearSky(_SkyCondition):
 
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
-        return (hash(self._date), self._clearness, self._daylight_savings)
+        return (self._date, self._clearness, self._daylight_savings)
 
     def __hash__(self):
         return hash(self.__key())
@@ -1433,13 +1603,10 @@ class ASHRAETau(_SkyCondition):
 
     def radiation_values(self, location, timestep=1):
         """Gat arrays of direct, diffuse, and global radiation at each timestep."""
-        # create sunpath and get altitude at every timestep of the design day
-        sp = Sunpath.from_location(location)
-        altitudes = []
-        dates = self._get_datetimes(timestep)
-        for t_date in dates:
-            sun = sp.calculate_sun_from_date_time(t_date)
-            altitudes.append(sun.altitude)
+        return self._radiation_from_altitudes(self._solar_altitudes(location, timestep))
+
+    def _radiation_from_altitudes(self, altitudes):
+        """Get arrays of direct, diffuse, and global radiation from solar altitudes."""
         dir_norm, diff_horiz = ashrae_revised_clear_sky(
             altitudes, self._tau_b, self._tau_d)
         glob_horiz = [dhr + dnr * math.sin(math.radians(alt)) for
@@ -1461,7 +1628,7 @@ class ASHRAETau(_SkyCondition):
 
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
-        return (hash(self._date), self._tau_b, self._tau_d, self._daylight_savings)
+        return (self._date, self._tau_b, self._tau_d, self._daylight_savings)
 
     def __hash__(self):
         return hash(self.__key())
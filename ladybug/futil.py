@@ -6,14 +6,11 @@ import os
 import shutil
 import zipfile
 import sys
-from distutils import dir_util
 
 if (sys.version_info < (3, 0)):
-    import urllib2
     readmode = 'rb'
     writemode = 'wb'
 else:
-    import urllib.request
     readmode = 'r'
     writemode = 'w'
 
@@ -83,6 +80,7 @@ def nukedir(target_dir, rmdir=False):
             os.rmdir(d)
         except Exception:
             try:
+                from distutils import dir_util  # slow to import; only used here
                 dir_util.remove_tree(d)
             except Exception:
                 print("Failed to remove %s" % d)
@@ -210,6 +208,7 @@ def copy_file_tree(source_folder, dest_folder, overwrite=True):
 
 def _download_py2(link, path, __hdr__):
     """Download a file from a link in Python 2."""
+    import urllib2
     try:
         req = urllib2.Request(link, headers=__hdr__)
         u = urllib2.urlopen(req)
@@ -224,6 +223,7 @@ def _download_py2(link, path, __hdr__):
 
 def _download_py3(link, path, __hdr__):
     """Download a file from a link in Python 3."""
+    import urllib.request
     try:
         req = urllib.request.Request(link, headers=__hdr__)
         u = urllib.request.urlopen(req)
@@ -0,0 +1,69 @@
+# coding=utf-8
+"""Utility functions for parsing EnergyPlus IDF text."""
+from __future__ import division
+
+
+def parse_idf_objects(idf_string, object_types=None):
+    """Get the objects within an IDF string in a single pass over its lines.
+
+    Comments (starting with an exclamation mark) are removed and each object
+    is split into its fields as soon as its closing semicolon is found. So the
+    objects of very large files (eg. DDY files with many stations) can be
+    extracted without scanning the text more than once.
+
+    Args:
+        idf_string: Text for a string of IDF objects (eg. the text of a .ddy file).
+        object_types: An optional list of EnergyPlus object types to be yielded
+            (eg. ['Site:Location', 'SizingPeriod:DesignDay']). Types are not
+            case sensitive. If None, all objects in the text will be yielded.
+
+    Returns:
+        An iterator of tuples with one tuple for each object in the text. Each
+        tuple contains the EnergyPlus object type followed by a list of the
+        stripped text fields of the object.
+    """
+    if object_types is not None:
+        object_types = set(o_type.lower() for o_type in object_types)
+    obj_lines = []
+    for line in idf_string.split('\n'):
+        line = line.split('!', 1)[0]
+        if ';' not in line:
+            obj_lines.append(line)
+            continue
+        obj_ends = line.split(';')
+        for obj_end in obj_ends[:-1]:
+            obj_lines.append(obj_end)
+            obj_text = '\n'.join(obj_lines)
+            obj_lines = []
+            obj_type, _, obj_fields = obj_text.partition(',')
+            obj_type = obj_type.strip()
+            if object_types is None or obj_type.lower() in object_types:
+                yield obj_type, [field.strip() for field in obj_fields.split(',')]
+        obj_lines.append(obj_ends[-1])
+
+
+def parse_idf_string(idf_string, expected_type=None):
+    """Parse the first object within an IDF string into its type and fields.
+
+    Args:
+        idf_string: A full IDF string representing an EnergyPlus object.
+        expected_type: Optional text for the EnergyPlus object type that the
+            string is expected to represent (eg. 'Site:Location'). An exception
+            will be raised if the object in the string is not of this type.
+
+    Returns:
+        A tuple with two elements.
+
+        -   obj_type: Text for the EnergyPlus object type.
+
+        -   obj_fields: A list of the stripped text fields of the object.
+    """
+    idf_string = idf_string.strip()
+    if not idf_string.endswith(';'):  # make sure that the object is closed
+        idf_string = '{};'.format(idf_string)
+    for obj_type, obj_fields in parse_idf_objects(idf_string):
+        if expected_type is not None:
+            assert obj_type == expected_type, 'Expected {} but received a ' \
+                'different object: {}'.format(expected_type, idf_string)
+        return obj_type, obj_fields
+    raise ValueError('No EnergyPlus object was found in: {}'.format(idf_string))
@@ -2,7 +2,7 @@
 """Ladybug location."""
 from __future__ import division
 
-import re
+from .idfutil import parse_idf_string
 
 
 class Location(object):
@@ -129,14 +129,17 @@ class Location(object):
         Args:
             idf_string: A full IDF string representing a Site:Location.
         """
-        # format the object into a list of properties
-        idf_string = idf_string.strip()
-        assert idf_string.startswith('Site:Location'), 'Expected Site' \
-            ':Location but received a different object: {}'.format(idf_string)
-        idf_string = idf_string.replace(';', ',')
-        idf_string = re.sub(r'!.*\n', '', idf_string)
-        ep_fields = [e_str.strip() for e_str in idf_string.split(',')]
-        ep_fields.pop(0)  # remove the EnergyPlus object name
+        _, ep_fields = parse_idf_string(idf_string, 'Site:Location')
+        return cls._from_idf_fields(ep_fields)
+
+    @classmethod
+    def _from_idf_fields(cls, ep_fields):
+        """Create a Ladybug location from the fields of an EnergyPlus Site:Location.
+
+        Args:
+            ep_fields: A list of text fields for the Site:Location (excluding
+                the EnergyPlus object type).
+        """
         return cls(city=ep_fields[0], latitude=ep_fields[1], longitude=ep_fields[2],
                    time_zone=ep_fields[3], elevation=ep_fields[4])
 
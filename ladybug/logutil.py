@@ -1,7 +1,6 @@
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
 import os
-import tempfile
 
 # This is copied from logging module since python 2 doesn't have it under the same name.
 CRITICAL = 50
@@ -25,9 +24,17 @@ _name_to_level = {
 }
 
 
+# handlers shared by all loggers so that files and queues are only set up once
+_file_handlers = {}
+_stream_handlers = {}
+_queue_handlers = {}
+_queue_listeners = []
+
+
 def _get_log_folder():
     home_folder = os.getenv('HOME') or os.path.expanduser('~')
     if not os.access(home_folder, os.W_OK):
+        import tempfile
         home_folder = tempfile.gettempdir()
     log_folder = os.path.join(home_folder, '.ladybug')
     if not os.path.isdir(log_folder):
@@ -40,10 +47,111 @@ def _get_log_level(level):
     return level or logging.INFO
 
 
+class _LazyFileHandler(logging.Handler):
+    """A handler that opens a daily rotating log file once the first record is emitted.
+
+    This way, loggers can be set up without touching the file system, which
+    keeps imports fast and avoids failures in read-only environments.
+
+    Args:
+        filename: Name of the log file within the ladybug log folder.
+    """
+
+    def __init__(self, filename):
+        logging.Handler.__init__(self)
+        self.filename = filename
+        self._handler = None
+
+    def emit(self, record):
+        try:
+            if self._handler is None:
+                from logging.handlers import TimedRotatingFileHandler
+                log_file = os.path.join(_get_log_folder(), self.filename)
+                self._handler = TimedRotatingFileHandler(log_file, when='midnight')
+                self._handler.setFormatter(self.formatter)
+            self._handler.emit(record)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self.acquire()
+        try:
+            if self._handler is not None:
+                self._handler.close()
+                self._handler = None
+        finally:
+            self.release()
+        logging.Handler.close(self)
+
+
+def _get_file_handler(filename, file_log_level):
+    """Get a file handler that is shared across loggers using the same file and level."""
+    key = (filename, _get_log_level(file_log_level))
+    try:
+        return _file_handlers[key]
+    except KeyError:
+        file_handler = _LazyFileHandler(filename)
+        file_format = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler.setFormatter(file_format)
+        file_handler.setLevel(key[1])
+        _file_handlers[key] = file_handler
+        return file_handler
+
+
+def _get_stream_handler(console_log_level):
+    """Get a console handler that is shared across loggers using the same level."""
+    level = _get_log_level(console_log_level)
+    try:
+        return _stream_handlers[level]
+    except KeyError:
+        stream_handler = logging.StreamHandler()
+        stream_format = logging.Formatter('%(name)s - %(levelname)s - %(message)s')
+        stream_handler.setFormatter(stream_format)
+        stream_handler.setLevel(level)
+        _stream_handlers[level] = stream_handler
+        return stream_handler
+
+
+def _get_queue_handler(handlers):
+    """Get a handler that passes records to the handlers through a background thread.
+
+    Returns None if queue handlers are not available (eg. in Python 2).
+    """
+    try:
+        return _queue_handlers[handlers]
+    except KeyError:
+        try:
+            from logging.handlers import QueueHandler, QueueListener
+            import queue
+        except ImportError:  # python 2
+            return None
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        if not _queue_listeners:  # stop the listeners and flush records on exit
+            atexit.register(_stop_queue_listeners)
+        _queue_listeners.append(listener)
+        queue_handler = QueueHandler(log_queue)
+        _queue_handlers[handlers] = queue_handler
+        return queue_handler
+
+
+def _stop_queue_listeners():
+    """Stop all background logging threads once all queued records are handled."""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
 def get_logger(name, filename='ladybug.log', file_log_level='DEBUG',
-               console_log_level='WARNING'):
+               console_log_level='WARNING', use_queue=False):
     """Get a logger to be used for each module.
 
+    Handlers are shared between all of the loggers that use the same settings
+    and they are only added once to each logger. So this function can be
+    called several times for the same logger. The log file is only created
+    once the first record is written to it.
+
     Args:
         name: Logger name. The good practice is to set it to __init__ from inside each
             modules.
@@ -51,25 +159,42 @@ def get_logger(name, filename='ladybug.log', file_log_level='DEBUG',
             (Default: ladybug.log).
         file_log_level: Log level for file handler as a string (Default: DEBUG).
         console_log_level: Log level for stream handler as a string (Default: WARNING).
+        use_queue: Boolean to note whether records should be put on a queue and
+            written to the file and console by a background thread. This keeps
+            the writing of records out of the calling thread, which is useful
+            when logging heavily from performance-sensitive code. This option
+            has no effect in Python 2, where queue handlers are not available.
+            When a logger is requested again with a different value, the
+            handlers of the previous value are removed from it. (Default: False).
     """
     logger = logging.getLogger(name)
 
-    # create a file handler to log debug and higher level logs
+    # get a file handler to log debug and higher level logs
+    handlers = []
     if filename:
-        log_file = os.path.join(_get_log_folder(), filename)
-        file_handler = TimedRotatingFileHandler(log_file, when='midnight')
-        file_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(file_format)
-        file_handler.setLevel(_get_log_level(file_log_level))
-        logger.addHandler(file_handler)
+        handlers.append(_get_file_handler(filename, file_log_level))
+
+    # get a console handler that only prints out errors and warnings
+    handlers.append(_get_stream_handler(console_log_level))
 
-    # create a console handler that only prints out errors and warnings
-    stream_handler = logging.StreamHandler()
-    stream_format = logging.Formatter('%(name)s - %(levelname)s - %(message)s')
-    stream_handler.setFormatter(stream_format)
-    stream_handler.setLevel(_get_log_level(console_log_level))
+    # put the records on a queue if requested
+    # the queue handler and the handlers it wraps are never used together
+    # so that records are not written twice when use_queue is switched
+    shared_handlers = tuple(handlers)
+    if use_queue:
+        queue_handler = _get_queue_handler(shared_handlers)
+        if queue_handler is not None:
+            handlers, old_handlers = [queue_handler], shared_handlers
+        else:
+            old_handlers = ()
+    else:
+        old_handlers = (_queue_handlers.get(shared_handlers),)
 
-    logger.addHandler(stream_handler)
+    for handler in old_handlers:
+        if handler in logger.handlers:
+            logger.removeHandler(handler)
+    for handler in handlers:
+        if handler not in logger.handlers:
+            logger.addHandler(handler)
 
     return logger
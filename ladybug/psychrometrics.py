@@ -1,15 +1,35 @@
 # coding=utf-8
-"""Utility functions for converting between humidity metrics."""
+"""Utility functions for converting between humidity metrics.
+
+Each function that ends in "_array" accepts lists, tuples, data collections or any
+other sequence of numbers (including NumPy arrays) in place of the numerical inputs
+of its scalar counterpart. Inputs that are single numbers are broadcast to the length
+of the sequence inputs, which must all have the same length. The result is a list
+of numbers that are identical to those of the scalar function, with the exception
+of the functions that solve for dew point or wet bulb temperature. These accept a
+tolerance, which makes them more accurate than the scalar functions by default.
+
+Most of the "_array" functions are only a convenience, which call the scalar
+function for each item and are no faster than a loop over the scalar function.
+Only the functions that solve for dew point or wet bulb temperature are written
+to be faster than a loop over the scalar function.
+"""
 from __future__ import division
 
 import math
 
+_svp_coefficients = None  # cubic coefficients of the saturated vapor pressure table
+_svp_table = None  # set to the coefficients while the fast mode is turned on
+
 
 def saturated_vapor_pressure(t_kelvin):
     """Saturated vapor pressure (Pa) at a given dry bulb temperature (K).
 
     This function accounts for the different behavior above vs. below
-    the freezing point of water.
+    the freezing point of water. When the fast mode has been turned on with
+    set_fast_saturated_vapor_pressure, temperatures between 173.15 K (-100 C)
+    and 373.15 K (100 C) are computed from a lookup table instead of the full
+    equation (see saturated_vapor_pressure_fast for the accuracy of the table).
 
     Args:
         t_kelvin: Dry bulb temperature (K).
@@ -25,15 +45,104 @@ def saturated_vapor_pressure(t_kelvin):
         Open Source Software, 4(33), 1137, https://doi.org/10.21105/joss.01137
         https://github.com/psychrometrics/psychrolib/blob/master/src/python/psychrolib.py
     """
-    if (t_kelvin <= 273.15):  # saturation vapor pressure below freezing
-        ln_p_ws = -5.6745359E+03 / t_kelvin + 6.3925247 - 9.677843E-03 * t_kelvin + \
+    if _svp_table is not None and 173.15 <= t_kelvin < 373.15:  # fast mode
+        x = (t_kelvin - 173.15) * 2  # position in the table with 0.5 K steps
+        i = int(x)
+        u = x - i
+        a, b, c, d = _svp_table[i]
+        return a + u * (b + u * (c + u * d))
+    return math.exp(_ln_saturated_vapor_pressure(t_kelvin, t_kelvin <= 273.15))
+
+
+def saturated_vapor_pressure_fast(t_kelvin):
+    """Saturated vapor pressure (Pa) at a given dry bulb temperature (K) from a table.
+
+    The table spans from 173.15 K (-100 C) to 373.15 K (100 C) in steps of 0.5 K.
+    Each step is a cubic Hermite spline that matches the saturated_vapor_pressure
+    function and its analytic derivative at both ends, with the freezing point of
+    water falling on one of the steps. Within this range, the relative error of the
+    result is less than 2e-7 (0.00002%), which is orders of magnitude below the
+    uncertainty of the underlying equation. Temperatures outside of the range are
+    computed with the full equation. Because most of the cost of either method is
+    the overhead of the Python function call, the table is only about 1.5 times
+    faster than the full equation.
+
+    Args:
+        t_kelvin: Dry bulb temperature (K).
+
+    Returns:
+        Saturated vapor pressure (Pa).
+    """
+    if 173.15 <= t_kelvin < 373.15:
+        x = (t_kelvin - 173.15) * 2  # position in the table with 0.5 K steps
+        i = int(x)
+        u = x - i
+        a, b, c, d = (_svp_coefficients or _saturated_vapor_pressure_table())[i]
+        return a + u * (b + u * (c + u * d))
+    return saturated_vapor_pressure(t_kelvin)
+
+
+def set_fast_saturated_vapor_pressure(value=True):
+    """Turn on or off the lookup table used by saturated_vapor_pressure.
+
+    While turned on, every psychrometric function in this module (along with
+    the PsychrometricChart that uses them) will get its saturated vapor pressures
+    from the same table as saturated_vapor_pressure_fast. This is off by default.
+
+    Args:
+        value: Boolean to note whether the fast mode should be turned on. (Default: True).
+    """
+    global _svp_table
+    _svp_table = _saturated_vapor_pressure_table() if value else None
+
+
+def _saturated_vapor_pressure_table():
+    """Get the cubic coefficients of the saturated vapor pressure lookup table.
+
+    The table is built the first time that it is requested and each of its items
+    is a tuple of 4 coefficients for one 0.5 K step between 173.15 K and 373.15 K.
+    """
+    global _svp_coefficients
+    if _svp_coefficients is None:
+        _svp_coefficients = []
+        for i in range(400):
+            t_0, t_1 = 173.15 + i * 0.5, 173.15 + (i + 1) * 0.5
+            below_freezing = i < 200  # ensure both ends use the same equation
+            p_0, d_p_0 = _saturated_vapor_pressure_slope(t_0, below_freezing)
+            p_1, d_p_1 = _saturated_vapor_pressure_slope(t_1, below_freezing)
+            m_0, m_1 = d_p_0 * 0.5, d_p_1 * 0.5  # scale slopes to the step
+            _svp_coefficients.append((
+                p_0, m_0, 3 * (p_1 - p_0) - 2 * m_0 - m_1, 2 * (p_0 - p_1) + m_0 + m_1))
+    return _svp_coefficients
+
+
+def _saturated_vapor_pressure_slope(t_kelvin, below_freezing):
+    """Get saturated vapor pressure (Pa) and its derivative (Pa/K) using one equation.
+
+    Args:
+        t_kelvin: Dry bulb temperature (K).
+        below_freezing: Boolean to note whether the equation for saturation over
+            ice (True) or over liquid water (False) should be used.
+    """
+    p_ws = math.exp(_ln_saturated_vapor_pressure(t_kelvin, below_freezing))
+    return p_ws, p_ws * _d_ln_p_ws(t_kelvin - 273.15, below_freezing)
+
+
+def _ln_saturated_vapor_pressure(t_kelvin, below_freezing):
+    """Get the natural log of saturated vapor pressure (Pa) using one equation.
+
+    Args:
+        t_kelvin: Dry bulb temperature (K).
+        below_freezing: Boolean to note whether the equation for saturation over
+            ice (True) or over liquid water (False) should be used.
+    """
+    if below_freezing:
+        return -5.6745359E+03 / t_kelvin + 6.3925247 - 9.677843E-03 * t_kelvin + \
             6.2215701E-07 * t_kelvin**2 + 2.0747825E-09 * math.pow(t_kelvin, 3) - \
             9.484024E-13 * math.pow(t_kelvin, 4) + 4.1635019 * math.log(t_kelvin)
-    else:  # saturation vapor pressure above freezing
-        ln_p_ws = -5.8002206E+03 / t_kelvin + 1.3914993 - 4.8640239E-02 * t_kelvin + \
-            4.1764768E-05 * t_kelvin**2 - 1.4452093E-08 * math.pow(t_kelvin, 3) + \
-            6.5459673 * math.log(t_kelvin)
-    return math.exp(ln_p_ws)
+    return -5.8002206E+03 / t_kelvin + 1.3914993 - 4.8640239E-02 * t_kelvin + \
+        4.1764768E-05 * t_kelvin**2 - 1.4452093E-08 * math.pow(t_kelvin, 3) + \
+        6.5459673 * math.log(t_kelvin)
 
 
 def humid_ratio_from_db_rh(db_temp, rel_humid, b_press=101325):
@@ -328,15 +437,7 @@ def humid_ratio_from_db_wb(db_temp, wb_temp, b_press=101325):
     Note:
         [1] ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 36, solved for W
     """
-    p_ws = saturated_vapor_pressure(wb_temp + 273.15)
-    p_ws_star = 0.621945 * p_ws / (b_press - p_ws)
-    if wb_temp >= 0:
-        humid_ratio = ((2501. - 2.326 * wb_temp) * p_ws_star - 1.006 * (db_temp - wb_temp)) \
-            / (2501. + 1.86 * db_temp - 4.186 * wb_temp)
-    else:
-        humid_ratio = ((2830. - 0.24 * wb_temp) * p_ws_star - 1.006 * (db_temp - wb_temp)) \
-            / (2830. + 1.86 * db_temp - 2.1 * wb_temp)
-    return humid_ratio
+    return _humid_ratio_from_db_wb(db_temp, wb_temp, b_press)
 
 
 def db_temp_from_enth_hr(enthalpy, humid_ratio, reference_temp=0):
@@ -485,17 +586,22 @@ def wet_bulb_from_db_rh_fast(db_temp, rel_humid, b_press=101325):
     return t_w
 
 
-def _d_ln_p_ws(db_temp):
+def _d_ln_p_ws(db_temp, below_freezing=None):
     """Helper function for the derivative of the log of saturation vapor pressure.
 
     Args:
         db_temp : Dry bulb temperature (C).
+        below_freezing: Optional Boolean to note whether the equation for saturation
+            over ice (True) or over liquid water (False) should be used. If None,
+            it will be set by whether db_temp is at or below 0 C. (Default: None).
 
     Returns:
         Derivative of natural log of vapor pressure of saturated air in Pa.
     """
     T = db_temp + 273.15  # temperature in kelvin
-    if db_temp <= 0.:
+    if below_freezing is None:
+        below_freezing = db_temp <= 0.
+    if below_freezing:
         d_ln_p_ws = 5.6745359E+03 / math.pow(T, 2) - 9.677843E-03 + 2 * \
             6.2215701E-07 * T + 3 * 2.0747825E-09 * math.pow(T, 2) - 4 * \
             9.484024E-13 * math.pow(T, 3) + 4.1635019 / T
@@ -504,3 +610,451 @@ def _d_ln_p_ws(db_temp):
             4.1764768E-05 * T - 3 * 1.4452093E-08 * math.pow(T, 2) + \
             6.5459673 / T
     return d_ln_p_ws
+
+
+def _newton_max_step(tolerance, curvature):
+    """Get the largest Newton step after which a root is within a tolerance.
+
+    After a step of length h, the error of Newton's method is about c * h ** 2,
+    where c is half the ratio between the second and first derivative of the
+    function. So a root is solved to the tolerance once a step is shorter than
+    the square root of the tolerance over c, which spares the final step that
+    would only confirm the root.
+
+    Args:
+        tolerance: The tolerance to which the root is solved.
+        curvature: An upper limit of c for the function being solved.
+    """
+    return max(tolerance, math.sqrt(tolerance / curvature))
+
+
+def _dew_point_and_vapor_pressure(db_temp, rel_humid, max_step):
+    """Get dew point temperature (C) and the partial pressure of water vapor (Pa).
+
+    The dew point is solved with Newton's method on the log of saturation
+    vapor pressure, starting from the Magnus approximation of the dew point.
+
+    Args:
+        db_temp: Dry bulb temperature (C).
+        rel_humid: Relative humidity (%).
+        max_step: The largest Newton step after which the dew point is solved,
+            from _newton_max_step. The log of saturation vapor pressure has
+            a curvature c below 0.01.
+    """
+    p_w = saturated_vapor_pressure(db_temp + 273.15) * (rel_humid / 100)
+    if p_w <= 0:  # relative humidity of 0, return absolute zero
+        return -273.15, p_w
+    ln_vp, ln_rh = math.log(p_w), math.log(rel_humid / 100)
+    gamma = ln_rh + 17.62 * db_temp / (243.12 + db_temp)
+    td = 243.12 * gamma / (17.62 - gamma)  # first guess from the Magnus formula
+    for _ in range(100):  # 100 is the max iterations
+        below_freezing = td <= 0
+        step = (_ln_saturated_vapor_pressure(td + 273.15, below_freezing) - ln_vp) \
+            / _d_ln_p_ws(td, below_freezing)
+        td -= step
+        # steps that cross the freezing point switch equations and are not trusted
+        if abs(step) <= max_step and (td <= 0) == below_freezing:
+            break
+    return min(td, db_temp), p_w
+
+
+def _humid_ratio_from_db_wb(db_temp, wb_temp, b_press, slope=False):
+    """Get humidity ratio from air temperature (C) and wet bulb temperature (C).
+
+    Args:
+        db_temp: Dry bulb temperature (C).
+        wb_temp: Wet bulb temperature (C).
+        b_press: Air pressure (Pa).
+        slope: Boolean to note whether the derivative of the humidity ratio with
+            respect to the wet bulb temperature should also be returned. (Default:
+            False).
+
+    Returns:
+        Humidity ratio (kg water / kg air). If slope is True, this will be a tuple
+        with the humidity ratio and its derivative (kg water / kg air / C).
+    """
+    p_ws = saturated_vapor_pressure(wb_temp + 273.15)
+    p_ws_star = 0.621945 * p_ws / (b_press - p_ws)
+    if wb_temp >= 0:
+        h_w, c_w, c_wb = 2501., 2.326, 4.186
+    else:
+        h_w, c_w, c_wb = 2830., 0.24, 2.1
+    num = (h_w - c_w * wb_temp) * p_ws_star - 1.006 * (db_temp - wb_temp)
+    den = h_w + 1.86 * db_temp - c_wb * wb_temp
+    if not slope:
+        return num / den
+    d_p_ws_star = 0.621945 * b_press * p_ws * _d_ln_p_ws(wb_temp) / \
+        (b_press - p_ws) ** 2
+    d_num = (h_w - c_w * wb_temp) * d_p_ws_star - c_w * p_ws_star + 1.006
+    return num / den, (d_num * den + num * c_wb) / den ** 2
+
+
+def saturated_vapor_pressure_array(t_kelvin):
+    """Saturated vapor pressures (Pa) at an array of dry bulb temperatures (K).
+
+    Args:
+        t_kelvin: An array of dry bulb temperatures (K).
+
+    Returns:
+        A list of saturated vapor pressures (Pa).
+    """
+    return [saturated_vapor_pressure(t_k) for t_k in _broadcast_arrays(t_kelvin)[0]]
+
+
+def humid_ratio_from_db_rh_array(db_temp, rel_humid, b_press=101325):
+    """Humidity ratios (kg water/kg air) from arrays of temperature (C) and humidity (%).
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        rel_humid: An array of relative humidity values (%).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of humidity ratios (kg water/kg air).
+    """
+    return _map_arrays(humid_ratio_from_db_rh, db_temp, rel_humid, b_press)
+
+
+def enthalpy_from_db_hr_array(db_temp, humid_ratio, reference_temp=0):
+    """Enthalpy values (kJ/kg) from arrays of humidity ratio and temperature (C).
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        humid_ratio: An array of humidity ratios (kg water/kg air).
+        reference_temp: Reference dry air temperature (C). Default is 0C.
+
+    Returns:
+        A list of enthalpy values (kJ/kg).
+    """
+    return _map_arrays(enthalpy_from_db_hr, db_temp, humid_ratio, reference_temp)
+
+
+def dew_point_from_db_rh_array(db_temp, rel_humid, tolerance=0.001):
+    """Dew point temperatures (C) from arrays of temperature (C) and humidity (%).
+
+    Each dew point is solved with the same Newton-Raphson method as
+    dew_point_from_db_rh but it starts from the Magnus approximation of the
+    dew point instead of the dry bulb temperature. This usually needs a single
+    Newton step, making it about twice as fast as dew_point_from_db_rh while
+    solving to a tolerance that can be set to any value.
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        rel_humid: An array of relative humidity values (%).
+        tolerance: The tolerance in degrees C to which the dew point temperatures
+            are solved. (Default: 0.001).
+
+    Returns:
+        A list of dew point temperatures (C).
+    """
+    db_temp, rel_humid = _broadcast_arrays(db_temp, rel_humid)
+    max_step = _newton_max_step(tolerance, 0.01)
+    return [_dew_point_and_vapor_pressure(t, rh, max_step)[0]
+            for t, rh in zip(db_temp, rel_humid)]
+
+
+def wet_bulb_from_db_rh_array(db_temp, rel_humid, b_press=101325, tolerance=0.001):
+    """Wet bulb temperatures (C) from arrays of temperature (C) and humidity (%).
+
+    Each wet bulb temperature is solved with a Newton method that uses the
+    analytic derivative of the wet bulb humidity ratio equation. It starts from
+    the approximation of Stull (2011) and falls back to bisection whenever a
+    step leaves the bounds between the dew point and the dry bulb temperature.
+    This usually needs 1-2 Newton steps, making it both faster and more accurate
+    than the bisection loop of wet_bulb_from_db_rh.
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        rel_humid: An array of relative humidity values (%).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+        tolerance: The tolerance in degrees C to which the wet bulb temperatures
+            are solved. (Default: 0.001).
+
+    Returns:
+        A list of wet bulb temperatures (C).
+
+    Note:
+        [1] Stull, R. (2011). Wet-Bulb Temperature from Relative Humidity and Air
+        Temperature. Journal of Applied Meteorology and Climatology, 50(11),
+        2267-2269. https://doi.org/10.1175/JAMC-D-11-0143.1
+    """
+    db_temp, rel_humid, b_press = _broadcast_arrays(db_temp, rel_humid, b_press)
+    dew_max_step = _newton_max_step(tolerance, 0.01)
+    max_step = _newton_max_step(tolerance, 0.1)
+    atan, sqrt = math.atan, math.sqrt
+    wet_bulb = []
+    for t, rh, b_p in zip(db_temp, rel_humid, b_press):
+        lo, p_w = _dew_point_and_vapor_pressure(t, rh, dew_max_step)
+        hi = t
+        humid_ratio = (p_w * 0.621945) / (b_p - p_w)
+        wb = t * atan(0.151977 * sqrt(rh + 8.313659)) + atan(t + rh) - \
+            atan(rh - 1.676331) + 0.00391838 * rh ** 1.5 * atan(0.023101 * rh) - \
+            4.686035  # first guess from the approximation of Stull
+        if not lo < wb < hi:
+            wb = (lo + hi) / 2
+        for _ in range(100):  # 100 is the max iterations
+            hr, d_hr = _humid_ratio_from_db_wb(t, wb, b_p, True)
+            if hr > humid_ratio:  # narrow the bounds using the side of the root
+                hi = wb
+            elif hr < humid_ratio:
+                lo = wb
+            else:
+                break
+            new_wb = wb - (hr - humid_ratio) / d_hr if d_hr > 0 else lo
+            if not lo < new_wb < hi:  # bisect when the step leaves the bounds
+                new_wb = (lo + hi) / 2
+            converged = abs(new_wb - wb) <= max_step and (new_wb >= 0) == (wb >= 0)
+            wb = new_wb
+            if converged:
+                break
+        wet_bulb.append(wb)
+    return wet_bulb
+
+
+def wet_bulb_from_db_hr_array(db_temp, humid_ratio, b_press=101325, tolerance=0.001):
+    """Wet bulb temperatures (C) from arrays of temperature (C) and humidity ratio.
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        humid_ratio: An array of humidity ratios (kg water/kg air).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+        tolerance: The tolerance in degrees C to which the wet bulb temperatures
+            are solved. (Default: 0.001).
+
+    Returns:
+        A list of wet bulb temperatures (C).
+    """
+    db_temp, humid_ratio, b_press = _broadcast_arrays(db_temp, humid_ratio, b_press)
+    rh = rel_humid_from_db_hr_array(db_temp, humid_ratio, b_press)
+    return wet_bulb_from_db_rh_array(db_temp, rh, b_press, tolerance)
+
+
+def rel_humid_from_db_hr_array(db_temp, humid_ratio, b_press=101325):
+    """Relative humidity values (%) from arrays of humidity ratio and temperature (C).
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        humid_ratio: An array of humidity ratios (kg water/kg air).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of relative humidity values (%).
+    """
+    return _map_arrays(rel_humid_from_db_hr, db_temp, humid_ratio, b_press)
+
+
+def rel_humid_from_db_enth_array(db_temp, enthalpy, b_press=101325, reference_temp=0):
+    """Relative humidity values (%) from arrays of temperature (C) and enthalpy (kJ/kg).
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        enthalpy: An array of enthalpy values (kJ/kg).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+        reference_temp: Reference dry air temperature (C). Default is 0C.
+
+    Returns:
+        A list of relative humidity values (%).
+    """
+    return _map_arrays(
+        rel_humid_from_db_enth, db_temp, enthalpy, b_press, reference_temp)
+
+
+def rel_humid_from_db_dpt_array(db_temp, dew_pt):
+    """Relative humidity values (%) from arrays of dry bulb and dew point temperature (C).
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        dew_pt: An array of dew point temperatures (C).
+
+    Returns:
+        A list of relative humidity values (%).
+    """
+    return _map_arrays(rel_humid_from_db_dpt, db_temp, dew_pt)
+
+
+def rel_humid_from_db_wb_array(db_temp, wet_bulb, b_press=101325):
+    """Relative humidity values (%) from arrays of dry bulb and wet bulb temperature (C).
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        wet_bulb: An array of wet bulb temperatures (C).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of relative humidity values (%).
+    """
+    return _map_arrays(rel_humid_from_db_wb, db_temp, wet_bulb, b_press)
+
+
+def dew_point_from_db_hr_array(db_temp, humid_ratio, b_press=101325, tolerance=0.001):
+    """Dew point temperatures (C) from arrays of temperature (C) and humidity ratio.
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        humid_ratio: An array of humidity ratios (kg water/kg air).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+        tolerance: The tolerance in degrees C to which the dew point temperatures
+            are solved. (Default: 0.001).
+
+    Returns:
+        A list of dew point temperatures (C).
+    """
+    rh = rel_humid_from_db_hr_array(db_temp, humid_ratio, b_press)
+    return dew_point_from_db_rh_array(db_temp, rh, tolerance)
+
+
+def dew_point_from_db_enth_array(db_temp, enthalpy, b_press=101325, reference_temp=0,
+                                 tolerance=0.001):
+    """Dew point temperatures (C) from arrays of temperature (C) and enthalpy (kJ/kg).
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        enthalpy: An array of enthalpy values (kJ/kg).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+        reference_temp: Reference dry air temperature (C). Default is 0C.
+        tolerance: The tolerance in degrees C to which the dew point temperatures
+            are solved. (Default: 0.001).
+
+    Returns:
+        A list of dew point temperatures (C).
+    """
+    rh = rel_humid_from_db_enth_array(db_temp, enthalpy, b_press, reference_temp)
+    return dew_point_from_db_rh_array(db_temp, rh, tolerance)
+
+
+def dew_point_from_db_wb_array(db_temp, wet_bulb, b_press=101325, tolerance=0.001):
+    """Dew point temperatures (C) from arrays of dry bulb and wet bulb temperature (C).
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        wet_bulb: An array of wet bulb temperatures (C).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+        tolerance: The tolerance in degrees C to which the dew point temperatures
+            are solved. (Default: 0.001).
+
+    Returns:
+        A list of dew point temperatures (C).
+    """
+    rh = rel_humid_from_db_wb_array(db_temp, wet_bulb, b_press)
+    return dew_point_from_db_rh_array(db_temp, rh, tolerance)
+
+
+def humid_ratio_from_db_wb_array(db_temp, wb_temp, b_press=101325):
+    """Humidity ratios from arrays of dry bulb (C) and wet bulb temperature (C).
+
+    Args:
+        db_temp: An array of dry bulb temperatures (C).
+        wb_temp: An array of wet bulb temperatures (C).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of humidity ratios (kg water / kg air).
+    """
+    return _map_arrays(humid_ratio_from_db_wb, db_temp, wb_temp, b_press)
+
+
+def db_temp_from_enth_hr_array(enthalpy, humid_ratio, reference_temp=0):
+    """Dry bulb temperatures (C) from arrays of enthalpy (kJ/kg) and humidity ratio.
+
+    Args:
+        enthalpy: An array of enthalpy values (kJ/kg).
+        humid_ratio: An array of humidity ratios (kg water/kg air).
+        reference_temp: Reference dry air temperature (C). Default is 0C.
+
+    Returns:
+        A list of dry bulb temperatures (C).
+    """
+    return _map_arrays(db_temp_from_enth_hr, enthalpy, humid_ratio, reference_temp)
+
+
+def db_temp_from_rh_hr_array(rel_humid, humid_ratio, b_press=101325):
+    """Dry bulb temperatures (C) from arrays of relative humidity (%) and humidity ratio.
+
+    Args:
+        rel_humid: An array of relative humidity values (%).
+        humid_ratio: An array of humidity ratios (kg water/kg air).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of dry bulb temperatures (C).
+    """
+    return _map_arrays(db_temp_from_rh_hr, rel_humid, humid_ratio, b_press)
+
+
+def db_temp_and_hr_from_wb_rh_array(wb_temp, rel_humid, b_press=101325):
+    """Dry bulb temperatures (C) from arrays of wet bulb temperature (C) and humidity (%).
+
+    Args:
+        wb_temp: An array of wet bulb temperatures (C).
+        rel_humid: An array of relative humidity values (%).
+        b_press: Air pressure (Pa) as a single number or an array. Default is
+            pressure at sea level (101325 Pa).
+
+    Returns:
+        A tuple with two lists.
+
+        -   Dry bulb temperatures (C).
+
+        -   Humidity ratios (kg water/kg air).
+    """
+    db_temp_hr = _map_arrays(db_temp_and_hr_from_wb_rh, wb_temp, rel_humid, b_press)
+    return [val[0] for val in db_temp_hr], [val[1] for val in db_temp_hr]
+
+
+def _map_arrays(function, *inputs):
+    """Map a scalar function over inputs that are broadcast with _broadcast_arrays.
+
+    Args:
+        function: A scalar function of this module.
+        *inputs: The inputs of the function, which can be single numbers or
+            sequences of numbers.
+
+    Returns:
+        A list with the result of the function for each item of the inputs.
+    """
+    return [function(*args) for args in zip(*_broadcast_arrays(*inputs))]
+
+
+def _broadcast_arrays(*inputs):
+    """Get a list of equal-length sequences from a mix of numbers and sequences.
+
+    Args:
+        *inputs: Any number of inputs, which can be single numbers or sequences
+            of numbers. All of the sequences must have the same length.
+
+    Returns:
+        A list with one sequence for each input. Sequence inputs are returned as
+        they are while single numbers are repeated to the length of the sequences.
+        If all inputs are single numbers, each will be returned in a list of one.
+    """
+    length = None
+    for val in inputs:
+        try:
+            val_len = len(val)
+        except TypeError:  # single number to be broadcast
+            continue
+        if length is None:
+            length = val_len
+        else:
+            assert val_len == length, 'Length of input arrays must match ' \
+                'in order to broadcast them together. {} != {}'.format(val_len, length)
+    length = 1 if length is None else length
+    arrays = []
+    for val in inputs:
+        try:
+            len(val)
+            arrays.append(val)
+        except TypeError:  # single number to be broadcast
+            arrays.append([val] * length)
+    return arrays
@@ -102,3 +102,82 @@ def bisect(a, b, fn, epsilon, target):
             return -999
 
     return midpoint
+
+
+def newton_array(x0, fn, epsilon, lower=None, upper=None, max_iter=100):
+    """Find the roots of many continuous functions at once with Newton's method.
+
+    All of the roots are solved together such that each iteration makes a single
+    call to fn with every value that has not yet converged. This makes it
+    possible to evaluate the function for many values in one loop instead of
+    calling a scalar root-finding function over and over. If lower and upper
+    bounds are provided for each root, any Newton step that leaves the bounds
+    is replaced with a bisection step, which makes the method as reliable as
+    bisect() while usually converging in only 3-5 iterations. A ValueError is
+    raised if a step cannot be taken for a root because its derivative is zero
+    (or its Newton step leaves one of its bounds) and it is not bracketed by
+    both a lower and an upper bound.
+
+    Args:
+        x0: A list of first guesses for each of the roots.
+        fn: A function representing the relationship between the values you are
+            trying to find and the target condition you are trying to satisfy.
+            It must accept two lists as arguments. The first is the indices of
+            the roots being evaluated and the second is the current estimates of
+            those roots. It must return a tuple with two lists. The first is the
+            difference between the function value and its target for each
+            estimate (typically funct(value) - target_desired_from_funct) and
+            the second is the derivative of the function at each estimate.
+        epsilon: The acceptable error in the values you are trying to find.
+            A root is considered found once a Newton step changes it by
+            less than this value.
+        lower: An optional list of lower bounds for each of the roots. If None,
+            the Newton steps are unbounded from below. (Default: None).
+        upper: An optional list of upper bounds for each of the roots. If None,
+            the Newton steps are unbounded from above. (Default: None).
+        max_iter: The maximum number of iterations after which the current
+            estimates are returned for any roots that have not converged. (Default: 100).
+
+    Returns:
+        roots -- A list of values that give the target_desired_from_funct.
+
+    References
+    ----------
+    [1] Wikipedia contributors. Newton's method. In Wikipedia, The Free
+    Encyclopedia. https://en.wikipedia.org/wiki/Newton%27s_method
+    """
+    roots = list(x0)
+    lower = [None] * len(roots) if lower is None else list(lower)
+    upper = [None] * len(roots) if upper is None else list(upper)
+    active = list(range(len(roots)))
+    for _ in range(max_iter):
+        if not active:
+            break
+        residuals, derivatives = fn(active, [roots[i] for i in active])
+        still_active = []
+        for i, f_x, df_x in zip(active, residuals, derivatives):
+            x = roots[i]
+            if f_x == 0:
+                continue
+            lo, hi = lower[i], upper[i]
+            if df_x != 0:  # narrow the bounds using the side of the root we are on
+                if (f_x > 0) == (df_x > 0):
+                    hi = upper[i] = x if hi is None or x < hi else hi
+                else:
+                    lo = lower[i] = x if lo is None or x > lo else lo
+                new_x = x - f_x / df_x
+            else:
+                new_x = None
+            if new_x is None or (lo is not None and new_x <= lo) or \
+                    (hi is not None and new_x >= hi):
+                if lo is None or hi is None:  # no bracket to fall back on
+                    raise ValueError(
+                        'Newton step for root {} from {} failed because the '
+                        'derivative is {} and the root is not bracketed by a '
+                        'lower and upper bound.'.format(i, x, df_x))
+                new_x = (lo + hi) / 2
+            roots[i] = new_x
+            if abs(new_x - x) > epsilon:
+                still_active.append(i)
+        active = still_active
+    return roots
@@ -2,9 +2,11 @@
 from __future__ import division
 """Functions for computing radiation for different idealized skies"""
 
-from .psychrometrics import dew_point_from_db_rh
+from .psychrometrics import dew_point_from_db_rh_array
 
 import math
+from bisect import bisect_left, bisect_right
+from itertools import repeat
 try:  # python 2
     from itertools import izip as zip
 except ImportError:  # python 3
@@ -13,6 +15,13 @@ except ImportError:  # python 3
 
 """ORIGINAL AHSRAE CLEAR SKY SOLAR MODEL"""
 
+# apparent solar irradiation at air mass m = 0 for each month
+ASHRAE_MONTHLY_A = (1202, 1187, 1164, 1130, 1106, 1092, 1093, 1107, 1136,
+                    1166, 1190, 1204)
+# atmospheric extinction coefficient for each month
+ASHRAE_MONTHLY_B = (0.141, 0.142, 0.149, 0.164, 0.177, 0.185, 0.186, 0.182,
+                    0.165, 0.152, 0.144, 0.141)
+
 
 def ashrae_clear_sky(altitudes, month, sky_clearness=1):
     """Calculate solar flux for an original ASHRAE Clear Sky.
@@ -41,27 +50,65 @@ def ashrae_clear_sky(altitudes, month, sky_clearness=1):
         -   dif_horiz_rad: A list of diffuse horizontall radiation values for each
             of the connected altitudes in W/m2.
     """
-    # apparent solar irradiation at air mass m = 0
-    MONTHLY_A = [1202, 1187, 1164, 1130, 1106, 1092, 1093, 1107, 1136,
-                 1166, 1190, 1204]
-    # atmospheric extinction coefficient
-    MONTHLY_B = [0.141, 0.142, 0.149, 0.164, 0.177, 0.185, 0.186, 0.182,
-                 0.165, 0.152, 0.144, 0.141]
+    coefficients = [(ASHRAE_MONTHLY_A[month - 1], ASHRAE_MONTHLY_B[month - 1])]
+    return _ashrae_clear_sky(altitudes, repeat(0), coefficients, sky_clearness)
+
+
+def ashrae_clear_sky_monthly(altitudes, months, sky_clearness=1):
+    """Calculate solar flux for an original ASHRAE Clear Sky over several months.
+
+    This is the same as the ashrae_clear_sky function but each altitude can
+    belong to a different month, which allows the radiation over a whole
+    year to be computed in a single pass.
+
+    Args:
+        altitudes: A list of solar altitudes in degrees
+        months: A list of integers (1-12) with the month to which each of
+            the altitudes belongs. This must have the same length as altitudes.
+        sky_clearness: A factor that will be multiplied by the output of
+            the model. (Default: 1).
+
+    Returns:
+        A tuple with two elements
+
+        -   dir_norm_rad: A list of direct normal radiation values for each
+            of the connected altitudes in W/m2.
+
+        -   dif_horiz_rad: A list of diffuse horizontall radiation values for each
+            of the connected altitudes in W/m2.
+    """
+    assert len(altitudes) == len(months), 'Length of altitudes ({}) does not ' \
+        'match the length of months ({}).'.format(len(altitudes), len(months))
+    coefficients = list(zip(ASHRAE_MONTHLY_A, ASHRAE_MONTHLY_B))
+    return _ashrae_clear_sky(altitudes, [m - 1 for m in months], coefficients,
+                             sky_clearness)
+
+
+def _ashrae_clear_sky(altitudes, indices, coefficients, sky_clearness):
+    """Compute the original ASHRAE Clear Sky using a table of coefficients.
 
+    Args:
+        altitudes: A list of solar altitudes in degrees
+        indices: A list with the index of the coefficients used for each altitude.
+        coefficients: A list of tuples with the apparent solar irradiation at
+            air mass 0 and the atmospheric extinction coefficient.
+        sky_clearness: A factor that will be multiplied by the output of the model.
+    """
     dir_norm_rad = []
     dif_horiz_rad = []
-    for i, alt in enumerate(altitudes):
+    for alt, i in zip(altitudes, indices):
         if alt > 0:
+            a_coeff, b_coeff = coefficients[i]
+            sin_alt = math.sin(math.radians(alt))
             try:
-                dir_norm = MONTHLY_A[month - 1] / (math.exp(
-                    MONTHLY_B[month - 1] / (math.sin(math.radians(alt)))))
-                diff_horiz = 0.17 * dir_norm * math.sin(math.radians(alt))
-                dir_norm_rad.append(dir_norm * sky_clearness)
-                dif_horiz_rad.append(diff_horiz * sky_clearness)
+                dir_norm = a_coeff / math.exp(b_coeff / sin_alt)
             except OverflowError:
                 # very small altitude values
                 dir_norm_rad.append(0)
                 dif_horiz_rad.append(0)
+                continue
+            dir_norm_rad.append(dir_norm * sky_clearness)
+            dif_horiz_rad.append(0.17 * dir_norm * sin_alt * sky_clearness)
         else:
             # night time
             dir_norm_rad.append(0)
@@ -100,19 +147,71 @@ def ashrae_revised_clear_sky(altitudes, tb, td, use_2017_model=False):
         -   dif_horiz_rad: A list of diffuse horizontall radiation values for each
             of the connected altitudes in W/m2.
     """
-    dir_norm_rad = []
-    dif_horiz_rad = []
+    coefficients = [_tau_coefficients(tb, td, use_2017_model)]
+    return _ashrae_revised_clear_sky(altitudes, repeat(0), coefficients)
+
+
+def ashrae_revised_clear_sky_monthly(altitudes, months, monthly_tau_beam,
+                                     monthly_tau_diffuse, use_2017_model=False):
+    """Calculate solar flux for an ASHRAE Revised Clear Sky over several months.
+
+    This is the same as the ashrae_revised_clear_sky function but each altitude
+    can belong to a different month, which allows the radiation over a whole
+    year to be computed in a single pass.
+
+    Args:
+        altitudes: A list of solar altitudes in degrees.
+        months: A list of integers (1-12) with the month to which each of
+            the altitudes belongs. This must have the same length as altitudes.
+        monthly_tau_beam: A list of 12 values indicating the beam optical depth
+            of the sky at each month of the year.
+        monthly_tau_diffuse: A list of 12 values indicating the diffuse optical
+            depth of the sky at each month of the year.
+        use_2017_model: Set to True to use coefficients associated with
+            the new version of the Tau model released in the 2013 and 2017 HOF.
+            (Default: False).
+
+    Returns:
+        A tuple with two elements
+
+        -   dir_norm_rad: A list of direct normal radiation values for each
+            of the connected altitudes in W/m2.
 
+        -   dif_horiz_rad: A list of diffuse horizontall radiation values for each
+            of the connected altitudes in W/m2.
+    """
+    assert len(altitudes) == len(months), 'Length of altitudes ({}) does not ' \
+        'match the length of months ({}).'.format(len(altitudes), len(months))
+    coefficients = [_tau_coefficients(tb, td, use_2017_model)
+                    for tb, td in zip(monthly_tau_beam, monthly_tau_diffuse)]
+    return _ashrae_revised_clear_sky(altitudes, [m - 1 for m in months], coefficients)
+
+
+def _tau_coefficients(tb, td, use_2017_model=False):
+    """Get a tuple of (tb, td, ab, ad) coefficients for the ASHRAE Tau model."""
     if use_2017_model:
         ab = 1.454 - (0.406 * tb) - (0.268 * td) - (0.021 * tb * td)
         ad = 0.507 + (0.205 * tb) - (0.080 * td) - (0.190 * tb * td)
     else:
         ab = 1.219 - (0.043 * tb) - (0.151 * td) - (0.204 * tb * td)
         ad = 0.202 + (0.852 * tb) - (0.007 * td) - (0.357 * tb * td)
+    return tb, td, ab, ad
 
-    # compute hourly radiation
-    for alt in altitudes:
+
+def _ashrae_revised_clear_sky(altitudes, indices, coefficients):
+    """Compute the ASHRAE Revised Clear Sky using a table of coefficients.
+
+    Args:
+        altitudes: A list of solar altitudes in degrees.
+        indices: A list with the index of the coefficients used for each altitude.
+        coefficients: A list of tuples with the (tb, td, ab, ad) coefficients
+            of the model, as returned by the _tau_coefficients function.
+    """
+    dir_norm_rad = []
+    dif_horiz_rad = []
+    for alt, i in zip(altitudes, indices):
         if alt > 0:
+            tb, td, ab, ad = coefficients[i]
             # calculate hourly air mass between top of the atmosphere and earth
             air_mass = get_relative_airmass(alt)
             dir_norm_rad.append(1415 * math.exp(-tb * math.pow(air_mass, ab)))
@@ -179,6 +278,37 @@ def zhang_huang_solar(alt, cloud_cover, relative_humidity,
     return glob_ir
 
 
+def zhang_huang_solar_array(altitudes, cloud_cover, relative_humidity,
+                            dry_bulb_present, dry_bulb_t3_hrs, wind_speed,
+                            irr_0=1355):
+    """Calculate global horizontal solar irradiance for arrays of Zhang-Huang inputs.
+
+    This is a convenience function that calls zhang_huang_solar for each
+    item of the input lists.
+
+    Args:
+        altitudes: A list of solar altitudes in degrees.
+        cloud_cover: A list of float values between 0 and 10 that represents
+            cloud cover in tenths (0 = clear; 10 = completely overcast)
+        relative_humidity: A list of float values between 0 and 100 that
+            represents the relative humidity in percent.
+        dry_bulb_present: A list of float values that represents the dry bulb
+            temperature at the time of interest (in degrees C).
+        dry_bulb_t3_hrs: A list of float values that represents the dry bulb
+            temperature at three hours before the time of interest (in degrees C).
+        wind_speed: A list of float values that represents the wind speed in m/s.
+        irr_0 = Optional extraterrestrial solar constant (W/m2).
+            Default is to use the average value over the earth's orbit (1355).
+
+    Returns:
+        A list of global horizontall radiation values in W/m2.
+    """
+    return [zhang_huang_solar(alt, cc, rh, n_temp, n3_temp, w_spd, irr_0)
+            for alt, cc, rh, n_temp, n3_temp, w_spd in zip(
+                altitudes, cloud_cover, relative_humidity, dry_bulb_present,
+                dry_bulb_t3_hrs, wind_speed)]
+
+
 def zhang_huang_solar_split(altitudes, doys, cloud_cover, relative_humidity,
                             dry_bulb_present, dry_bulb_t3_hrs, wind_speed,
                             atm_pressure, use_disc=False):
@@ -214,16 +344,13 @@ def zhang_huang_solar_split(altitudes, doys, cloud_cover, relative_humidity,
             of the connected altitudes in W/m2.
     """
     # Calculate global horizontal irradiance using the original zhang-huang model
-    glob_ir = []
-    for i in xrange(len(altitudes)):
-        ghi = zhang_huang_solar(altitudes[i], cloud_cover[i], relative_humidity[i],
-                                dry_bulb_present[i], dry_bulb_t3_hrs[i], wind_speed[i])
-        glob_ir.append(ghi)
+    glob_ir = zhang_huang_solar_array(
+        altitudes, cloud_cover, relative_humidity, dry_bulb_present,
+        dry_bulb_t3_hrs, wind_speed)
 
     if not use_disc:
         # Calculate dew point temperature to improve the splitting of direct + diffuse
-        temp_dew = [dew_point_from_db_rh(dry_bulb_present[i], relative_humidity[i])
-                    for i in xrange(len(glob_ir))]
+        temp_dew = dew_point_from_db_rh_array(dry_bulb_present, relative_humidity)
 
         # Split global rad into direct + diffuse using dirint method (aka. Perez split)
         dir_norm_rad = dirint(glob_ir, altitudes, doys, atm_pressure,
@@ -512,10 +639,10 @@ def dirint(ghi, altitudes, doys, pressures, use_delta_kt_prime=True,
     # calculate kt_prime values
     kt_primes = []
     disc_dni = []
+    extra_rad = {}  # extraterrestrial radiation is the same for every hour of a day
     for i in xrange(len(ghi)):
-        dni, kt, airmass = disc(ghi[i], altitudes[i], doys[i], pressure=pressures[i],
-                                min_sin_altitude=min_sin_altitude,
-                                min_altitude=min_altitude)
+        dni, kt, airmass = _disc(ghi[i], altitudes[i], doys[i], pressures[i],
+                                 min_sin_altitude, min_altitude, 12, extra_rad)
         kt_prime = clearness_index_zenith_independent(
             kt, airmass, max_clearness_index=1)
         kt_primes.append(kt_prime)
@@ -569,47 +696,22 @@ def _dirint_bins(ktp, alt, w, dktp):
     Returns:
         tuple of ktp_bin, alt_bin, w_bin, dktp_bin
     """
-    it = xrange(len(ktp))
-
-    # Create kt_prime bins
-    ktp_bin = [-1] * len(ktp)
-    ktp_bin = [0 if ktp[i] >= 0 and ktp[i] < 0.24 else ktp_bin[i] for i in it]
-    ktp_bin = [1 if ktp[i] >= 0.24 and ktp[i] < 0.4 else ktp_bin[i] for i in it]
-    ktp_bin = [2 if ktp[i] >= 0.4 and ktp[i] < 0.56 else ktp_bin[i] for i in it]
-    ktp_bin = [3 if ktp[i] >= 0.56 and ktp[i] < 0.7 else ktp_bin[i] for i in it]
-    ktp_bin = [4 if ktp[i] >= 0.7 and ktp[i] < 0.8 else ktp_bin[i] for i in it]
-    ktp_bin = [5 if ktp[i] >= 0.8 and ktp[i] <= 1 else ktp_bin[i] for i in it]
-
-    # Create altitude angle bins
-    alt_bin = [-1] * len(alt)
-    alt_bin = [0 if alt[i] <= 90 and alt[i] > 65 else alt_bin[i] for i in it]
-    alt_bin = [1 if alt[i] <= 65 and alt[i] > 50 else alt_bin[i] for i in it]
-    alt_bin = [2 if alt[i] <= 50 and alt[i] > 35 else alt_bin[i] for i in it]
-    alt_bin = [3 if alt[i] <= 35 and alt[i] > 20 else alt_bin[i] for i in it]
-    alt_bin = [4 if alt[i] <= 20 and alt[i] > 10 else alt_bin[i] for i in it]
-    alt_bin = [5 if alt[i] <= 10 else alt_bin[i] for i in it]
-
-    # Create the bins for w based on dew point temperature
-    w_bin = [-1] * len(w)
-    w_bin = [0 if w[i] >= 0 and w[i] < 1 else w_bin[i] for i in it]
-    w_bin = [1 if w[i] >= 1 and w[i] < 2 else w_bin[i] for i in it]
-    w_bin = [2 if w[i] >= 2 and w[i] < 3 else w_bin[i] for i in it]
-    w_bin = [3 if w[i] >= 3 else w_bin[i] for i in it]
-    w_bin = [4 if w[i] == -1 else w_bin[i] for i in it]
-
-    # Create delta_kt_prime binning.
-    dktp_bin = [-1] * len(dktp)
-    dktp_bin = [0 if dktp[i] >= 0 and dktp[i] < 0.015 else dktp_bin[i] for i in it]
-    dktp_bin = [1 if dktp[i] >= 0.015 and dktp[i] < 0.035 else dktp_bin[i] for i in it]
-    dktp_bin = [2 if dktp[i] >= 0.035 and dktp[i] < 0.07 else dktp_bin[i] for i in it]
-    dktp_bin = [3 if dktp[i] >= 0.07 and dktp[i] < 0.15 else dktp_bin[i] for i in it]
-    dktp_bin = [4 if dktp[i] >= 0.15 and dktp[i] < 0.3 else dktp_bin[i] for i in it]
-    dktp_bin = [5 if dktp[i] >= 0.3 and dktp[i] <= 1 else dktp_bin[i] for i in it]
-    dktp_bin = [6 if dktp[i] == -1 else dktp_bin[i] for i in it]
-
+    ktp_bin = [bisect_right(_KTP_EDGES, v) if 0 <= v <= 1 else -1 for v in ktp]
+    alt_bin = [5 - bisect_left(_ALT_EDGES, v) if v <= 90 else -1 for v in alt]
+    w_bin = [bisect_right(_W_EDGES, v) if v >= 0 else (4 if v == -1 else -1)
+             for v in w]
+    dktp_bin = [bisect_right(_DKTP_EDGES, v) if 0 <= v <= 1 else
+                (6 if v == -1 else -1) for v in dktp]
     return ktp_bin, alt_bin, w_bin, dktp_bin
 
 
+# inner edges of the bins for the DIRINT coefficients
+_KTP_EDGES = (0.24, 0.4, 0.56, 0.7, 0.8)
+_ALT_EDGES = (10, 20, 35, 50, 65)
+_W_EDGES = (1, 2, 3)
+_DKTP_EDGES = (0.015, 0.035, 0.07, 0.15, 0.3)
+
+
 def disc(ghi, altitude, doy, pressure=101325,
          min_sin_altitude=0.065, min_altitude=3, max_airmass=12):
     """
@@ -671,10 +773,29 @@ def disc(ghi, altitude, doy, pressure=101325,
 
         -   am: Airmass
     """
+    return _disc(ghi, altitude, doy, pressure, min_sin_altitude, min_altitude,
+                 max_airmass)
+
+
+def _disc(ghi, altitude, doy, pressure, min_sin_altitude, min_altitude,
+          max_airmass, extra_radiation=None):
+    """Estimate direct normal irradiance with the DISC model.
+
+    Args:
+        extra_radiation: An optional dictionary of extraterrestrial radiation
+            values by day of the year, which is used to look up (and store)
+            the value for the doy.
+    """
     if altitude > min_altitude and ghi > 0:
         # this is the I0 calculation from the reference
         # SSC uses solar constant = 1367.0 (checked 2018 08 15)
-        I0 = get_extra_radiation(doy, 1370.)
+        if extra_radiation is None:
+            I0 = get_extra_radiation(doy, 1370.)
+        else:
+            try:
+                I0 = extra_radiation[doy]
+            except KeyError:
+                I0 = extra_radiation[doy] = get_extra_radiation(doy, 1370.)
 
         kt = clearness_index(ghi, altitude, I0, min_sin_altitude=min_sin_altitude,
                              max_clearness_index=1)
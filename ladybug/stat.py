@@ -27,6 +27,10 @@ class STAT(object):
 
     Args:
         file_path: Address to a local .stat file.
+        lazy: Boolean to note whether the sections of the file should only be
+            parsed once a property that relies upon them is requested. Setting
+            this to True is useful when only a few properties are needed from
+            many .stat files. (Default: False).
 
     Properties:
         * location
@@ -82,23 +86,18 @@ class STAT(object):
                                    r"\s*(\w{3})\s*(\d{1,2}):\s*(\w{3})\s*(\d{1,2}),")
     _typweek_pattern = re.compile(r"(\S*)\s*Typical Week Period selected:"
                                   r"\s*(\w{3})\s*(\d{1,2}):\s*(\w{3})\s*(\d{1,2}),")
-    _heat_pattern = re.compile(r"Heating\s(\d.*)")
-    _cool_pattern = re.compile(r"Cooling\s(\d.*)")
-    _tau_beam_pattern = re.compile(r"taub \(beam\)(.*)")
-    _tau_diffuse_pattern = re.compile(r"taud \(diffuse\)(.*)")
-    _db_50_pattern = re.compile(r"Drybulb 5.0%(.*)")
-    _wb_50_pattern = re.compile(r"Coincident Wetbulb 5.0%(.*)")
-    _db_100_pattern = re.compile(r"Drybulb 10.%(.*)")
-    _wb_100_pattern = re.compile(r"Coincident Wetbulb 10.%(.*)")
-    _db_20_pattern = re.compile(r"Drybulb 2.0%(.*)")
-    _wb_20_pattern = re.compile(r"Coincident Wetbulb 2.0%(.*)")
-    _db_04_pattern = re.compile(r"Drybulb 0.4%(.*)")
-    _wb_04_pattern = re.compile(r"Coincident Wetbulb 0.4%(.*)")
-    _db_range_50_pattern = re.compile(r"Drybulb range - DB 5%(.*)")
-    _wb_range_50_pattern = re.compile(r"Wetbulb range - DB 5%(.*)")
-    _winds_pattern = re.compile(r"Monthly Statistics for Wind Speed[\s\S]*Daily Avg(.*)")
-    _windd_patterns = tuple(re.compile(
-        r"Monthly Wind Direction %[\s\S]*" + dir + r"\s(.*)") for dir in _wind_dir_names)
+    # keywords in the headers of the sections of the file holding each data set
+    _design_section = 'Displaying Design Conditions from'
+    _tau_section = 'Optical Sky Depth'
+    _monthly_section = 'Coincident Wetbulb Temperatures'
+    _range_section = 'Wetbulb Daily Ranges'
+    _windd_section = 'Monthly Wind Direction %'
+    _winds_section = 'Monthly Statistics for Wind Speed'
+    _climate_section = 'Climate type'
+    _weeks_section = 'Typical/Extreme Period'
+    # groups of properties that can be parsed from the sections of the file
+    _section_groups = ('climate_zones', 'weeks', 'design_days', 'tau',
+                       'monthly_design', 'daily_ranges', 'wind_speed', 'wind_dirs')
 
     __slots__ = ('_file_path', '_winter_des_day_dict', '_summer_des_day_dict',
                  '_monthly_wind_dirs', '_location', '_ashrae_climate_zone',
@@ -107,9 +106,9 @@ class STAT(object):
                  '_monthly_wb_range_50', '_monthly_db_100', '_monthly_wb_100', '_monthly_db_20',
                  '_monthly_wb_20', '_monthly_db_04', '_monthly_wb_04', '_monthly_wind',
                  '_stand_press_at_elev', '_monthly_tau_beam', '_monthly_tau_diffuse',
-                 '_header', '_body')
+                 '_header', '_sections', '_unparsed_sections')
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, lazy=False):
         """Initialize the class.
         """
         if file_path is not None:
@@ -124,10 +123,14 @@ class STAT(object):
         self._winter_des_day_dict = {}
         self._summer_des_day_dict = {}
         self._monthly_wind_dirs = []
+        self._sections = []
+        self._unparsed_sections = set()
 
         # import the data from the file
         if file_path is not None:
             self._import_data()
+            if not lazy:
+                self._load_sections()
 
     @classmethod
     def from_dict(cls, data):
@@ -252,7 +255,6 @@ class STAT(object):
             line = statwin.readline()
             # import header with location
             self._header = [line] + [statwin.readline() for i in xrange(9)]
-            self._body = statwin.read()
         except Exception as e:
             import traceback
             raise Exception('{}\n{}'.format(e, traceback.format_exc()))
@@ -292,47 +294,11 @@ class STAT(object):
             self._location.time_zone = time_zone
             self._location.elevation = elevation
 
-            # pull out individual properties
+            # pull out the standard pressure and split the body into sections
             self._stand_press_at_elev = self._regex_check(
                 self._press_pattern, self._header[5])
-            self._ashrae_climate_zone = self._regex_check(
-                self._ashraecz_pattern, self._body)
-            self._koppen_climate_zone = self._regex_check(
-                self._koppencz_pattern, self._body)
-
-            # pull out extreme and seasonal weeks.
-            self._extreme_hot_week = self._regex_week_parse(self._hotweek_pattern)
-            self._extreme_cold_week = self._regex_week_parse(self._coldweek_pattern)
-            self._typical_weeks = self._regex_typical_week_parse()
-
-            # pull out annual design days
-            winter_vals = self._regex_parse(self._heat_pattern)
-            for key, val in zip(DesignDay.HEATING_KEYS, winter_vals):
-                self._winter_des_day_dict[key] = val
-            summer_vals = self._regex_parse(self._cool_pattern)
-            for key, val in zip(DesignDay.COOLING_KEYS, summer_vals):
-                self._summer_des_day_dict[key] = val
-
-            # Pull out relevant monthly information
-            self._monthly_tau_beam = self._regex_parse(self._tau_beam_pattern)
-            self._monthly_tau_diffuse = self._regex_parse(self._tau_diffuse_pattern)
-            self._monthly_db_50 = self._regex_parse(self._db_50_pattern)
-            self._monthly_wb_50 = self._regex_parse(self._wb_50_pattern)
-            self._monthly_db_100 = self._regex_parse(self._db_100_pattern)
-            self._monthly_wb_100 = self._regex_parse(self._wb_100_pattern)
-            self._monthly_db_20 = self._regex_parse(self._db_20_pattern)
-            self._monthly_wb_20 = self._regex_parse(self._wb_20_pattern)
-            self._monthly_db_04 = self._regex_parse(self._db_04_pattern)
-            self._monthly_wb_04 = self._regex_parse(self._wb_04_pattern)
-            self._monthly_db_range_50 = self._regex_parse(self._db_range_50_pattern)
-            self._monthly_wb_range_50 = self._regex_parse(self._wb_range_50_pattern)
-            self._monthly_wind = self._regex_parse(self._winds_pattern)
-            for direction in self._windd_patterns:
-                dirs = self._regex_parse(direction)
-                if dirs != []:
-                    self._monthly_wind_dirs.append(dirs)
-            if self._monthly_wind_dirs == []:
-                self._monthly_wind_dirs = [[0] * 12 for i in xrange(8)]
+            self._sections = self._split_sections(statwin.read().split('\n'))
+            self._unparsed_sections = set(self._section_groups)
 
         finally:
             statwin.close()
@@ -360,16 +326,16 @@ class STAT(object):
         else:
             return None
 
-    def _regex_week_parse(self, regex_pattern):
-        matches = regex_pattern.findall(self._body)
+    def _regex_week_parse(self, regex_pattern, search_space):
+        matches = regex_pattern.findall(search_space)
         if len(matches) > 0:
             return self._regex_week(matches[0])
         else:
             return None
 
-    def _regex_typical_week_parse(self):
+    def _regex_typical_week_parse(self, search_space):
         typ_weeks = {'other': []}
-        matches = self._typweek_pattern.findall(self._body)
+        matches = self._typweek_pattern.findall(search_space)
         for match in matches:
             a_per = self._regex_week(match[1:])
             if 'winter' in match[0]:
@@ -384,19 +350,170 @@ class STAT(object):
                 typ_weeks['other'].append(a_per)
         return typ_weeks
 
-    def _regex_parse(self, regex_pattern):
-        matches = regex_pattern.findall(self._body)
-        if len(matches) > 0:
-            raw_txt = matches[0].strip().split('\t')
-            try:
-                return [float(i) if i != 'N' else None for i in raw_txt]
-            except ValueError:
-                return [str(i) for i in raw_txt]
-        else:
+    @staticmethod
+    def _parse_values(raw_txt):
+        """Parse the tab-separated values of a row in the stat file."""
+        raw_txt = raw_txt.strip().split('\t')
+        try:
+            return [float(i) if i != 'N' else None for i in raw_txt]
+        except ValueError:
+            return [str(i) for i in raw_txt]
+
+    @staticmethod
+    def _split_sections(lines):
+        """Split the lines of the body of a stat file into sections in one pass.
+
+        Each section starts with a run of header lines beginning with " - " and
+        includes all of the following lines up to the next header.
+
+        Args:
+            lines: An iterable of text lines for the body of the stat file.
+
+        Returns:
+            A list of tuples with one tuple for each section. Each tuple contains
+            the text of the section header followed by a list of the lines of
+            the section (including the header lines).
+        """
+        sections = []
+        header, sect_lines = [], []
+        for line in lines:
+            line = line.rstrip('\r\n')
+            if line.startswith(' - '):
+                if len(sect_lines) != len(header):  # start of a new section
+                    sections.append(('\n'.join(header), sect_lines))
+                    header, sect_lines = [], []
+                header.append(line[3:])
+            sect_lines.append(line)
+        if len(sect_lines) != 0:
+            sections.append(('\n'.join(header), sect_lines))
+        return sections
+
+    def _section_text(self, keyword, to_end=False):
+        """Get the text of all sections with a keyword in their header.
+
+        Args:
+            keyword: Text to be found in the section header.
+            to_end: Boolean to note whether all of the sections following the
+                first matched section should be included. (Default: False).
+        """
+        sect_lines = []
+        for i, (header, lines) in enumerate(self._sections):
+            if keyword in header:
+                if to_end:
+                    for _, end_lines in self._sections[i:]:
+                        sect_lines.extend(end_lines)
+                    break
+                sect_lines.extend(lines)
+        return '\n'.join(sect_lines)
+
+    def _section_rows(self, keyword):
+        """Get a dictionary of the rows in the table of the first matched section.
+
+        Args:
+            keyword: Text to be found in the section header.
+
+        Returns:
+            A dictionary with the row labels as keys and the text of the row
+            values as values. If a label is repeated in the section, only the
+            first row is included.
+        """
+        rows = {}
+        for header, lines in self._sections:
+            if keyword in header:
+                for line in lines:
+                    row = line.split('\t', 2)
+                    if len(row) == 3:
+                        label = row[1].strip()
+                        if label not in rows:
+                            rows[label] = row[2]
+                break
+        return rows
+
+    def _row_values(self, rows, label):
+        """Get the parsed values of a row from a dictionary of section rows."""
+        try:
+            return self._parse_values(rows[label])
+        except KeyError:
             return []
 
+    def _load_sections(self, *groups):
+        """Parse groups of properties from the sections of the file if not yet parsed.
+
+        Args:
+            *groups: Names of the groups of properties to be parsed. These
+                can be any of the items in the _section_groups. If no names are
+                input, all remaining groups will be parsed.
+        """
+        if len(self._unparsed_sections) == 0:
+            return
+        for group in groups or self._section_groups:
+            if group in self._unparsed_sections:
+                self._unparsed_sections.remove(group)
+                getattr(self, '_parse_{}'.format(group))()
+        if len(self._unparsed_sections) == 0:
+            self._sections = []  # all data has been parsed; release the text
+
+    def _parse_climate_zones(self):
+        search_space = self._section_text(self._climate_section)
+        self._ashrae_climate_zone = self._regex_check(
+            self._ashraecz_pattern, search_space)
+        self._koppen_climate_zone = self._regex_check(
+            self._koppencz_pattern, search_space)
+
+    def _parse_weeks(self):
+        search_space = self._section_text(self._weeks_section, True)
+        self._extreme_hot_week = self._regex_week_parse(
+            self._hotweek_pattern, search_space)
+        self._extreme_cold_week = self._regex_week_parse(
+            self._coldweek_pattern, search_space)
+        self._typical_weeks = self._regex_typical_week_parse(search_space)
+
+    def _parse_design_days(self):
+        rows = self._section_rows(self._design_section)
+        winter_vals = self._row_values(rows, 'Heating')
+        for key, val in zip(DesignDay.HEATING_KEYS, winter_vals):
+            self._winter_des_day_dict[key] = val
+        summer_vals = self._row_values(rows, 'Cooling')
+        for key, val in zip(DesignDay.COOLING_KEYS, summer_vals):
+            self._summer_des_day_dict[key] = val
+
+    def _parse_tau(self):
+        rows = self._section_rows(self._tau_section)
+        self._monthly_tau_beam = self._row_values(rows, 'taub (beam)')
+        self._monthly_tau_diffuse = self._row_values(rows, 'taud (diffuse)')
+
+    def _parse_monthly_design(self):
+        rows = self._section_rows(self._monthly_section)
+        self._monthly_db_50 = self._row_values(rows, 'Drybulb 5.0%')
+        self._monthly_wb_50 = self._row_values(rows, 'Coincident Wetbulb 5.0%')
+        self._monthly_db_100 = self._row_values(rows, 'Drybulb 10.%')
+        self._monthly_wb_100 = self._row_values(rows, 'Coincident Wetbulb 10.%')
+        self._monthly_db_20 = self._row_values(rows, 'Drybulb 2.0%')
+        self._monthly_wb_20 = self._row_values(rows, 'Coincident Wetbulb 2.0%')
+        self._monthly_db_04 = self._row_values(rows, 'Drybulb 0.4%')
+        self._monthly_wb_04 = self._row_values(rows, 'Coincident Wetbulb 0.4%')
+
+    def _parse_daily_ranges(self):
+        rows = self._section_rows(self._range_section)
+        self._monthly_db_range_50 = self._row_values(rows, 'Drybulb range - DB 5%')
+        self._monthly_wb_range_50 = self._row_values(rows, 'Wetbulb range - DB 5%')
+
+    def _parse_wind_speed(self):
+        rows = self._section_rows(self._winds_section)
+        self._monthly_wind = self._row_values(rows, 'Daily Avg')
+
+    def _parse_wind_dirs(self):
+        rows = self._section_rows(self._windd_section)
+        for direction in self._wind_dir_names:
+            dirs = self._row_values(rows, direction)
+            if dirs != []:
+                self._monthly_wind_dirs.append(dirs)
+        if self._monthly_wind_dirs == []:
+            self._monthly_wind_dirs = [[0] * 12 for i in xrange(8)]
+
     @property
     def monthly_found(self):
+        self._load_sections('daily_ranges', 'wind_speed')
         if self._monthly_db_range_50 != [] and self._monthly_wb_range_50 != [] \
             and self._monthly_wind != [] \
                 and self._stand_press_at_elev is not None:
@@ -416,6 +533,7 @@ class STAT(object):
         Numbers in the zone denote average temperature (0 = Hottest; 8 = Coldest)
         Letters in the zone denote wetness (A = Humid; B = Dry; C = Marine)
         """
+        self._load_sections('climate_zones')
         return self._ashrae_climate_zone
 
     @property
@@ -426,21 +544,25 @@ class STAT(object):
         classification system and combines average annual and monthly
         temperatures, precipitation, and the seasonality of precipitation.
         """
+        self._load_sections('climate_zones')
         return self._koppen_climate_zone
 
     @property
     def extreme_cold_week(self):
         """AnalysisPeriod for the coldest week within the corresponding EPW."""
+        self._load_sections('weeks')
         return self._extreme_cold_week
 
     @property
     def extreme_hot_week(self):
         """AnalysisPeriod for the hottest week within the corresponding EPW."""
+        self._load_sections('weeks')
         return self._extreme_hot_week
 
     @property
     def typical_winter_week(self):
         """AnalysisPeriod for a typical winter week within the corresponding EPW."""
+        self._load_sections('weeks')
         try:
             return self._typical_weeks['winter']
         except KeyError:
@@ -449,6 +571,7 @@ class STAT(object):
     @property
     def typical_spring_week(self):
         """AnalysisPeriod for a typical spring week within the corresponding EPW."""
+        self._load_sections('weeks')
         try:
             return self._typical_weeks['spring']
         except KeyError:
@@ -457,6 +580,7 @@ class STAT(object):
     @property
     def typical_summer_week(self):
         """AnalysisPeriod for a typical summer week within the corresponding EPW."""
+        self._load_sections('weeks')
         try:
             return self._typical_weeks['summer']
         except KeyError:
@@ -465,6 +589,7 @@ class STAT(object):
     @property
     def typical_autumn_week(self):
         """AnalysisPeriod for a typical autumn week within the corresponding EPW."""
+        self._load_sections('weeks')
         try:
             return self._typical_weeks['autumn']
         except KeyError:
@@ -473,11 +598,13 @@ class STAT(object):
     @property
     def other_typical_weeks(self):
         """List of AnalysisPeriods for typical weeks outside of the seasonal weeks."""
+        self._load_sections('weeks')
         return self._typical_weeks['other']
 
     @property
     def annual_heating_design_day_996(self):
         """A design day object representing the annual 99.6% heating design day."""
+        self._load_sections('design_days')
         if bool(self._winter_des_day_dict):
             return DesignDay.from_ashrae_dict_heating(
                 self._winter_des_day_dict, self.location, False,
@@ -488,6 +615,7 @@ class STAT(object):
     @property
     def annual_heating_design_day_990(self):
         """A design day object representing the annual 99.0% heating design day."""
+        self._load_sections('design_days')
         if bool(self._winter_des_day_dict):
             return DesignDay.from_ashrae_dict_heating(
                 self._winter_des_day_dict, self.location, True,
@@ -498,6 +626,7 @@ class STAT(object):
     @property
     def annual_cooling_design_day_004(self):
         """A design day object representing the annual 0.4% cooling design day."""
+        self._load_sections('design_days', 'tau')
         if bool(self._summer_des_day_dict):
             tau = None
             month_num = int(self._summer_des_day_dict['Month'])
@@ -515,6 +644,7 @@ class STAT(object):
     @property
     def annual_cooling_design_day_010(self):
         """A design day object representing the annual 1.0% cooling design day."""
+        self._load_sections('design_days', 'tau')
         if bool(self._summer_des_day_dict):
             tau = None
             month_num = int(self._summer_des_day_dict['Month'])
@@ -532,6 +662,7 @@ class STAT(object):
     @property
     def monthly_cooling_design_days_050(self):
         """A list of 12 objects representing monthly 5.0% cooling design days."""
+        self._load_sections('monthly_design')
         if not self.monthly_found or self._monthly_db_50 == [] \
                 or self._monthly_wb_50 == []:
             return []
@@ -551,6 +682,7 @@ class STAT(object):
     @property
     def monthly_cooling_design_days_100(self):
         """A list of 12 objects representing monthly 10.0% cooling design days."""
+        self._load_sections('monthly_design')
         if not self.monthly_found or self._monthly_db_100 == [] \
                 or self._monthly_wb_100 == []:
             return []
@@ -570,6 +702,7 @@ class STAT(object):
     @property
     def monthly_cooling_design_days_020(self):
         """A list of 12 objects representing monthly 2.0% cooling design days."""
+        self._load_sections('monthly_design')
         if not self.monthly_found or self._monthly_db_20 == [] \
                 or self._monthly_wb_20 == []:
             return []
@@ -589,6 +722,7 @@ class STAT(object):
     @property
     def monthly_cooling_design_days_004(self):
         """A list of 12 objects representing monthly 0.4% cooling design days."""
+        self._load_sections('monthly_design')
         if not self.monthly_found or self._monthly_db_04 == [] \
                 or self._monthly_wb_04 == []:
             return []
@@ -608,21 +742,25 @@ class STAT(object):
     @property
     def monthly_db_temp_050(self):
         """A list of 12 float values for monthly 5.0% dry bulb temperature."""
+        self._load_sections('monthly_design')
         return self._monthly_db_50
 
     @property
     def monthly_wb_temp_050(self):
         """A list of 12 float values for monthly 5.0% wet bulb temperature."""
+        self._load_sections('monthly_design')
         return self._monthly_wb_50
 
     @property
     def monthly_db_temp_range_050(self):
         """A list of 12 values for monthly ranges of dry bulb temperatures at 5.0%."""
+        self._load_sections('daily_ranges')
         return self._monthly_db_range_50
 
     @property
     def monthly_wb_temp_range_050(self):
         """A list of 12 values for monthly ranges of wet bulb temperatures at 5.0%."""
+        self._load_sections('daily_ranges')
         return self._monthly_wb_range_50
 
     @property
@@ -633,23 +771,27 @@ class STAT(object):
     @property
     def monthly_wind_conditions(self):
         """A list of 12 monthly wind conditions that are used on the design days."""
+        self._load_sections('wind_speed')
         return [WindCondition(x, y) for x, y in zip(
             self._monthly_wind, self.monthly_wind_dirs)]
 
     @property
     def monthly_ws_avg(self):
         """A list of 12 float values for monthly average wind speeds."""
+        self._load_sections('wind_speed')
         return self._monthly_wind
 
     @property
     def monthly_wind_dirs(self):
         """A list of prevailing wind directions for each month."""
+        self._load_sections('wind_dirs')
         mwd = zip(*self._monthly_wind_dirs)
         return [self._wind_dirs[mon.index(max(mon))] for mon in mwd]
 
     @property
     def monthly_clear_sky_conditions(self):
         """A list of 12 monthly clear sky conditions that are used on the design days."""
+        self._load_sections('tau')
         if self._monthly_tau_diffuse is [] or self._monthly_tau_beam is []:
             return [ASHRAEClearSky(Date(i, 21)) for i in xrange(1, 13)]
         return [ASHRAETau(Date(i, 21), x, y) for i, x, y in zip(
@@ -663,6 +805,7 @@ class STAT(object):
         are intended to determine peak solar load and sizing parmeters for
         HVAC systems.
         """
+        self._load_sections('tau')
         return self._monthly_tau_beam
 
     @property
@@ -673,6 +816,7 @@ class STAT(object):
         are intended to determine peak solar load and sizing parmeters for
         HVAC systems.
         """
+        self._load_sections('tau')
         return self._monthly_tau_diffuse
 
     def to_dict(self):
@@ -685,6 +829,7 @@ class STAT(object):
                 else:
                     new_dict[key] = val.to_dict()
             return new_dict
+        self._load_sections()
         return {
             'location': self.location.to_dict(),
             'ashrae_climate_zone': self.ashrae_climate_zone,
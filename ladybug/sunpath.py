@@ -15,6 +15,7 @@ from ladybug_geometry.geometry3d.line import LineSegment3D
 from ladybug_geometry.geometry2d.pointvector import Point2D
 from ladybug_geometry.geometry2d.polyline import Polyline2D
 
+from collections import OrderedDict
 import datetime as py_datetime
 import math
 import sys
@@ -22,6 +23,77 @@ if (sys.version_info > (3, 0)):  # python 3
     xrange = range
 
 
+def _sun_vector_reversed(altitude, azimuth, north_angle=0):
+    """Get an (x, y, z) tuple for the sun_vector_reversed of a solar position.
+
+    This yields the same values as Sun.sun_vector_reversed but it does not
+    create any Vector3D objects, which makes it faster for large numbers of suns.
+
+    Args:
+        altitude: Solar altitude in degrees.
+        azimuth: Solar azimuth in degrees.
+        north_angle: North angle of the sunpath in degrees. (Default: 0).
+    """
+    alt, az = math.radians(altitude), -math.radians(azimuth)
+    y_alt = math.cos(alt)
+    x, y, z = -math.sin(az) * y_alt, math.cos(az) * y_alt, math.sin(alt)
+    if north_angle != 0:
+        north = math.radians(north_angle)
+        cos_n, sin_n = math.cos(north), math.sin(north)
+        x, y = cos_n * x - sin_n * y, sin_n * x + cos_n * y
+    return x, y, z
+
+
+def _solar_positions(sites, analysis_period, is_solar_time=False):
+    """Get the solar positions for several sites over an analysis period.
+
+    The solar geometry at each datetime only depends on the time zone so it is
+    computed once and shared between all of the sites with the same time zone.
+    No daylight saving time is used for any of the sites.
+
+    Args:
+        sites: A list of (latitude, longitude, time_zone) tuples.
+        analysis_period: An AnalysisPeriod for the datetimes of the sun positions.
+        is_solar_time: A boolean to indicate if the datetimes are in solar time.
+
+    Returns:
+        A generator of (altitudes, azimuths, is_daylight_saving) tuples with
+        one for each site.
+    """
+    time_zone_geometries = {}  # solar geometry at each datetime for each time zone
+    datetimes = analysis_period.datetimes
+    is_daylight_saving = (False,) * len(datetimes)
+    for site in sites:
+        sp = Sunpath(*site)
+        sp.is_leap_year = analysis_period.is_leap_year
+        try:
+            geometries = time_zone_geometries[sp.time_zone]
+        except KeyError:
+            geometries = [sp._calculate_solar_geometry(dt) + (dt.float_hour,)
+                          for dt in datetimes]
+            time_zone_geometries[sp.time_zone] = geometries
+
+        altitudes, azimuths = [], []
+        for sol_dec, eq_of_time, hour in geometries:
+            sol_time = sp._calculate_solar_time(hour, eq_of_time, is_solar_time) * 60
+            altitude, azimuth = sp._calculate_altitude_azimuth_from_geometry(
+                sol_dec, sol_time)
+            altitudes.append(altitude)
+            azimuths.append(azimuth)
+        yield tuple(altitudes), tuple(azimuths), is_daylight_saving
+
+
+def _solar_positions_from_dict(shard):
+    """Get the solar positions for a shard of sites with the analysis period as a dict.
+
+    This is used to compute sites in a process pool since a dictionary of the
+    analysis period can be passed between processes.
+    """
+    sites, analysis_period, is_solar_time = shard
+    analysis_period = AnalysisPeriod.from_dict(analysis_period)
+    return list(_solar_positions(sites, analysis_period, is_solar_time))
+
+
 class Sunpath(object):
     """Calculate sun positions and visualize the sun path
 
@@ -65,9 +137,14 @@ class Sunpath(object):
     """
 
     __slots__ = ('_longitude', '_latitude', '_north_angle', '_time_zone',
-                 '_daylight_saving_period', '_is_leap_year')
+                 '_daylight_saving_period', '_is_leap_year', '_solar_geometries')
     PI = math.pi
 
+    # process-wide table of the unit sun positions used to draw sunpath geometry
+    # keys are sunpath configurations and values are tuples of (x, y, z) positions
+    _geometries = OrderedDict()
+    MAXGEOMETRIES = 32
+
     def __init__(self, latitude=0, longitude=0, time_zone=None, north_angle=0,
                  daylight_saving_period=None):
         """Init sunpath.
@@ -78,6 +155,7 @@ class Sunpath(object):
         self.north_angle = north_angle
         self.daylight_saving_period = daylight_saving_period
         self._is_leap_year = False
+        self._solar_geometries = {}  # memo of solar geometry by julian day
 
     @classmethod
     def from_location(cls, location, north_angle=0, daylight_saving_period=None):
@@ -242,6 +320,127 @@ class Sunpath(object):
         Returns:
             A sun object for the input datetime.
         """
+        datetime, altitude, azimuth, is_daylight_saving = \
+            self._calculate_altitude_azimuth(datetime, is_solar_time)
+        return Sun(datetime, altitude, azimuth, is_solar_time, is_daylight_saving,
+                   self.north_angle)
+
+    def calculate_sun_collection(self, datetimes, is_solar_time=False):
+        """Get a SunCollection for an array of datetimes.
+
+        This is much faster than calling calculate_sun_from_date_time for each
+        datetime when there are many of them (eg. all of the hours of a year)
+        since no Sun objects are created unless they are requested from the
+        SunCollection.
+
+        Args:
+            datetimes: An array of ladybug DateTimes, such as the datetimes of
+                an AnalysisPeriod.
+            is_solar_time: A boolean to indicate if the input datetimes are in
+                solar time. (Default: False)
+
+        Returns:
+            A SunCollection for the input datetimes.
+        """
+        sun_dts, altitudes, azimuths, dls = [], [], [], []
+        for dat_tim in datetimes:
+            dat_tim, altitude, azimuth, is_daylight_saving = \
+                self._calculate_altitude_azimuth(dat_tim, is_solar_time)
+            sun_dts.append(dat_tim)
+            altitudes.append(altitude)
+            azimuths.append(azimuth)
+            dls.append(is_daylight_saving)
+        return SunCollection(sun_dts, altitudes, azimuths, is_solar_time, dls,
+                             self.north_angle)
+
+    @staticmethod
+    def calculate_sun_collection_batch(locations, analysis_period=None,
+                                       is_solar_time=False, processes=1):
+        """Get a SunCollection for each of several locations over an analysis period.
+
+        Args:
+            locations: A list of ladybug Location objects or (latitude, longitude,
+                time_zone) tuples with one for each site.
+            analysis_period: An AnalysisPeriod for the datetimes at which sun
+                positions are computed. If None, all of the hours of the year
+                will be used. (Default: None).
+            is_solar_time: A boolean to indicate if the datetimes of the analysis
+                period are in solar time. (Default: False)
+            processes: An integer for the number of processes used to compute
+                the sites. If None, the number of CPUs of the machine will be
+                used. Where process pools are not available (eg. IronPython), all
+                sites are computed in the current process. (Default: 1).
+
+        Returns:
+            A list of SunCollections with one for each of the locations.
+        """
+        return list(Sunpath.iter_sun_collection_batch(
+            locations, analysis_period, is_solar_time, processes))
+
+    @staticmethod
+    def iter_sun_collection_batch(locations, analysis_period=None,
+                                  is_solar_time=False, processes=1):
+        """Get an iterator of SunCollections for several locations.
+
+        SunCollections are yielded in the order of the input locations as soon
+        as they are computed, which makes it possible to write the results of
+        a large number of sites without holding all of them in memory.
+
+        Args:
+            locations: A list of ladybug Location objects or (latitude, longitude,
+                time_zone) tuples with one for each site.
+            analysis_period: An AnalysisPeriod for the datetimes at which sun
+                positions are computed. If None, all of the hours of the year
+                will be used. (Default: None).
+            is_solar_time: A boolean to indicate if the datetimes of the analysis
+                period are in solar time. (Default: False)
+            processes: An integer for the number of processes used to compute
+                the sites. If None, the number of CPUs of the machine will be
+                used. Where process pools are not available (eg. IronPython), all
+                sites are computed in the current process. (Default: 1).
+
+        Yields:
+            A SunCollection for each of the locations.
+        """
+        analysis_period = analysis_period or AnalysisPeriod()
+        sites = [(loc.latitude, loc.longitude, loc.time_zone)
+                 if isinstance(loc, Location) else tuple(loc) for loc in locations]
+        datetimes = analysis_period.datetimes
+
+        # compute the sites, using a process pool if possible
+        try:
+            from multiprocessing import Pool, cpu_count
+        except ImportError:  # IronPython or another environment without processes
+            processes = 1
+        if processes != 1 and len(sites) > 1:
+            processes = processes or cpu_count()
+            shard_size = int(math.ceil(len(sites) / (processes * 2.)))
+            shards = [(sites[i:i + shard_size], analysis_period.to_dict(),
+                       is_solar_time) for i in xrange(0, len(sites), shard_size)]
+            pool = Pool(processes)
+            try:
+                for shard_positions in pool.imap(_solar_positions_from_dict, shards):
+                    for alts, azs, dls in shard_positions:
+                        yield SunCollection(datetimes, alts, azs, is_solar_time, dls, 0)
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            for alts, azs, dls in _solar_positions(sites, analysis_period, is_solar_time):
+                yield SunCollection(datetimes, alts, azs, is_solar_time, dls, 0)
+
+    def _calculate_altitude_azimuth(self, datetime, is_solar_time=False):
+        """Get the solar altitude and azimuth for a specific datetime.
+
+        Args:
+            datetime: Ladybug datetime.
+            is_solar_time: A boolean to indicate if the input hour is in solar
+                time. (Default: False)
+
+        Returns:
+            A tuple with four values (datetime, altitude, azimuth, is_daylight_saving)
+            where the datetime is adjusted to the leap year of the Sunpath.
+        """
         # TODO(mostapha): This should be more generic and based on a method
         if datetime.year != 2016 and self.is_leap_year:
             datetime = DateTime(datetime.month, datetime.day, datetime.hour,
@@ -258,7 +457,20 @@ class Sunpath(object):
         is_daylight_saving = self.is_daylight_saving_hour(datetime)
         hour = hour - 1 if is_daylight_saving else hour  # spring forward!
         sol_time = self._calculate_solar_time(hour, eq_of_time, is_solar_time) * 60
+        altitude, azimuth = self._calculate_altitude_azimuth_from_geometry(
+            sol_dec, sol_time)
+        return datetime, altitude, azimuth, is_daylight_saving
+
+    def _calculate_altitude_azimuth_from_geometry(self, sol_dec, sol_time):
+        """Get the solar altitude and azimuth from the solar geometry.
+
+        Args:
+            sol_dec: Solar declination in radians.
+            sol_time: Solar time in minutes.
 
+        Returns:
+            A tuple with two values (altitude, azimuth) in degrees.
+        """
         # degrees for the angle between solar noon and the current time.
         hour_angle = sol_time / 4 + 180 if sol_time < 0 else sol_time / 4 - 180
 
@@ -294,10 +506,7 @@ class Sunpath(object):
                 azimuth = (540 - math.degrees(math.acos(az_init))) % 360
         except ValueError:  # perfect solar noon yields math domain error
             azimuth = 180
-
-        # create the sun for this hour
-        return Sun(datetime, altitude, azimuth, is_solar_time, is_daylight_saving,
-                   self.north_angle)
+        return altitude, azimuth
 
     def calculate_sunrise_sunset(self, month, day, depression=0.5334,
                                  is_solar_time=False):
@@ -405,6 +614,74 @@ class Sunpath(object):
                                    leap_year=self.is_leap_year)
             }
 
+    def calculate_annual_sunrise_sunset(self, depression=0.5334, is_solar_time=False,
+                                        as_moys=False):
+        """Calculate sunrise, noon and sunset for every day of the year in one pass.
+
+        This yields the same times as calling calculate_sunrise_sunset for each
+        day of the year but no DateTime objects are created, which makes it much
+        faster when the daylight hours of many days are needed.
+
+        Args:
+            depression: An angle in degrees indicating the additional period
+                before/after the edge of the sun has passed the horizon where
+                the sun is still considered up. See the calculate_sunrise_sunset
+                method for typical values. (Default: 0.5334).
+            is_solar_time: A boolean to indicate if the output times for sunrise,
+                noon and sunset should be in solar time as opposed to the time zone
+                of this Sunpath. (Default: False)
+            as_moys: A boolean to note whether the output values should be integers
+                for the minute of the year, rounded to the nearest minute like
+                the DateTimes of calculate_sunrise_sunset. If False, the values
+                will be float hours of the day. (Default: False)
+
+        Return:
+            A dictionary. Keys are ("sunrise", "noon", "sunset"). Values are lists
+            with one value for each day of the year (366 if the Sunpath is for
+            a leap year and 365 otherwise). Sunrise and sunset values are None
+            for the days when there is no sunrise or sunset (eg. arctic circle
+            in summer/winter).
+        """
+        year = 2016 if self.is_leap_year else 2017
+        days = self._days_from_010119(year, 1, 1)
+        day_count = 366 if self.is_leap_year else 365
+        day_fraction = round(720 / 1440.0, 2)  # noon of every day
+        tz_fraction = float(self.time_zone) / 24
+        noon_base, tz_minutes = 720 - 4 * self.longitude, self.time_zone * 60
+        cos_depression = math.cos(self.PI / 2 + math.radians(depression))
+        cos_lat, tan_lat = math.cos(self._latitude), math.tan(self._latitude)
+
+        sunrises, noons, sunsets = [], [], []
+        for doy in xrange(day_count):
+            julian_day = days + doy + 2415018.5 + day_fraction - tz_fraction
+            sol_dec, eq_of_time = self._julian_day_geometry(julian_day)
+            noon = .5 if is_solar_time else \
+                (noon_base - eq_of_time + tz_minutes) / 1440.
+            hour_angle_arg = cos_depression / (cos_lat * math.cos(sol_dec)) - \
+                tan_lat * math.tan(sol_dec)
+            noons.append(24 * noon)
+            if -1 <= hour_angle_arg <= 1:
+                sunrise_hour_angle = math.degrees(math.acos(hour_angle_arg))
+                sunrises.append(24 * (noon - sunrise_hour_angle * 4 / 1440.0))
+                sunsets.append(24 * (noon + sunrise_hour_angle * 4 / 1440.0))
+            else:  # no sunrise/sunset on this day
+                sunrises.append(None)
+                sunsets.append(None)
+
+        if as_moys:  # convert the float hours into minutes of the year
+            def to_moys(hours):
+                moys = []
+                for doy, hour in enumerate(hours):
+                    if hour is None:
+                        moys.append(None)
+                    else:
+                        hr, mn = self._calculate_hour_and_minute(hour)
+                        moys.append(doy * 1440 + hr * 60 + mn)
+                return moys
+            sunrises, noons, sunsets = to_moys(sunrises), to_moys(noons), \
+                to_moys(sunsets)
+        return {'sunrise': sunrises, 'noon': noons, 'sunset': sunsets}
+
     def analemma_suns(self, time, daytime_only=False, is_solar_time=False):
         """Get an array of Suns that represent an analemma for a single time of day.
 
@@ -476,11 +753,8 @@ class Sunpath(object):
             for each analemma.
         """
         analemmas = []  # list of polylines
-        analem_suns = self.hourly_analemma_suns(is_solar_time=is_solar_time)
-        for analem in analem_suns:
-            pts = []
-            for sun in analem:
-                pts.append(sun.position_3d(origin, radius))
+        for analem in self._hourly_analemma_positions(is_solar_time):
+            pts = self._positions_to_points(analem, origin, radius)
             pts.append(pts[0])  # ensure that the Polyline3D is closed
             analemmas.append(Polyline3D(pts, interpolated=True))
         if not daytime_only:  # no need to further process the analemmas
@@ -572,25 +846,8 @@ class Sunpath(object):
             None if daytime_only is True and the sun is completely below the horizon
             for the entire day.
         """
-        # get the sunrise, noon, and sunset time
-        riseset_dict = self.calculate_sunrise_sunset(month, day, depression)
-
-        # create the arcs from the sun positions
-        if riseset_dict['sunrise'] is None:  # no sunrise; add a full circle
-            noon = self.calculate_sun_from_date_time(riseset_dict['noon'])
-            if daytime_only and noon.sun_vector.z > 0:  # night time
-                return None
-            sun6am = self.calculate_sun(month, day, 6)
-            sun6pm = self.calculate_sun(month, day, 18)
-            pts = [sun.position_3d(origin, radius) for sun in (sun6am, noon, sun6pm)]
-            return Arc3D.from_start_mid_end(pts[0], pts[1], pts[2], circle=True)
-        else:  # create an arc that respects the depression
-            rise_noon_set_suns = (
-                self.calculate_sun_from_date_time(riseset_dict['sunrise']),
-                self.calculate_sun_from_date_time(riseset_dict['noon']),
-                self.calculate_sun_from_date_time(riseset_dict['sunset']))
-            positions = (sun.position_3d(origin, radius) for sun in rise_noon_set_suns)
-            return Arc3D.from_start_mid_end(*positions)
+        arc_positions = self._day_arc_positions(month, day, depression)
+        return self._positions_to_arc(arc_positions, origin, radius, daytime_only)
 
     def day_polyline2d(self, month, day, projection='Orthographic', origin=Point2D(),
                        radius=100, daytime_only=True, depression=0.5334):
@@ -662,8 +919,8 @@ class Sunpath(object):
             An array of ladybug_geometry Arc3D with an arc for the 21st of each month.
         """
         day_arcs = []
-        for mon in range(1, 13):
-            arc = self.day_arc3d(mon, 21, origin, radius, daytime_only, depression)
+        for arc_positions in self._monthly_day_arc_positions(depression):
+            arc = self._positions_to_arc(arc_positions, origin, radius, daytime_only)
             if arc is not None:
                 day_arcs.append(arc)
         return day_arcs
@@ -706,9 +963,119 @@ class Sunpath(object):
         plines_3d = [arc.to_polyline(10, interpolated=True) for arc in arcs_3d]
         return self._project_polyline_to_2d(plines_3d, projection, radius, o_3d)
 
+    def _sun_positions(self, datetimes, is_solar_time=False):
+        """Get the unit sun positions for an array of datetimes in a single pass.
+
+        This avoids the creation of a Sun object for each of the datetimes.
+
+        Args:
+            datetimes: An array of ladybug DateTimes.
+            is_solar_time: A boolean to indicate if the input datetimes are in
+                solar time. (Default: False)
+
+        Returns:
+            A tuple of (x, y, z) tuples for the sun_vector_reversed at each datetime.
+        """
+        north_angle = self.north_angle
+        positions = []
+        for dat_tim in datetimes:
+            _, altitude, azimuth, _ = \
+                self._calculate_altitude_azimuth(dat_tim, is_solar_time)
+            positions.append(_sun_vector_reversed(altitude, azimuth, north_angle))
+        return tuple(positions)
+
+    def _day_arc_positions(self, month, day, depression=0.5334):
+        """Get the unit sun positions that define the sun path on a single day.
+
+        Returns:
+            A tuple with four values (start, mid, end, circle). The first three are
+            (x, y, z) tuples for the sunrise, noon and sunset positions and circle
+            is False. If there is no sunrise on the day, these are the positions
+            at 6 AM, noon and 6 PM and circle is True.
+        """
+        riseset_dict = self.calculate_sunrise_sunset(month, day, depression)
+        if riseset_dict['sunrise'] is None:  # no sunrise; use a full circle
+            datetimes = (DateTime(month, day, 6, leap_year=self.is_leap_year),
+                         riseset_dict['noon'],
+                         DateTime(month, day, 18, leap_year=self.is_leap_year))
+            return self._sun_positions(datetimes) + (True,)
+        datetimes = (riseset_dict['sunrise'], riseset_dict['noon'],
+                     riseset_dict['sunset'])
+        return self._sun_positions(datetimes) + (False,)
+
+    def _hourly_analemma_positions(self, is_solar_time=False):
+        """Get 24 tuples of 12 unit sun positions for the hourly analemmas.
+
+        The positions are computed once for each Sunpath configuration and they
+        are shared by all of the Sunpaths that have the same configuration.
+        """
+        def build_analemmas():
+            datetimes = [DateTime(mon, 21, hr) for hr in xrange(24)
+                         for mon in xrange(1, 13)]
+            positions = self._sun_positions(datetimes, is_solar_time)
+            return tuple(positions[i:i + 12] for i in xrange(0, 288, 12))
+        return self._cached_geometry(('analemma', is_solar_time), build_analemmas)
+
+    def _monthly_day_arc_positions(self, depression=0.5334):
+        """Get 12 tuples of day arc positions for the 21st day of each month.
+
+        The positions are computed once for each Sunpath configuration and they
+        are shared by all of the Sunpaths that have the same configuration.
+        """
+        def build_arcs():
+            return tuple(self._day_arc_positions(mon, 21, depression)
+                         for mon in xrange(1, 13))
+        return self._cached_geometry(('day_arc', float(depression)), build_arcs)
+
+    def _cached_geometry(self, geometry_key, build_geometry):
+        """Get sunpath geometry from the process-wide cache or build it.
+
+        Args:
+            geometry_key: A tuple to identify the type of geometry.
+            build_geometry: A function with no arguments to build the geometry
+                if it is not found in the cache.
+        """
+        dls = self._daylight_saving_period
+        dls_key = None if dls is None else (dls.st_time.moy, dls.end_time.moy)
+        key = (self._latitude, self._longitude, self._time_zone, self._north_angle,
+               self._is_leap_year, dls_key) + geometry_key
+        try:
+            return self._geometries[key]
+        except KeyError:
+            geometry = build_geometry()
+            if len(self._geometries) >= self.MAXGEOMETRIES:
+                self._geometries.popitem(last=False)
+            self._geometries[key] = geometry
+            return geometry
+
+    @staticmethod
+    def _positions_to_points(positions, origin, radius):
+        """Get a list of Point3D from unit sun positions scaled about an origin."""
+        o_x, o_y, o_z = origin.x, origin.y, origin.z
+        return [Point3D(x * radius + o_x, y * radius + o_y, z * radius + o_z)
+                for x, y, z in positions]
+
+    @staticmethod
+    def _positions_to_arc(arc_positions, origin, radius, daytime_only=True):
+        """Get an Arc3D from the output of the _day_arc_positions method.
+
+        None will be returned if daytime_only is True and the sun is below the
+        horizon for the whole day.
+        """
+        start, mid, end, circle = arc_positions
+        if circle and daytime_only and -mid[2] > 0:  # night time
+            return None
+        pts = Sunpath._positions_to_points((start, mid, end), origin, radius)
+        return Arc3D.from_start_mid_end(pts[0], pts[1], pts[2], circle=circle)
+
     def _calculate_solar_geometry(self, datetime):
         """Calculate parameters related to solar geometry for an hour of the year.
 
+        The solar geometry only depends on the julian day, in which the time of
+        day is rounded to hundredths of a day. So the results are memoized on
+        the Sunpath by julian day and repeated calculations for the same dates
+        and times (eg. several annual runs) skip the trigonometric series.
+
         Attributes:
             datetime: A Ladybug datetime
 
@@ -732,6 +1099,28 @@ class Sunpath(object):
         julian_day = self._days_from_010119(year, month, day) + 2415018.5 + \
             round((minute + hour * 60) / 1440.0, 2) - (float(self.time_zone) / 24)
 
+        return self._julian_day_geometry(julian_day)
+
+    def _julian_day_geometry(self, julian_day):
+        """Get the solar geometry for a julian day from the memo or calculate it."""
+        try:  # check if the solar geometry has already been computed
+            return self._solar_geometries[julian_day]
+        except KeyError:
+            sol_geo = self._solar_geometry_from_julian_day(julian_day)
+            self._solar_geometries[julian_day] = sol_geo
+            return sol_geo
+
+    @staticmethod
+    def _solar_geometry_from_julian_day(julian_day):
+        """Calculate the solar declination and equation of time for a julian day.
+
+        Args:
+            julian_day: A number for the julian day, including the fraction of
+                the day in the time zone of the Sunpath.
+
+        Returns:
+            A tuple with two values (sol_dec, eq_of_time).
+        """
         julian_century = (julian_day - 2451545) / 36525
 
         # degrees
@@ -893,19 +1282,13 @@ class Sunpath(object):
                     * Stereographic
             origin_3d: Point3D for the origin around which projection will occur.
         """
-        plines_2d = []
         if projection.title() == 'Orthographic':
-            for pl in plines_3d:
-                pts = [Compass.point3d_to_orthographic(pt) for pt in pl.vertices]
-                plines_2d.append(Polyline2D(pts, True))
+            return [Polyline2D(Compass.points3d_to_orthographic(pl.vertices), True)
+                    for pl in plines_3d]
         elif projection.title() == 'Stereographic':
-            for pline in plines_3d:
-                pts = [Compass.point3d_to_stereographic(pt, radius, origin_3d)
-                       for pt in pline.vertices]
-                plines_2d.append(Polyline2D(pts, True))
-        else:
-            raise ValueError('Projection "{}" is not supported.'.format(projection))
-        return plines_2d
+            return [Polyline2D(Compass.points3d_to_stereographic(
+                    pl.vertices, radius, origin_3d), True) for pl in plines_3d]
+        raise ValueError('Projection "{}" is not supported.'.format(projection))
 
     def __repr__(self):
         """Sunpath representation."""
@@ -969,7 +1352,8 @@ class Sun(object):
         self._north_angle = north_angle
         self.data = data  # place holder for metadata
 
-        self._sun_vector, self._sun_vector_reversed = self._calculate_sun_vector()
+        # sun vectors are computed lazily since they are not needed in many cases
+        self._sun_vector = self._sun_vector_reversed = None
 
     @property
     def datetime(self):
@@ -1057,6 +1441,8 @@ class Sun(object):
 
         Note that daytime sun vectors point downward (z will be negative).
         """
+        if self._sun_vector is None:
+            self._sun_vector, self._sun_vector_reversed = self._calculate_sun_vector()
         return self._sun_vector
 
     @property
@@ -1065,6 +1451,8 @@ class Sun(object):
 
         Daytime sun_vector_reversed point upward (z will be positive).
         """
+        if self._sun_vector_reversed is None:
+            self._sun_vector, self._sun_vector_reversed = self._calculate_sun_vector()
         return self._sun_vector_reversed
 
     def position_3d(self, origin=Point3D(), radius=100):
@@ -1107,20 +1495,12 @@ class Sun(object):
 
     def _calculate_sun_vector(self):
         """Calculate sun vector for this sun."""
-        x_axis = Vector3D(1., 0., 0.)
-        north_vector = Vector3D(0., 1., 0.)
-
         # rotate north vector based on azimuth, altitude, and north
-        _sun_vector_reversed = north_vector \
-            .rotate(x_axis, self.altitude_in_radians) \
-            .rotate_xy(-self.azimuth_in_radians)
-        if self.north_angle != 0:
-            _sun_vector_reversed = _sun_vector_reversed.rotate_xy(
-                math.radians(self.north_angle))
+        sun_vec_rev = Vector3D(*_sun_vector_reversed(
+            self._altitude, self._azimuth, self._north_angle))
 
         # reverse the vector
-        _sun_vector = _sun_vector_reversed.reverse()
-        return _sun_vector, _sun_vector_reversed
+        return sun_vec_rev.reverse(), sun_vec_rev
 
     def ToString(self):
         """Overwrite .NET ToString method."""
@@ -1148,3 +1528,183 @@ class Sun(object):
             self.sun_vector.y,
             self.sun_vector.z
         )
+
+
+class SunCollection(object):
+    """A collection of sun positions stored as arrays instead of Sun objects.
+
+    This is useful for large numbers of sun positions (eg. all of the hours of a
+    year) since no Sun or Vector3D objects are created unless they are requested.
+    Individual Sun objects can be obtained by indexing the collection.
+
+    Args:
+        datetimes: An array of DateTimes for the sun positions.
+        altitudes: An array of solar altitudes in degrees.
+        azimuths: An array of solar azimuths in degrees.
+        is_solar_time: Boolean indicating if the datetimes represent solar time.
+        is_daylight_saving: An array of Booleans indicating if each datetime is
+            within the daylight saving period.
+        north_angle: North angle of the sunpath in degrees. This is only used to
+            adjust the sun_vectors and does not affect the altitudes or azimuths.
+
+    Properties:
+        * datetimes
+        * moys
+        * altitudes
+        * azimuths
+        * is_solar_time
+        * is_daylight_saving
+        * north_angle
+        * is_during_day
+        * sun_vectors
+        * sun_vectors_reversed
+    """
+
+    __slots__ = ('_datetimes', '_altitudes', '_azimuths', '_is_solar_time',
+                 '_is_daylight_saving', '_north_angle', '_sun_vectors',
+                 '_sun_vectors_reversed')
+
+    def __init__(self, datetimes, altitudes, azimuths, is_solar_time,
+                 is_daylight_saving, north_angle):
+        """Init sun collection."""
+        self._datetimes = tuple(datetimes)
+        self._altitudes = tuple(altitudes)
+        self._azimuths = tuple(azimuths)
+        self._is_daylight_saving = tuple(is_daylight_saving)
+        assert len(self._datetimes) == len(self._altitudes) == \
+            len(self._azimuths) == len(self._is_daylight_saving), \
+            'Length of SunCollection datetimes, altitudes, azimuths and ' \
+            'is_daylight_saving must match.'
+        self._is_solar_time = is_solar_time
+        self._north_angle = north_angle
+        self._sun_vectors = self._sun_vectors_reversed = None  # computed lazily
+
+    @property
+    def datetimes(self):
+        """Get a tuple of DateTimes for the sun positions."""
+        return self._datetimes
+
+    @property
+    def moys(self):
+        """Get a tuple of integers for the minute of the year of each sun position."""
+        return tuple(dt.moy for dt in self._datetimes)
+
+    @property
+    def altitudes(self):
+        """Get a tuple of solar altitudes in degrees."""
+        return self._altitudes
+
+    @property
+    def azimuths(self):
+        """Get a tuple of solar azimuths in degrees."""
+        return self._azimuths
+
+    @property
+    def is_solar_time(self):
+        """Get a Boolean that indicates if the datetimes are solar time."""
+        return self._is_solar_time
+
+    @property
+    def is_daylight_saving(self):
+        """Get a tuple of Booleans for whether each datetime is daylight saving time."""
+        return self._is_daylight_saving
+
+    @property
+    def north_angle(self):
+        """Get the north angle for +YAxis in degrees."""
+        return self._north_angle
+
+    @property
+    def is_during_day(self):
+        """Get a tuple of Booleans to note if each sun position is during day."""
+        return tuple(vec[2] >= 0 for vec in self.sun_vectors_reversed)
+
+    @property
+    def sun_vectors(self):
+        """Get a tuple of (x, y, z) tuples for the sun vectors.
+
+        These are the same as the sun_vector of each Sun. Note that daytime sun
+        vectors point downward (z will be negative).
+        """
+        if self._sun_vectors is None:
+            self._sun_vectors = tuple((-x, -y, -z) for x, y, z in
+                                      self.sun_vectors_reversed)
+        return self._sun_vectors
+
+    @property
+    def sun_vectors_reversed(self):
+        """Get a tuple of (x, y, z) tuples for the reversed sun vectors.
+
+        Daytime sun_vectors_reversed point upward (z will be positive).
+        """
+        if self._sun_vectors_reversed is None:
+            north_angle = self._north_angle
+            self._sun_vectors_reversed = tuple(
+                _sun_vector_reversed(alt, az, north_angle)
+                for alt, az in zip(self._altitudes, self._azimuths))
+        return self._sun_vectors_reversed
+
+    def filter_by_pattern(self, pattern):
+        """Get a new SunCollection filtered by a list of booleans.
+
+        Args:
+            pattern: An array of True/False values. This array should usually
+                have a length matching the number of sun positions but it can
+                also be a pattern to be repeated over the collection.
+
+        Returns:
+            A new SunCollection with the filtered sun positions.
+        """
+        count = len(pattern)
+        indices = [i for i in xrange(len(self)) if pattern[i % count]]
+        return self._subset(indices)
+
+    def filter_by_is_during_day(self):
+        """Get a new SunCollection with only the daytime sun positions."""
+        return self.filter_by_pattern(self.is_during_day)
+
+    def duplicate(self):
+        """Get a copy of this collection."""
+        return self.__copy__()
+
+    def _subset(self, indices):
+        """Get a new SunCollection from a list of indices of this collection."""
+        new_col = SunCollection(
+            [self._datetimes[i] for i in indices],
+            [self._altitudes[i] for i in indices],
+            [self._azimuths[i] for i in indices],
+            self._is_solar_time,
+            [self._is_daylight_saving[i] for i in indices],
+            self._north_angle)
+        if self._sun_vectors_reversed is not None:
+            new_col._sun_vectors_reversed = \
+                tuple(self._sun_vectors_reversed[i] for i in indices)
+        return new_col
+
+    def _sun(self, i):
+        """Get a Sun object for the position at a given index."""
+        return Sun(self._datetimes[i], self._altitudes[i], self._azimuths[i],
+                   self._is_solar_time, self._is_daylight_saving[i],
+                   self._north_angle)
+
+    def __len__(self):
+        return len(self._datetimes)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._subset(range(*key.indices(len(self))))
+        return self._sun(key)
+
+    def __iter__(self):
+        return (self._sun(i) for i in xrange(len(self)))
+
+    def __copy__(self):
+        return self._subset(range(len(self)))
+
+    def ToString(self):
+        """Overwrite .NET ToString method."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Sun collection representation."""
+        return 'Sun Collection ({} sun positions)'.format(len(self))
@@ -41,6 +41,10 @@ class ViewSphere(object):
          0.0117312774, 0.0108025291, 0.00974713106, 0.011436609, 0.00974295956,
          0.0119026242, 0.00905126163, 0.0121875626, 0.00612971396, 0.00921483254)
 
+    # process-wide table of the rows of dome patches used to look up patch indices
+    # keys are division counts and values are (row_angle, row_starts, row_counts)
+    _patch_rows = {}
+
     __slots__ = ('_tregenza_dome_vectors', '_tregenza_sphere_vectors',
                  '_tregenza_dome_mesh', '_tregenza_dome_mesh_high_res',
                  '_tregenza_sphere_mesh', '_tregenza_solid_angles',
@@ -394,6 +398,127 @@ class ViewSphere(object):
         avg_patch_area = 2 * math.pi / len(patch_areas)
         return [p_area / avg_patch_area for p_area in patch_areas] * 2
 
+    def dome_patch_index(self, altitude, azimuth, division_count=1):
+        """Get the index of the dome patch that contains a given sky position.
+
+        The index is computed directly from the rows of the dome such that no
+        comparison with the patch vectors is needed.
+
+        Args:
+            altitude: A number between -90 and 90 for the altitude of the sky
+                position in degrees.
+            azimuth: A number for the azimuth of the sky position in degrees,
+                measured clockwise from the positive Y-axis (eg. the
+                azimuth_from_y_axis of a Sun).
+            division_count: A positive integer for the number of times that the
+                original Tregenza patches are subdivided. 1 indicates that the
+                original Tregenza patches will be used, 2 indicates
+                the Reinhart patches will be used, and so on. (Default: 1).
+
+        Returns:
+            An integer for the index of the patch in the dome_patches vectors.
+            Will be None if the altitude is below the horizon.
+        """
+        if altitude < 0:
+            return None
+        row_angle, row_starts, row_counts = self._dome_patch_rows(division_count)
+        row_i = int(altitude / row_angle)
+        if row_i >= len(row_counts):  # circular patch at the top of the dome
+            return row_starts[-1]
+        row_count = row_counts[row_i]
+        patch_i = int((azimuth % 360) * row_count / 360. + 0.5) % row_count
+        return row_starts[row_i] + patch_i
+
+    def dome_patch_indices(self, vectors, division_count=1):
+        """Get the index of the dome patch that contains each of several vectors.
+
+        Args:
+            vectors: An array of ladybug_geometry Vector3D or (x, y, z) tuples
+                pointing from the center of the dome towards the sky (eg. the
+                sun_vector_reversed of Suns or the sun_vectors_reversed of
+                a SunCollection).
+            division_count: A positive integer for the number of times that the
+                original Tregenza patches are subdivided. (Default: 1).
+
+        Returns:
+            A list with the index of the patch in the dome_patches vectors for
+            each of the input vectors. Vectors below the horizon get None.
+        """
+        row_angle, row_starts, row_counts = self._dome_patch_rows(division_count)
+        row_total, top_i = len(row_counts), row_starts[-1]
+        indices = []
+        for x, y, z in vectors:
+            if z < 0:  # below the horizon
+                indices.append(None)
+                continue
+            row_i = int(math.degrees(math.atan2(z, math.sqrt(x * x + y * y))) /
+                        row_angle)
+            if row_i >= row_total:  # circular patch at the top of the dome
+                indices.append(top_i)
+                continue
+            row_count = row_counts[row_i]
+            azimuth = math.degrees(math.atan2(x, y)) % 360
+            indices.append(
+                row_starts[row_i] + int(azimuth * row_count / 360. + 0.5) % row_count)
+        return indices
+
+    def dome_patch_totals(self, vectors, values, division_count=1):
+        """Get the total of values for the vectors that fall within each dome patch.
+
+        This is useful for building cumulative skies by binning all of the sun
+        positions of a year (weighted by their direct normal irradiance) into
+        the patches of a sky dome in a single pass.
+
+        Args:
+            vectors: An array of ladybug_geometry Vector3D or (x, y, z) tuples
+                pointing from the center of the dome towards the sky (eg. the
+                sun_vectors_reversed of a SunCollection).
+            values: An array of numbers with one value for each of the vectors
+                (eg. direct normal irradiance).
+            division_count: A positive integer for the number of times that the
+                original Tregenza patches are subdivided. (Default: 1).
+
+        Returns:
+            A list of numbers with one total for each patch of the dome, which
+            align with the dome_patches vectors. Vectors below the horizon are
+            not included in any of the totals.
+        """
+        assert len(vectors) == len(values), 'Length of vectors ({}) and values ' \
+            '({}) for dome patch totals must match.'.format(len(vectors), len(values))
+        row_starts = self._dome_patch_rows(division_count)[1]
+        totals = [0] * (row_starts[-1] + 1)
+        for patch_i, val in zip(self.dome_patch_indices(vectors, division_count),
+                                values):
+            if patch_i is not None:
+                totals[patch_i] += val
+        return totals
+
+    @staticmethod
+    def _dome_patch_rows(division_count):
+        """Get the rows of dome patches used to look up the index of patches.
+
+        Returns:
+            A tuple with three elements
+
+            -   row_angle: The vertical angle of each row of patches in degrees.
+
+            -   row_starts: A tuple with the index of the first patch of each row
+                and a final item for the index of the circular patch at the top.
+
+            -   row_counts: A tuple with the number of patches in each row.
+        """
+        try:
+            return ViewSphere._patch_rows[division_count]
+        except KeyError:
+            row_counts = tuple(ViewSphere._patch_row_count_array(division_count))
+            row_angle = 180. / (2 * len(row_counts) + 1)
+            row_starts = [0]
+            for row_count in row_counts:
+                row_starts.append(row_starts[-1] + row_count)
+            patch_rows = (row_angle, tuple(row_starts), row_counts)
+            ViewSphere._patch_rows[division_count] = patch_rows
+            return patch_rows
+
     @staticmethod
     def _dome_patch_areas(division_count):
         """Get the area of each patch in a dome from a division_count."""
@@ -3,6 +3,7 @@ from __future__ import division
 
 import math
 import os
+from collections import OrderedDict
 
 from ladybug_geometry.geometry3d.pointvector import Vector3D
 
@@ -18,7 +19,7 @@ from .epw import EPW
 from .futil import write_to_file
 from .header import Header
 from .location import Location
-from .skymodel import ashrae_revised_clear_sky, ashrae_clear_sky, \
+from .skymodel import ashrae_revised_clear_sky_monthly, ashrae_clear_sky_monthly, \
     zhang_huang_solar_split, estimate_illuminance_from_irradiance
 from .stat import STAT
 from .sunpath import Sunpath
@@ -66,6 +67,10 @@ class Wea(object):
     __slots__ = ('_timestep', '_is_leap_year', '_location', 'metadata',
                  '_direct_normal_irradiance', '_diffuse_horizontal_irradiance')
 
+    # annual solar altitudes shared by the clear sky classmethods
+    _solar_tables = OrderedDict()
+    MAXSOLARTABLES = 32
+
     def __init__(self, location, direct_normal_irradiance, diffuse_horizontal_irradiance):
         """Create a Wea object."""
         # Check that input collections are of the right type and aligned to each other
@@ -304,11 +309,12 @@ class Wea(object):
             diffuse_horizontal = diffuse_horizontal.interpolate_to_timestep(timestep)
             # create sunpath to check if the sun is up at a given timestep
             sp = Sunpath.from_location(epw.location)
+            suns = sp.calculate_sun_collection(
+                cls._get_datetimes(timestep, epw.is_leap_year))
             # add correct values to the empty data collection
-            for i, dt in enumerate(cls._get_datetimes(timestep, epw.is_leap_year)):
+            for i, altitude in enumerate(suns.altitudes):
                 # set irradiance values to 0 when the sun is not up
-                sun = sp.calculate_sun_from_date_time(dt)
-                if sun.altitude < 0:
+                if altitude < 0:
                     direct_normal[i] = 0
                     diffuse_horizontal[i] = 0
 
@@ -375,22 +381,10 @@ class Wea(object):
         metadata = {'source': location.source, 'country': location.country,
                     'city': location.city}
 
-        # create sunpath and get altitude at every timestep of the year
-        sp = Sunpath.from_location(location)
-        sp.is_leap_year = is_leap_year
-        altitudes = [[] for i in range(12)]
-        dates = cls._get_datetimes(timestep, is_leap_year)
-        for t_date in dates:
-            sun = sp.calculate_sun_from_date_time(t_date)
-            altitudes[sun.datetime.month - 1].append(sun.altitude)
-
-        # run all of the months through the ashrae_revised_clear_sky model
-        direct_norm, diffuse_horiz = [], []
-        for i_mon, alt_list in enumerate(altitudes):
-            dir_norm_rad, dif_horiz_rad = ashrae_revised_clear_sky(
-                alt_list, monthly_tau_beam[i_mon], monthly_tau_diffuse[i_mon])
-            direct_norm.extend(dir_norm_rad)
-            diffuse_horiz.extend(dif_horiz_rad)
+        # get the altitude at every timestep of the year and run the model
+        altitudes, months = cls._annual_solar_altitudes(location, timestep, is_leap_year)
+        direct_norm, diffuse_horiz = ashrae_revised_clear_sky_monthly(
+            altitudes, months, monthly_tau_beam, monthly_tau_diffuse)
 
         direct_norm_rad, diffuse_horiz_rad = \
             cls._get_data_collections(direct_norm, diffuse_horiz,
@@ -431,22 +425,10 @@ class Wea(object):
         metadata = {'source': location.source, 'country': location.country,
                     'city': location.city}
 
-        # create sunpath and get altitude at every timestep of the year
-        sp = Sunpath.from_location(location)
-        sp.is_leap_year = is_leap_year
-        altitudes = [[] for i in range(12)]
-        dates = cls._get_datetimes(timestep, is_leap_year)
-        for t_date in dates:
-            sun = sp.calculate_sun_from_date_time(t_date)
-            altitudes[sun.datetime.month - 1].append(sun.altitude)
-
-        # compute hourly direct normal and diffuse horizontal irradiance
-        direct_norm, diffuse_horiz = [], []
-        for i_mon, alt_list in enumerate(altitudes):
-            dir_norm_rad, dif_horiz_rad = ashrae_clear_sky(
-                alt_list, i_mon + 1, sky_clearness)
-            direct_norm.extend(dir_norm_rad)
-            diffuse_horiz.extend(dif_horiz_rad)
+        # get the altitude at every timestep of the year and run the model
+        altitudes, months = cls._annual_solar_altitudes(location, timestep, is_leap_year)
+        direct_norm, diffuse_horiz = ashrae_clear_sky_monthly(
+            altitudes, months, sky_clearness)
 
         direct_norm_rad, diffuse_horiz_rad = \
             cls._get_data_collections(direct_norm, diffuse_horiz,
@@ -487,53 +469,91 @@ class Wea(object):
             use_disc: Boolean to note whether the original DISC model as opposed to the
                 newer and more accurate DIRINT model. (Default: False).
         """
-        # Check that input collections are of the right type and aligned to each other
-        colls = (cloud_cover, relative_humidity, dry_bulb_temperature, wind_speed)
-        for coll in colls:
-            assert isinstance(coll, HourlyContinuousCollection), 'Input data for Zhang' \
-                '-Huang Wea must be an hourly continuous. Got {}.'.format(type(coll))
-        assert cloud_cover.are_collections_aligned(colls), 'Zhang-Huang Wea input ' \
-            'data collections must be aligned with one another.'
+        atm_pressure = cls._check_zhang_huang_inputs(
+            cloud_cover, relative_humidity, dry_bulb_temperature, wind_speed,
+            atmospheric_pressure)
+        a_per = cloud_cover.header.analysis_period
 
-        # check atmospheric_pressure input and generate default if None
-        if atmospheric_pressure is not None:
-            assert cloud_cover.is_collection_aligned(atmospheric_pressure), \
-                'length pf atmospheric_pressure must match the other input collections.'
-            atm_pressure = atmospheric_pressure.values
-        else:
-            atm_pressure = [101325] * len(cloud_cover)
+        # calculate zhang-huang irradiance and assemble it into a Wea
+        dir_ir, diff_ir = _zhang_huang_irradiance(
+            location, a_per, cloud_cover.values, relative_humidity.values,
+            dry_bulb_temperature.values, wind_speed.values, atm_pressure, use_disc)
+        return cls._from_irradiance_values(location, a_per, dir_ir, diff_ir)
 
-        # initiate sunpath based on location
-        sp = Sunpath.from_location(location)
-        sp.is_leap_year = cloud_cover.header.analysis_period.is_leap_year
-        a_per = cloud_cover.header.analysis_period
+    @classmethod
+    def from_zhang_huang_solar_batch(cls, locations, cloud_covers, relative_humidities,
+                                     dry_bulb_temperatures, wind_speeds,
+                                     atmospheric_pressures=None, use_disc=False,
+                                     processes=1):
+        """Create Wea objects for several weather stations using the Zhang-Huang model.
 
-        # calculate parameters needed for zhang-huang irradiance
-        date_times = []
-        altitudes = []
-        doys = []
-        dry_bulb_t3_hrs = []
-        for count, t_date in enumerate(cloud_cover.datetimes):
-            date_times.append(t_date)
-            sun = sp.calculate_sun_from_date_time(t_date)
-            altitudes.append(sun.altitude)
-            doys.append(sun.datetime.doy)
-            dry_bulb_t3_hrs.append(dry_bulb_temperature[count - (3 * a_per.timestep)])
-
-        # calculate zhang-huang irradiance
-        dir_ir, diff_ir = zhang_huang_solar_split(
-            altitudes, doys, cloud_cover.values, relative_humidity.values,
-            dry_bulb_temperature.values, dry_bulb_t3_hrs, wind_speed.values,
-            atm_pressure, use_disc)
-
-        # assemble the results into DataCollections
-        metadata = {'source': location.source, 'country': location.country,
-                    'city': location.city}
-        dni_head = Header(DirectNormalIrradiance(), 'W/m2', a_per, metadata)
-        dhi_head = Header(DiffuseHorizontalIrradiance(), 'W/m2', a_per, metadata)
-        dni = HourlyContinuousCollection(dni_head, dir_ir)
-        dhi = HourlyContinuousCollection(dhi_head, diff_ir)
-        return cls(location, dni, dhi)
+        The results are the same as using the from_zhang_huang_solar method for
+        each of the stations but the stations can be computed in parallel
+        across a pool of processes.
+
+        Args:
+            locations: A list of Ladybug location objects with one for each station.
+            cloud_covers: A list of hourly continuous data collections with values
+                for the cloud cover at each station.
+            relative_humidities: A list of hourly continuous data collections with
+                values for the relative humidity in percent at each station.
+            dry_bulb_temperatures: A list of hourly continuous data collections with
+                values for the dry bulb temperature in degrees Celsius at each station.
+            wind_speeds: A list of hourly continuous data collections with values
+                for the wind speed in meters per second at each station.
+            atmospheric_pressures: An optional list of hourly continuous data
+                collections with values for the atmospheric pressure in Pa at each
+                station. Items of the list can be None to use the pressure at sea
+                level (101325 Pa) for a given station. If None, pressure at sea
+                level will be used for all stations. (Default: None)
+            use_disc: Boolean to note whether the original DISC model as opposed to the
+                newer and more accurate DIRINT model. (Default: False).
+            processes: An integer for the number of processes used to compute
+                the stations. If None, the number of CPUs of the machine will be
+                used. Where process pools are not available (eg. IronPython), all
+                stations are computed in the current process. (Default: 1).
+
+        Returns:
+            A list of Wea objects with one for each of the locations.
+        """
+        station_count = len(locations)
+        if atmospheric_pressures is None:
+            atmospheric_pressures = [None] * station_count
+        assert station_count == len(cloud_covers) == len(relative_humidities) == \
+            len(dry_bulb_temperatures) == len(wind_speeds) == \
+            len(atmospheric_pressures), 'Zhang-Huang Wea batch inputs must all ' \
+            'have one item for each of the {} locations.'.format(station_count)
+
+        # check the inputs and get the values to be computed for each station
+        stations = []
+        for loc, c_cov, r_hum, db_temp, w_spd, atm_pr in zip(
+                locations, cloud_covers, relative_humidities, dry_bulb_temperatures,
+                wind_speeds, atmospheric_pressures):
+            atm_pressure = cls._check_zhang_huang_inputs(
+                c_cov, r_hum, db_temp, w_spd, atm_pr)
+            stations.append(
+                (loc, c_cov.header.analysis_period, c_cov.values, r_hum.values,
+                 db_temp.values, w_spd.values, atm_pressure, use_disc))
+
+        # compute the irradiance of each station, using a process pool if possible
+        try:
+            from multiprocessing import Pool
+        except ImportError:  # IronPython or another environment without processes
+            processes = 1
+        if processes != 1 and station_count > 1:
+            pool_stations = [(st[0].to_dict(), st[1].to_dict()) + st[2:]
+                             for st in stations]
+            pool = Pool(processes)
+            try:
+                results = pool.map(_zhang_huang_irradiance_from_dict, pool_stations)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [_zhang_huang_irradiance(*st) for st in stations]
+
+        return [cls._from_irradiance_values(st[0], st[1], dir_ir, diff_ir)
+                for st, (dir_ir, diff_ir) in zip(stations, results)]
 
     @property
     def header(self):
@@ -641,10 +661,10 @@ class Wea(object):
         glob_horiz = []
         sp = Sunpath.from_location(self.location)
         sp.is_leap_year = self.is_leap_year
-        for dt, dnr, dhr in zip(self.datetimes, self.direct_normal_irradiance,
-                                self.diffuse_horizontal_irradiance):
-            sun = sp.calculate_sun_from_date_time(dt)
-            glob_horiz.append(dhr + dnr * math.sin(math.radians(sun.altitude)))
+        altitudes = sp.calculate_sun_collection(self.datetimes).altitudes
+        for alt, dnr, dhr in zip(altitudes, self.direct_normal_irradiance,
+                                 self.diffuse_horizontal_irradiance):
+            glob_horiz.append(dhr + dnr * math.sin(math.radians(alt)))
         return self._aligned_collection(header_ghr, glob_horiz)
 
     @property
@@ -661,9 +681,9 @@ class Wea(object):
         direct_horiz = []
         sp = Sunpath.from_location(self.location)
         sp.is_leap_year = self.is_leap_year
-        for dt, dnr in zip(self.datetimes, self.direct_normal_irradiance):
-            sun = sp.calculate_sun_from_date_time(dt)
-            direct_horiz.append(dnr * math.sin(math.radians(sun.altitude)))
+        altitudes = sp.calculate_sun_collection(self.datetimes).altitudes
+        for alt, dnr in zip(altitudes, self.direct_normal_irradiance):
+            direct_horiz.append(dnr * math.sin(math.radians(alt)))
         return self._aligned_collection(header_dhr, direct_horiz)
 
     def filter_by_pattern(self, pattern):
@@ -740,11 +760,8 @@ class Wea(object):
         """
         sp = Sunpath.from_location(self.location)
         sp.is_leap_year = self.is_leap_year
-        pattern = []
-        for dt in self.datetimes:
-            sun = sp.calculate_sun_from_date_time(dt)
-            sun_up = True if sun.altitude > min_altitude else False
-            pattern.append(sun_up)
+        altitudes = sp.calculate_sun_collection(self.datetimes).altitudes
+        pattern = [alt > min_altitude for alt in altitudes]
         return self.filter_by_pattern(pattern)
 
     def get_irradiance_value(self, month, day, hour):
@@ -922,10 +939,10 @@ class Wea(object):
         sp = Sunpath.from_location(self.location)
         sp.is_leap_year = self.is_leap_year
         gh_ill_values, dn_ill_values, dh_ill_values, zen_lum_values = [], [], [], []
-        for dt, dp, ghi, dni, dhi in zip(
-                self.datetimes, dew_point, self.global_horizontal_irradiance,
+        altitudes = sp.calculate_sun_collection(self.datetimes).altitudes
+        for alt, dp, ghi, dni, dhi in zip(
+                altitudes, dew_point, self.global_horizontal_irradiance,
                 self.direct_normal_irradiance, self.diffuse_horizontal_irradiance):
-            alt = sp.calculate_sun_from_date_time(dt).altitude
             gh, dn, dh, z = estimate_illuminance_from_irradiance(alt, ghi, dni, dhi, dp)
             gh_ill_values.append(gh)
             dn_ill_values.append(dn)
@@ -1004,6 +1021,68 @@ class Wea(object):
             dts = self.direct_normal_irradiance.datetimes
             return HourlyDiscontinuousCollection(header, values, dts)
 
+    @classmethod
+    def _annual_solar_altitudes(cls, location, timestep, is_leap_year):
+        """Get the solar altitude and month at every timestep of the year.
+
+        The results are shared by all locations with the same latitude, longitude
+        and time zone such that the sun positions are only computed once for
+        several clear skies at the same location.
+
+        Returns:
+            A tuple with two items.
+
+            -   altitudes: A tuple of solar altitudes in degrees.
+
+            -   months: A tuple of integers for the month of each altitude.
+        """
+        key = (location.latitude, location.longitude, location.time_zone,
+               timestep, is_leap_year)
+        try:
+            return cls._solar_tables[key]
+        except KeyError:
+            # create sunpath and get altitude at every timestep of the year
+            sp = Sunpath.from_location(location)
+            sp.is_leap_year = is_leap_year
+            dates = cls._get_datetimes(timestep, is_leap_year)
+            altitudes = sp.calculate_sun_collection(dates).altitudes
+            months = tuple(t_date.month for t_date in dates)
+            if len(cls._solar_tables) >= cls.MAXSOLARTABLES:
+                cls._solar_tables.popitem(last=False)
+            cls._solar_tables[key] = (altitudes, months)
+            return altitudes, months
+
+    @staticmethod
+    def _check_zhang_huang_inputs(cloud_cover, relative_humidity, dry_bulb_temperature,
+                                  wind_speed, atmospheric_pressure):
+        """Check the inputs of the Zhang-Huang model and get atmospheric pressures."""
+        # Check that input collections are of the right type and aligned to each other
+        colls = (cloud_cover, relative_humidity, dry_bulb_temperature, wind_speed)
+        for coll in colls:
+            assert isinstance(coll, HourlyContinuousCollection), 'Input data for Zhang' \
+                '-Huang Wea must be an hourly continuous. Got {}.'.format(type(coll))
+        assert cloud_cover.are_collections_aligned(colls), 'Zhang-Huang Wea input ' \
+            'data collections must be aligned with one another.'
+
+        # check atmospheric_pressure input and generate default if None
+        if atmospheric_pressure is not None:
+            assert cloud_cover.is_collection_aligned(atmospheric_pressure), \
+                'length pf atmospheric_pressure must match the other input collections.'
+            return atmospheric_pressure.values
+        return [101325] * len(cloud_cover)
+
+    @classmethod
+    def _from_irradiance_values(cls, location, analysis_period, dir_ir, diff_ir):
+        """Create a Wea from lists of direct normal and diffuse horizontal irradiance."""
+        metadata = {'source': location.source, 'country': location.country,
+                    'city': location.city}
+        dni_head = Header(DirectNormalIrradiance(), 'W/m2', analysis_period, metadata)
+        dhi_head = Header(DiffuseHorizontalIrradiance(), 'W/m2', analysis_period,
+                          metadata)
+        dni = HourlyContinuousCollection(dni_head, dir_ir)
+        dhi = HourlyContinuousCollection(dhi_head, diff_ir)
+        return cls(location, dni, dhi)
+
     @staticmethod
     def _get_datetimes(timestep, is_leap_year):
         """Get a list of annual datetimes based on timestep.
@@ -1077,3 +1156,46 @@ class Wea(object):
     def __repr__(self):
         """Wea object representation."""
         return "WEA [%s]" % self.location.city
+
+
+def _zhang_huang_irradiance(location, analysis_period, cloud_cover, relative_humidity,
+                            dry_bulb_temperature, wind_speed, atm_pressure, use_disc):
+    """Get lists of direct normal and diffuse horizontal Zhang-Huang irradiance.
+
+    Args:
+        location: Ladybug location object.
+        analysis_period: The AnalysisPeriod of the input values.
+        cloud_cover: A list of cloud cover values in tenths.
+        relative_humidity: A list of relative humidity values in percent.
+        dry_bulb_temperature: A list of dry bulb temperature values in Celsius.
+        wind_speed: A list of wind speed values in meters per second.
+        atm_pressure: A list of atmospheric pressure values in Pa.
+        use_disc: Boolean to note whether the original DISC model should be used.
+    """
+    # initiate sunpath based on location
+    sp = Sunpath.from_location(location)
+    sp.is_leap_year = analysis_period.is_leap_year
+
+    # calculate parameters needed for zhang-huang irradiance
+    suns = sp.calculate_sun_collection(analysis_period.datetimes)
+    altitudes = suns.altitudes
+    doys = [t_date.doy for t_date in suns.datetimes]
+    t3_steps = 3 * analysis_period.timestep
+    dry_bulb_t3_hrs = [dry_bulb_temperature[count - t3_steps]
+                       for count in xrange(len(dry_bulb_temperature))]
+
+    # calculate zhang-huang irradiance
+    return zhang_huang_solar_split(
+        altitudes, doys, cloud_cover, relative_humidity, dry_bulb_temperature,
+        dry_bulb_t3_hrs, wind_speed, atm_pressure, use_disc)
+
+
+def _zhang_huang_irradiance_from_dict(station):
+    """Get Zhang-Huang irradiance for a station with a location and period as dicts.
+
+    This is used to compute stations in a process pool since dictionaries of
+    the location and analysis period can be passed between processes.
+    """
+    location = Location.from_dict(station[0])
+    analysis_period = AnalysisPeriod.from_dict(station[1])
+    return _zhang_huang_irradiance(location, analysis_period, *station[2:])
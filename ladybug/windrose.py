@@ -2,7 +2,10 @@
 from __future__ import division
 
 import math
+import sys
+from itertools import compress, cycle
 
+from .analysisperiod import AnalysisPeriod
 from .color import ColorRange
 from .datacollection import HourlyContinuousCollection, HourlyDiscontinuousCollection
 from .datatype.speed import Speed
@@ -15,10 +18,14 @@ from ladybug_geometry.geometry2d.line import LineSegment2D
 from ladybug_geometry.geometry2d.polygon import Polygon2D
 from ladybug_geometry.geometry2d.mesh import Mesh2D
 
+if (sys.version_info >= (3, 0)):
+    xrange = range
+
 # Simplify method names
 linspace = HourlyContinuousCollection.linspace
 histogram = HourlyContinuousCollection.histogram
 histogram_circular = HourlyContinuousCollection.histogram_circular
+in_circular_bin = HourlyContinuousCollection._in_circular_bin
 
 
 class WindRose(object):
@@ -39,6 +46,7 @@ class WindRose(object):
     Properties:
         * direction_data_collection
         * analysis_data_collection
+        * number_of_directions
         * direction_values
         * analysis_values
         * analysis_period
@@ -86,10 +94,6 @@ class WindRose(object):
         assert direction_data_collection.is_collection_aligned(
             analysis_data_collection), 'Windrose direction_data_collection must be' \
             'aligned with analysis_data_collection. The provided values are not aligned.'
-        assert number_of_directions > 0, 'The number of directions must be ' \
-            'greater then one to bin the data, (and greater then three for ' \
-            'plotting the wind rose). Currently the number_of_directions parameter is: '\
-            '{}'.format(number_of_directions)
 
         # Ensure the analysis period of the data collection has been validated
         if not direction_data_collection.validated_a_period:
@@ -105,16 +109,148 @@ class WindRose(object):
             [d % 360.0 for d in direction_data_collection.values]
         self._direction_data_collection = direction_data_collection.to_immutable()
         self._analysis_data_collection = analysis_data_collection.to_immutable()
-        self._number_of_directions = int(number_of_directions)
 
-        # Compute the windrose data and associated read-only properties
-        self._angles = WindRose._compute_angles(number_of_directions)
+        # Filter the values to be binned, which is re-used for all number_of_directions
         self._is_speed_data_type = isinstance(
             self._analysis_data_collection.header.data_type, Speed)
-        self._histogram_data, self._zero_count = \
-            self._compute_windrose_data(self.direction_values, self.analysis_values,
-                                        self.angles, (0, 360), self._is_speed_data_type)
+        self._bin_directions, self._bin_values, self._zero_count = \
+            self._filter_windrose_data(self.direction_values, self.analysis_values,
+                                       self._is_speed_data_type)
+        self._direction_bins = {}  # bin indices of the values by number of directions
+        self._bin_ranks = None
+
+        # Compute the windrose data and associated read-only properties
+        self._set_number_of_directions(number_of_directions)
+        self._init_visualization_properties()
+
+    @classmethod
+    def from_periods(cls, direction_data_collection, analysis_data_collection,
+                     periods, number_of_directions=8):
+        """Create a list of WindRoses for several periods of the same wind data.
+
+        The values are filtered and binned by direction only once for the whole
+        data set. Every WindRose in the result then takes its share of the binned
+        values and they all share the same bin vectors for their geometry.
+
+        Args:
+            direction_data_collection: A HourlyContinuousCollection or
+                HourlyDiscontinuousCollection of wind directions.
+            analysis_data_collection: A HourlyContinuousCollection or
+                HourlyDiscontinuousCollection of wind values, corresponding to the
+                wind directions, which is "binned" by the direction intervals.
+            periods: A list of periods for which WindRoses will be created. Each
+                period can be an AnalysisPeriod, which will be used to filter the
+                data collections with filter_by_analysis_period, or a list of
+                True/False values, which will be used to filter the data
+                collections with filter_by_pattern.
+            number_of_directions: A number greater then zero that determines the
+                number of directions to "bin" the wind data by. (Default: 8).
+
+        Returns:
+            A list of WindRose objects with one for each of the input periods.
+        """
+        base = cls(direction_data_collection, analysis_data_collection,
+                   number_of_directions)
+        dir_data = base._direction_data_collection
+        an_data = base._analysis_data_collection
+
+        # get the position of each timestep's value in the binned values
+        if base._is_speed_data_type:
+            bin_steps = [i for i, v in enumerate(an_data.values) if v > 1e-10]
+        else:
+            bin_steps = range(len(an_data.values))
+        bin_positions = [-1] * len(an_data.values)
+        for i, step in enumerate(bin_steps):
+            bin_positions[step] = i
+        moy_steps = {moy: i for i, moy in enumerate(WindRose._collection_moys(dir_data))}
+
+        roses = []
+        for period in periods:
+            if isinstance(period, AnalysisPeriod):
+                p_dir_data = dir_data.filter_by_analysis_period(period)
+                p_an_data = an_data.filter_by_analysis_period(period)
+                steps = [moy_steps[m] for m in WindRose._collection_moys(p_dir_data)]
+            else:
+                p_dir_data = dir_data.filter_by_pattern(period)
+                p_an_data = an_data.filter_by_pattern(period)
+                steps = list(compress(xrange(len(dir_data)), cycle(period)))
+            roses.append(base._sub_windrose(p_dir_data, p_an_data, steps, bin_positions))
+        return roses
+
+    def _sub_windrose(self, direction_data_collection, analysis_data_collection,
+                      steps, bin_positions):
+        """Get a WindRose for a subset of this WindRose's data without binning it again.
+
+        Args:
+            direction_data_collection: The direction data collection filtered
+                to the subset.
+            analysis_data_collection: The analysis data collection filtered
+                to the subset.
+            steps: A list with the index of each timestep of the subset within
+                the data collections of this WindRose.
+            bin_positions: A list with the index of each timestep's value in the
+                binned values of this WindRose (or -1 if the value is not binned).
+        """
+        if not direction_data_collection.validated_a_period:
+            direction_data_collection = \
+                direction_data_collection.validate_analysis_period()
+        if not analysis_data_collection.validated_a_period:
+            analysis_data_collection = \
+                analysis_data_collection.validate_analysis_period()
+
+        # select the binned values of this WindRose that are in the subset
+        sub_positions = [pos for pos in map(bin_positions.__getitem__, steps)
+                         if pos != -1]
+        bin_directions = tuple(map(self._bin_directions.__getitem__, sub_positions))
+        bin_of, rank_of = self._direction_bin_ranks()
+        if sub_positions == sorted(sub_positions):
+            # the subset is in the same order so the order of this rose can be used
+            sort_keys = list(map(rank_of.__getitem__, sub_positions))
+        else:  # the subset is in a different order; sort values by direction
+            sort_keys = list(zip(bin_directions, xrange(len(sub_positions))))
+        direction_bins = [[] for _ in xrange(self._number_of_directions)]
+        sub_bins = list(map(bin_of.__getitem__, sub_positions))
+        for i in sorted(xrange(len(sub_positions)), key=sort_keys.__getitem__):
+            direction_bins[sub_bins[i]].append(i)
+        direction_bins = tuple(tuple(b) for b in direction_bins)
+
+        rose = self.__class__.__new__(self.__class__)
+        rose._direction_data_collection = direction_data_collection.to_immutable()
+        rose._analysis_data_collection = analysis_data_collection.to_immutable()
+        rose._is_speed_data_type = self._is_speed_data_type
+        rose._bin_directions = bin_directions
+        rose._bin_values = tuple(map(self._bin_values.__getitem__, sub_positions))
+        rose._zero_count = len(steps) - len(sub_positions)
+        rose._direction_bins = {self._number_of_directions: direction_bins}
+        rose._bin_ranks = None
+        rose._set_number_of_directions(self._number_of_directions)
+        rose._bin_vectors = self.bin_vectors
+        rose._init_visualization_properties()
+        return rose
+
+    def _direction_bin_ranks(self):
+        """Get the direction bin and the overall rank of each binned value.
 
+        Returns:
+            A tuple with two lists, which each have one item for each of the binned
+            values of this WindRose. The first list contains the index of the
+            direction bin of each value and the second contains the position of
+            each value when all of the bins are joined in order.
+        """
+        if self._bin_ranks is None or self._bin_ranks[0] != self._number_of_directions:
+            bin_of = [None] * len(self._bin_values)
+            rank_of = [None] * len(self._bin_values)
+            rank = 0
+            for j, b in enumerate(self._direction_bins[self._number_of_directions]):
+                for pos in b:
+                    bin_of[pos] = j
+                    rank_of[pos] = rank
+                    rank += 1
+            self._bin_ranks = (self._number_of_directions, bin_of, rank_of)
+        return self._bin_ranks[1:]
+
+    def _init_visualization_properties(self):
+        """Set the editable visualization properties to their defaults."""
         # Editable public properties for visualization
         self._legend_parameters = None
         self._frequency_spacing_distance = self.DEFAULT_FREQUENCY_SPACING
@@ -127,14 +263,25 @@ class WindRose(object):
         self._north = self.DEFAULT_NORTH
         self._poly_array = None
         self._color_array = None
-
-        # Fixed properties that only need to be computed once
-        self._bin_vectors = None
-        self._zeros_per_bin = None
-        self._real_freq_max = None
-        self._prevailing_direction = None
+        self._stacked_data = None  # nested histogram re-used across colored meshes
+        self._mesh_data = None  # mesh geometry re-used across colored meshes
         self._container = None
 
+    @property
+    def number_of_directions(self):
+        """Get or set the number of directions used to bin the wind data.
+
+        Changing this value re-uses the filtered direction values and any direction
+        binning that was already computed for a number of directions that can be
+        merged down to the new number. It also resets the frequency_intervals_compass
+        to its default, which depends on the largest direction bin.
+        """
+        return self._number_of_directions
+
+    @number_of_directions.setter
+    def number_of_directions(self, number_of_directions):
+        self._set_number_of_directions(number_of_directions)
+
     @property
     def base_point(self):
         """Get or set a Point2D used as the center point of the windrose geometry.
@@ -331,10 +478,13 @@ class WindRose(object):
             _real_freq_max = max([len(d) for d in self._histogram_data])
             _freq_int_mesh = int(math.ceil(_real_freq_max / self.frequency_hours))
             if self.frequency_intervals_compass < _freq_int_mesh:
-                new_histogram_data = []
-                for hbin in self._histogram_data:
-                    new_histogram_data.append(hbin[:self.frequency_maximum])
-                return tuple(new_histogram_data)
+                freq_max = self.frequency_maximum
+                if self._trimmed_histogram_data is None or \
+                        self._trimmed_histogram_data[0] != freq_max:
+                    new_histogram_data = tuple(
+                        hbin[:freq_max] for hbin in self._histogram_data)
+                    self._trimmed_histogram_data = (freq_max, new_histogram_data)
+                return self._trimmed_histogram_data[1]
 
         return self._histogram_data
 
@@ -450,64 +600,73 @@ class WindRose(object):
         self._compass = None
         self._container = None
 
-        zero_poly_array, zero_color_array = [], []
-        max_bar_radius = self.mesh_radius
-        min_bar_radius = self._zero_mesh_radius
-
-        if self.show_zeros and self.zero_count > 0:
-            # Compute the array for calm rose
-            zero_data = [[0] for _ in self.histogram_data]
-            zero_data_stacked = [[[0]] for _ in self.histogram_data]
-            zero_poly_array, zero_color_array = WindRose._compute_colored_mesh_array(
-                zero_data, zero_data_stacked, self.bin_vectors, 0, min_bar_radius,
-                show_freq=False)
-
-        # Calculate stacked_data
-        flat_data = [b for a in self.histogram_data for b in a]
-        max_data = max(flat_data)
-        min_data = min(self.analysis_values) if self.show_zeros else min(flat_data)
+        # Calculate stacked_data, re-using it if the data and legend segments match
+        histogram_data = self.histogram_data
         bin_count = self.legend_parameters.segment_count
-        data_range = (min_data, max_data)
-        histogram_data_stacked, bin_range = WindRose._histogram_data_nested(
-            self.histogram_data, data_range, bin_count)
+        stack_key = (histogram_data, self.show_zeros, self.show_freq, bin_count)
+        if self._stacked_data is None or self._stacked_data[0] != stack_key:
+            flat_data = [b for a in histogram_data for b in a]
+            max_data = max(flat_data)
+            min_data = min(self.analysis_values) if self.show_zeros else min(flat_data)
+            data_range = (min_data, max_data)
+            histogram_data_stacked, bin_range = WindRose._histogram_data_nested(
+                histogram_data, data_range, bin_count)
+
+            if not self.show_freq:
+                for i in range(self._number_of_directions):
+                    stack = histogram_data_stacked[i]
+                    vals = [b for a in stack for b in a]
+                    if len(vals) > 0:
+                        mean_val = sum(vals) / float(len(vals))
+                        histogram_data_stacked[i] = [[mean_val for b in a] for a in stack]
+            self._stacked_data = (stack_key, histogram_data_stacked, bin_range, min_data)
+        _, histogram_data_stacked, bin_range, min_data = self._stacked_data
         data_step = bin_range[1] - bin_range[0]
 
-        if not self.show_freq:
-            for i in range(self._number_of_directions):
-                stack = histogram_data_stacked[i]
-                vals = [b for a in stack for b in a]
-                if len(vals) > 0:
-                    mean_val = sum(vals) / float(len(vals))
-                    histogram_data_stacked[i] = [[mean_val for b in a] for a in stack]
-        poly_array, color_array = WindRose._compute_colored_mesh_array(
-            self.histogram_data, histogram_data_stacked, self.bin_vectors,
-            min_bar_radius, max_bar_radius, self.show_freq)
-
-        # Compute colors
-        # If show_freq, assign colors to intervals. Else keep averages.
-        if self.show_freq:
-            for i, mean_val in enumerate(color_array):
-                for j in range(len(bin_range) - 1):
-                    if bin_range[j] <= mean_val < bin_range[j+1]:
-                        color_array[i] = j
-                        break
-            if self.show_zeros:
-                color_array = [c + 1 for c in color_array]
-
-            # convert bin legend interval to the average interval (interval midpoint)
-            color_array = [(c * data_step) + min_data for c in color_array]
-        poly_array += zero_poly_array
-        color_array += zero_color_array
+        # Compute the mesh geometry, re-using it if only the colors have changed
+        max_bar_radius = self.mesh_radius
+        min_bar_radius = self._zero_mesh_radius
+        mesh_key = (self._stacked_data, min_bar_radius, max_bar_radius)
+        if self._mesh_data is None or self._mesh_data[0] != mesh_key:
+            zero_poly_array, zero_color_array = [], []
+            if self.show_zeros and self.zero_count > 0:
+                # Compute the array for calm rose
+                zero_data = [[0] for _ in histogram_data]
+                zero_data_stacked = [[[0]] for _ in histogram_data]
+                zero_poly_array, zero_color_array = \
+                    WindRose._compute_colored_mesh_array(
+                        zero_data, zero_data_stacked, self.bin_vectors, 0,
+                        min_bar_radius, show_freq=False)
+
+            poly_array, color_array = WindRose._compute_colored_mesh_array(
+                histogram_data, histogram_data_stacked, self.bin_vectors,
+                min_bar_radius, max_bar_radius, self.show_freq)
+
+            # Compute colors
+            # If show_freq, assign colors to intervals. Else keep averages.
+            if self.show_freq:
+                for i, mean_val in enumerate(color_array):
+                    for j in range(len(bin_range) - 1):
+                        if bin_range[j] <= mean_val < bin_range[j+1]:
+                            color_array[i] = j
+                            break
+                if self.show_zeros:
+                    color_array = [c + 1 for c in color_array]
+
+                # convert bin legend interval to the average interval (interval midpoint)
+                color_array = [(c * data_step) + min_data for c in color_array]
+            poly_array += zero_poly_array
+            color_array += zero_color_array
+            vertices, faces = WindRose._mesh_vertices_faces(poly_array)
+            self._mesh_data = (mesh_key, poly_array, color_array, vertices, faces)
 
         # Store colors and polygons before processing
-        self._poly_array = poly_array
-        self._color_array = color_array  # for testing
+        _, self._poly_array, self._color_array, vertices, faces = self._mesh_data
 
         # Assign colors
         _color_range = self.color_range
-        _color_range = [_color_range.color(val) for val in color_array]
-        mesh = Mesh2D.from_face_vertices(poly_array, purge=True)
-        mesh.colors = tuple(_color_range)
+        _color_range = [_color_range.color(val) for val in self._color_array]
+        mesh = Mesh2D(vertices, faces, tuple(_color_range))
 
         # Scale up unit circle to windrose radius (and other transforms)
         return self._transform(mesh)
@@ -586,7 +745,8 @@ class WindRose(object):
             # there. If _poly_array is not set, compute colored_mesh.
             _ = self.colored_mesh
 
-        return [self._transform(Polygon2D(vecs)) for vecs in self._poly_array]
+        return [self._transform(Polygon2D.from_array(vecs))
+                for vecs in self._poly_array]
 
     @property
     def mesh_radius(self):
@@ -687,32 +847,18 @@ class WindRose(object):
             List of vector arrays representing a stacked histogram bar.
         """
         bar_interval_vecs = []
-        si = -1
-
-        for j, st in enumerate(stacks):
-            if len(st) > 0:
-                si = j
-                break
-
-        if si == -1:
-            return bar_interval_vecs
-
         ytick_dist_inc = min_bar_radius
-        for i in range(si, len(stacks)):
+        for stack in stacks:
             # Stack vectors for interval wedges
-            if len(stacks[i]) == 0:
+            if len(stack) == 0:
                 continue
-
-            ytick_dist_inc += (len(stacks[i]) / max_bar_num * curr_bar_radius)
+            ytick_dist_inc += (len(stack) / max_bar_num * curr_bar_radius)
 
             # Vector multiplication with y_dist_inc and add to bar_coords
-            bar_interval_vecs.append(base_vec_show_freq +
-                                     [(vec1[0] * ytick_dist_inc,
-                                       vec1[1] * ytick_dist_inc),
-                                      (vec2[0] * ytick_dist_inc,
-                                       vec2[1] * ytick_dist_inc)])
-            # Update
-            base_vec_show_freq = list(reversed(bar_interval_vecs[-1][-2:]))
+            pt1 = (vec1[0] * ytick_dist_inc, vec1[1] * ytick_dist_inc)
+            pt2 = (vec2[0] * ytick_dist_inc, vec2[1] * ytick_dist_inc)
+            bar_interval_vecs.append(base_vec_show_freq + [pt1, pt2])
+            base_vec_show_freq = [pt2, pt1]  # top of this bar is base of the next
 
         return bar_interval_vecs
 
@@ -738,8 +884,8 @@ class WindRose(object):
         # Plot histogram bar in radial coordinates
         hist_coords = []
         for i, curr_stacks in enumerate(hist_stacked):
-
-            if len([b for a in curr_stacks for b in a]) == 0:
+            curr_bar_num = sum(len(a) for a in curr_stacks)
+            if curr_bar_num == 0:
                 continue
 
             # Compute the current bar radius
@@ -758,7 +904,6 @@ class WindRose(object):
                     max_bar_num, curr_stacks)
                 hist_coords.extend(bar_vecs)
             else:
-                curr_bar_num = len([b for a in curr_stacks for b in a])
                 frac_len = curr_bar_num / max_bar_num
                 curr_bar_radius = delta_bar_radius * frac_len
                 bar_vecs = base + [(vec1[0] * (curr_bar_radius + min_bar_radius),
@@ -769,22 +914,99 @@ class WindRose(object):
 
         return hist_coords
 
-    @staticmethod
-    def _compute_windrose_data(direction_values, analysis_values, bin_array, bin_range,
-                               is_speed_data_type):
+    def _set_number_of_directions(self, number_of_directions):
+        """Set the number of directions and compute the histogram data for it."""
+        assert number_of_directions > 0, 'The number of directions must be ' \
+            'greater then one to bin the data, (and greater then three for ' \
+            'plotting the wind rose). Currently the number_of_directions parameter is: '\
+            '{}'.format(number_of_directions)
+        self._number_of_directions = int(number_of_directions)
+        self._angles = WindRose._compute_angles(self._number_of_directions)
+        bins = self._direction_bin_indices(self._number_of_directions)
+        self._histogram_data = tuple(
+            tuple(self._bin_values[i] for i in b) for b in bins)
+
+        # Reset properties that depend on the number of directions
+        self._frequency_intervals_compass = None
+        self._trimmed_histogram_data = None
+        self._bin_vectors = None
+        self._zeros_per_bin = None
+        self._real_freq_max = None
+        self._prevailing_direction = None
+        self._compass = None
+        self._container = None
+
+    def _direction_bin_indices(self, number_of_directions):
+        """Get the indices of the filtered values in each direction bin.
+
+        Bins are cached by number of directions. When the bins have already been
+        computed for a number of directions that is an odd multiple of the requested
+        number, the edges of the coarse bins fall on edges of the fine bins and so
+        the fine bins are merged instead of binning all of the values again.
+
+        Args:
+            number_of_directions: The number of directions for which bins are needed.
+
+        Returns:
+            A tuple with a tuple of value indices for each direction bin. Indices
+            in each bin are sorted by direction.
         """
-        Computes the histogram for the windrose.
+        try:
+            return self._direction_bins[number_of_directions]
+        except KeyError:
+            pass
+        angles, dirs = self._angles, self._bin_directions
+        fine_counts = [m for m in self._direction_bins if m % number_of_directions == 0
+                       and (m // number_of_directions) % 2 == 1]
+        if fine_counts:  # merge the bins of the finest matching resolution
+            fine_count = max(fine_counts)
+            fine_bins = self._direction_bins[fine_count]
+            step = fine_count // number_of_directions
+            half = step // 2
+            bins = []
+            for j in range(number_of_directions):
+                fine_js = [(j * step + k) % fine_count for k in range(-half, half + 1)]
+                bins.append([i for k in fine_js for i in fine_bins[k]])
+            # values at the coarse bin edges may be on the other side after rounding
+            for j in range(number_of_directions):
+                fine_edges = (fine_bins[(j * step - half) % fine_count],
+                              fine_bins[(j * step + half) % fine_count])
+                for i in set(i for f_bin in fine_edges for i in f_bin):
+                    if not in_circular_bin(dirs[i], angles[j], angles[j + 1], (0, 360)):
+                        bins[j].remove(i)
+                        for n_j in ((j + 1) % number_of_directions,
+                                    (j - 1) % number_of_directions):
+                            if in_circular_bin(
+                                    dirs[i], angles[n_j], angles[n_j + 1], (0, 360)):
+                                bins[n_j].append(i)
+                                break
+            bins = [sorted(b) for b in bins]
+        else:
+            bins = histogram_circular(dirs, angles, (0, 360), output='indices')
+        bins = tuple(tuple(sorted(b, key=lambda i: dirs[i])) for b in bins)
+        self._direction_bins[number_of_directions] = bins
+        return bins
+
+    @staticmethod
+    def _collection_moys(data_collection):
+        """Get a list of minutes of the year for each value of a data collection."""
+        if isinstance(data_collection, HourlyContinuousCollection):
+            return data_collection.header.analysis_period.moys
+        return [dt.moy for dt in data_collection.datetimes]
+
+    @staticmethod
+    def _filter_windrose_data(direction_values, analysis_values, is_speed_data_type):
+        """Filter the values to be binned by the windrose.
 
         Args:
             direction_values: Hourly direction values to bin analysis data by.
             analysis_values: Hourly analysis values.
-            bin_intervals: Number of bins for the histogram.
-            bin_array: Bin edges as list of direction values.
-            bin_range: Maximum and minimum range for histogram.
+            is_speed_data_type: Boolean to note whether the analysis values are
+                speeds, in which case the zero values are filtered out.
 
         Returns:
-            The histogram, a proxy histogram to represent zero values, and the
-                number of zeros in the analysis values, as a tuple.
+            A tuple with the direction values and analysis values to be binned,
+            and the number of zeros in the analysis values.
         """
         # Filter out zero values if looking at wind speed values
         if is_speed_data_type:
@@ -800,16 +1022,7 @@ class WindRose(object):
 
         # Calculate zero rose properties
         zero_count = (len(analysis_values) - len(_analysis_values))
-
-        # Regular hist data
-        data = histogram_circular(
-            zip(_direction_values, _analysis_values), bin_array, bin_range,
-            key=lambda v: v[0])
-
-        # Filter out the direction values and make immutable
-        data = tuple(tuple(val[1] for val in bin) for bin in data)
-
-        return data, zero_count
+        return tuple(_direction_values), tuple(_analysis_values), zero_count
 
     @staticmethod
     def _histogram_data_nested(histogram_data, analysis_range, bin_count):
@@ -869,7 +1082,11 @@ class WindRose(object):
             max_radius: Maximum radius for windrose mesh.
             show_freq: Boolean indicating if stacked histogram.
         Returns:
-            A colored Mesh2D.
+            A tuple with two items.
+
+            - A list of mesh faces, each as a list of (x, y) coordinate tuples.
+
+            - A list of values, which will be used to color each of the faces.
         """
 
         # Default rose is a unit circle centered at origin. We can scale and translate
@@ -896,13 +1113,40 @@ class WindRose(object):
         else:
             for stack in hist_data_stacked:
                 # Value is already averaged
-                vals = [b for a in stack for b in a]
-                if len(vals) > 0:
-                    color_array.append(vals[0])
+                for a in stack:
+                    if len(a) > 0:
+                        color_array.append(a[0])
+                        break
+
+        return hist_coords, color_array
+
+    @staticmethod
+    def _mesh_vertices_faces(face_coords):
+        """Get the vertices and faces of a Mesh2D with faces as coordinate tuples.
+
+        Duplicate vertices are shared between the faces in the same way as the
+        Mesh2D.from_face_vertices method with purge set to True but the vertices are
+        looked up by their coordinates in a single pass over the faces.
+
+        Args:
+            face_coords: A list of faces with each face as a list of (x, y) tuples.
 
-        # Make mesh
-        mesh_array = [[Point2D.from_array(vec) for vec in vecs] for vecs in hist_coords]
-        return mesh_array, color_array
+        Returns:
+            A tuple with a tuple of Point2D vertices and a tuple of mesh faces.
+        """
+        vert_indices, vert_coords, faces = {}, [], []
+        for face in face_coords:
+            ind = []
+            for coord in face:
+                try:
+                    ind.append(vert_indices[coord])
+                except KeyError:  # add a new vertex
+                    vert_indices[coord] = len(vert_coords)
+                    ind.append(len(vert_coords))
+                    vert_coords.append(coord)
+            faces.append(tuple(ind))
+        vertices = tuple(Point2D(x, y) for x, y in vert_coords)
+        return vertices, tuple(faces)
 
     def _transform(self, geometry):
         """Check if geometry defaults and apply transformations."""
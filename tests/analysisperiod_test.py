@@ -110,6 +110,44 @@ def test_moys_hoys_hoys_int():
     assert len(ap.moys) == len(ap.hoys) == len(ap.hoys_int)
 
 
+def test_moys_sub_hourly():
+    """Test the moys of sub-hourly, reversed and overnight analysis periods."""
+    ap = AnalysisPeriod(timestep=60)
+    assert ap.moys == tuple(xrange(525600))
+    assert len(ap) == 525600
+
+    ap_2 = AnalysisPeriod(2, 20, 9, 2, 22, 17, timestep=4)
+    assert len(ap_2) == 3 * (8 * 4 + 1)
+    assert ap_2.datetimes[0] == DateTime(2, 20, 9)
+    assert ap_2.datetimes[32] == DateTime(2, 20, 17)
+    assert ap_2.datetimes[33] == DateTime(2, 21, 9)
+    assert ap_2.datetimes[-1] == DateTime(2, 22, 17)
+
+    ap_3 = AnalysisPeriod(12, 31, 0, 1, 1, 23, timestep=2)
+    assert len(ap_3) == 2 * 24 * 2
+    assert ap_3.moys[47] == 525570
+    assert ap_3.moys[48] == 0
+    assert ap_3.datetimes[-1] == DateTime(1, 1, 23, 30)
+
+    ap_4 = AnalysisPeriod(1, 1, 22, 1, 3, 2, timestep=2)
+    assert ap_4.hoys == (22, 22.5, 23, 23.5, 24, 24.5, 25, 25.5, 26,
+                         46, 46.5, 47, 47.5, 48, 48.5, 49, 49.5, 50)
+
+    for a_per in (ap_2, ap_3, ap_4):
+        assert tuple(dt.moy for dt in a_per.datetimes) == a_per.moys
+
+
+def test_shared_time_axis():
+    """Test that equal analysis periods share the same moys and datetimes."""
+    ap_1 = AnalysisPeriod(3, 1, 0, 3, 31, 23, timestep=2)
+    ap_2 = AnalysisPeriod(3, 1, 0, 3, 31, 23, timestep=2)
+    ap_3 = ap_1.duplicate()
+    assert ap_2.datetimes is ap_1.datetimes
+    assert ap_3.moys is ap_1.moys
+    assert ap_3.datetimes is ap_1.datetimes
+    assert AnalysisPeriod(3, 1, 0, 3, 31, 23).moys is not ap_1.moys
+
+
 def test_doys_int():
     """Test the doys_int property."""
     ap = AnalysisPeriod()
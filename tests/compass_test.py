@@ -107,3 +107,15 @@ def test_label_points_from_angles():
     assert len(lines) == len(angles)
     for lin in lines:
         assert isinstance(lin, LineSegment2D)
+
+
+def test_points3d_projection():
+    """Test the projection of several Point3D to 2D space at once."""
+    origin = Point3D(10, 5, 0)
+    pts = [Point3D(10, 105, 0), Point3D(10, 5, 100), Point3D(60, 55, 70.7)]
+    ortho_pts = Compass.points3d_to_orthographic(pts)
+    stereo_pts = Compass.points3d_to_stereographic(pts, 100, origin)
+    for pt, o_pt, s_pt in zip(pts, ortho_pts, stereo_pts):
+        assert o_pt == Compass.point3d_to_orthographic(pt)
+        assert s_pt == Compass.point3d_to_stereographic(pt, 100, origin)
+    assert stereo_pts[1] == Point2D(10, 5)
@@ -1075,6 +1075,54 @@ def test_interpolate_holes():
     assert len(interp_coll2.values) == 24
 
 
+def test_interpolate_holes_after_first_value():
+    """Test interpolate_holes with a hole immediately after the first value."""
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    dts = [DateTime(6, 21, 0), DateTime(6, 21, 2), DateTime(6, 21, 3)]
+    dc1 = HourlyDiscontinuousCollection(Header(Temperature(), 'C', a_per),
+                                        [20, 30, 40], dts)
+    interp_coll = dc1.validate_analysis_period().interpolate_holes()
+    assert interp_coll.values[:5] == (20, 25, 30, 40, 40)
+
+    epw = EPW('./tests/fixtures/epw/chicago.epw')
+    rh = epw.relative_humidity.filter_by_analysis_period(
+        AnalysisPeriod(3, 1, 0, 4, 30, 23))
+    rh_filt = rh.filter_by_conditional_statement('a > {}'.format(rh.average))
+    interp_coll = rh_filt.validate_analysis_period().interpolate_holes()
+    interp_moys = {dt.moy: val for dt, val in
+                   zip(interp_coll.datetimes, interp_coll.values)}
+    for dt, val in zip(rh_filt.datetimes, rh_filt.values):
+        assert interp_moys[dt.moy] == val
+
+
+def test_interpolate_holes_methods():
+    """Test the cubic and monotone methods of interpolate_holes."""
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    dts = [DateTime(6, 21, 3), DateTime(6, 21, 6), DateTime(6, 21, 12),
+           DateTime(6, 21, 14)]
+    dc1 = HourlyDiscontinuousCollection(Header(Temperature(), 'C', a_per),
+                                        [20, 25, 25, 30], dts)
+    dc2 = dc1.validate_analysis_period()
+
+    lin_coll = dc2.interpolate_holes()
+    cub_coll = dc2.interpolate_holes('cubic')
+    mon_coll = dc2.interpolate_holes('monotone')
+    for coll in (lin_coll, cub_coll, mon_coll):
+        assert isinstance(coll, HourlyContinuousCollection)
+        assert len(coll.values) == 24
+        assert coll[0] == coll[3] == 20
+        assert coll[6] == coll[12] == 25
+        assert coll[14] == coll[23] == 30
+    assert lin_coll[9] == 25
+    assert cub_coll[9] != 25  # the cubic spline overshoots the flat section
+    assert mon_coll[9] == 25  # the monotone spline does not overshoot
+    for i in range(3, 6):
+        assert 20 <= mon_coll[i] <= mon_coll[i + 1] <= 25
+
+    with pytest.raises(AssertionError):
+        dc2.interpolate_holes('quadratic')
+
+
 def test_cull_to_timestep():
     """Test the test_cull_to_timestep method on the discontinuous collection."""
     a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
@@ -1109,6 +1157,87 @@ def test_interpolate_to_timestep():
     assert 'Minute' in interp_coll1.timestep_text
 
 
+def test_interpolate_to_timestep_methods():
+    """Test the interpolation methods on the continuous collection."""
+    values = [0] * 12 + [10] * 12
+    test_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    dc1 = HourlyContinuousCollection(test_header, values)
+
+    lin_coll = dc1.interpolate_to_timestep(4)
+    cub_coll = dc1.interpolate_to_timestep(4, method='cubic')
+    mon_coll = dc1.interpolate_to_timestep(4, method='monotone')
+    for coll in (lin_coll, cub_coll, mon_coll):
+        assert len(coll) == 96
+        assert coll.header.analysis_period.timestep == 4
+        assert coll[0] == 0
+        assert coll[48] == 10
+        assert coll[46] == 5
+    assert lin_coll.bounds == (0, 10)
+    assert mon_coll.bounds == (0, 10)
+    assert cub_coll.min < 0 and cub_coll.max > 10
+
+    # check that a sub-hourly collection can be interpolated further
+    dc2 = lin_coll.interpolate_to_timestep(12)
+    assert len(dc2) == 288
+    assert dc2[3] == lin_coll[1]
+    for v1, v2 in zip(dc2.values, dc1.interpolate_to_timestep(12).values):
+        assert v1 == pytest.approx(v2, rel=1e-9)
+
+    with pytest.raises(AssertionError):
+        dc1.interpolate_to_timestep(4, method='quadratic')
+
+
+def test_aggregate_to_timestep():
+    """Test the aggregate_to_timestep method on the continuous collection."""
+    a_per = AnalysisPeriod(end_month=1, end_day=1, timestep=4)
+    energy_coll = HourlyContinuousCollection(
+        Header(Energy(), 'kWh', a_per), list(xrange(96)))
+    temp_coll = HourlyContinuousCollection(
+        Header(Temperature(), 'C', a_per), list(xrange(96)))
+
+    energy_hr = energy_coll.aggregate_to_timestep()
+    assert isinstance(energy_hr, HourlyContinuousCollection)
+    assert energy_hr.header.analysis_period.timestep == 1
+    assert energy_hr.header.metadata['operation'] == 'total'
+    assert len(energy_hr) == 24
+    assert energy_hr[0] == 0 + 1 + 2 + 3
+    assert energy_hr.total == energy_coll.total
+    assert energy_coll.aggregate_to_timestep(2, 'max')[1] == 3
+
+    temp_hr = temp_coll.aggregate_to_timestep(1)
+    assert temp_hr.header.metadata['operation'] == 'average'
+    assert temp_hr[1] == (2 + 3 + 4 + 5) / 4  # point in time values are centered
+    assert temp_hr[0] == (94 + 95 + 0 + 1) / 4
+    assert temp_coll.aggregate_to_timestep(1, 'min')[1] == 2
+    assert temp_coll.aggregate_to_timestep(4).values == temp_coll.values
+
+    with pytest.raises(AssertionError):
+        temp_coll.aggregate_to_timestep(3)
+    with pytest.raises(ValueError):
+        temp_coll.aggregate_to_timestep(1, 'median')
+
+
+def test_aggregate_to_timestep_discontinuous():
+    """Test the aggregate_to_timestep method on the discontinuous collection."""
+    a_per = AnalysisPeriod(6, 21, 12, 6, 21, 13, timestep=4)
+    dts = [DateTime(6, 21, 12), DateTime(6, 21, 12, 15), DateTime(6, 21, 12, 45),
+           DateTime(6, 21, 13, 15)]
+    dc1 = HourlyDiscontinuousCollection(Header(Energy(), 'kWh', a_per),
+                                        [1, 2, 3, 4], dts)
+    dc1 = dc1.validate_analysis_period()
+    dc2 = dc1.aggregate_to_timestep()
+    assert isinstance(dc2, HourlyDiscontinuousCollection)
+    assert dc2.header.analysis_period.timestep == 1
+    assert dc2.values == (6, 4)
+    assert dc2.datetimes == (DateTime(6, 21, 12), DateTime(6, 21, 13))
+    assert dc2.validated_a_period
+
+    dc3 = dc1.aggregate_to_timestep(2, 'average')
+    assert dc3.values == (1.5, 3, 4)
+    assert dc3.datetimes == (DateTime(6, 21, 12), DateTime(6, 21, 12, 30),
+                             DateTime(6, 21, 13))
+
+
 def test_is_collection_aligned():
     """Test the test_is_collection_aligned method for discontinuous collections."""
     header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
@@ -1143,6 +1272,33 @@ def test_is_collection_aligned():
         [dc1, dc2, dc3], False)
 
 
+def test_is_collection_aligned_shared_datetimes():
+    """Test alignment checks of discontinuous collections with shared datetimes."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    dts = [DateTime(1, 1, h) for h in xrange(0, 24, 2)]
+    dc1 = HourlyDiscontinuousCollection(header, list(xrange(12)), dts)
+    dc2 = dc1 + dc1
+    dc3 = HourlyDiscontinuousCollection(header, [0] * 12, list(dts))
+    dc4 = HourlyDiscontinuousCollection(header, [0] * 12, dts[1:] + [DateTime(1, 1, 23)])
+    assert dc2.datetimes is dc1.datetimes
+    assert dc1.is_collection_aligned(dc2)
+    assert dc1.is_collection_aligned(dc3)
+    assert not dc1.is_collection_aligned(dc4)
+    assert dc1._get_datetimes_hash() == dc3._get_datetimes_hash()
+
+    header2 = Header(Temperature(), 'C', AnalysisPeriod(
+        end_month=1, end_day=1, timestep=2))
+    dc5 = HourlyDiscontinuousCollection(
+        header, [0] * 24, header.analysis_period.datetimes)
+    dc6 = HourlyDiscontinuousCollection(
+        header2, [0] * 48, header2.analysis_period.datetimes)
+    assert not dc5.is_collection_aligned(dc6)
+    assert dc6.is_collection_aligned(dc6.duplicate())
+    dc6.convert_to_culled_timestep()
+    assert isinstance(dc6.datetimes, tuple)
+    assert dc5.is_collection_aligned(dc6)
+
+
 def test_is_collection_aligned_continuous():
     """Test the test_is_collection_aligned method for continuous collections."""
     header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
@@ -1164,6 +1320,17 @@ def test_is_collection_aligned_continuous():
         [dc1, dc2, dc3], False)
 
 
+def test_shared_datetimes_continuous():
+    """Test that continuous collections with equal analysis periods share datetimes."""
+    epw = EPW('./tests/fixtures/epw/chicago.epw')
+    db_temp, rel_hum = epw.dry_bulb_temperature, epw.relative_humidity
+    assert db_temp.datetimes is rel_hum.datetimes
+    assert db_temp.duplicate().datetimes is db_temp.datetimes
+    assert (db_temp + 1).datetimes is db_temp.datetimes
+    assert db_temp.get_aligned_collection().datetimes is db_temp.datetimes
+    assert db_temp.to_discontinuous().datetimes is db_temp.datetimes
+
+
 def test_get_aligned_collection():
     """Test the method for getting an aligned discontinuous collection."""
     header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
@@ -1465,6 +1632,45 @@ def test_histogram_circular():
             assert _chkh == pytest.approx(_h, abs=1e-10)
 
 
+def test_histogram_output():
+    """Test the histogram with counts and indices outputs."""
+    vals = [1.5, 0, 3, 0.9, 2, 1, 0, 1.99]
+    bins = (0, 1, 2, 3)
+    assert histogram(vals, bins) == [[0, 0, 0.9], [1, 1.5, 1.99], [2]]
+    assert histogram(vals, bins, output='counts') == [3, 3, 1]
+    assert histogram(vals, bins, output='indices') == [[1, 3, 6], [0, 5, 7], [4]]
+
+    # Test non-uniform bins
+    bins = (0, 0.5, 2, 3)
+    assert histogram(vals, bins) == [[0, 0], [0.9, 1, 1.5, 1.99], [2]]
+    assert histogram(vals, bins, output='counts') == [2, 4, 1]
+
+    # Test rounding at the bin edges
+    bin_arr = linspace(0, 1, 11)
+    vals = [i / 10. for i in range(10)] + [0.3, 0.7]
+    assert histogram(vals, bin_arr, output='counts') == \
+        [len([v for v in vals if bin_arr[i] <= v < bin_arr[i + 1]]) for i in range(10)]
+
+    with pytest.raises(ValueError):
+        histogram(vals, bins, output='frequency')
+
+
+def test_histogram_circular_output():
+    """Test the histogram_circular with counts and indices outputs."""
+    bin_arr = [315, 345, 15, 45]
+    vals = [315, 330, 331, 345, 350, 0, 0, 1, 16, 30, 44, 45, 200]
+    hist = histogram_circular(vals, bin_arr, hist_range=(0, 360))
+    assert hist == [[315, 330, 331], [0, 0, 1, 345, 350], [16, 30, 44]]
+    assert histogram_circular(vals, bin_arr, (0, 360), output='counts') == [3, 5, 3]
+    assert histogram_circular(vals, bin_arr, (0, 360), output='indices') == \
+        [[0, 1, 2], [3, 4, 5, 6, 7], [8, 9, 10]]
+
+    # Test non-uniform bins
+    bin_arr = [350, 10, 90, 180]
+    hist = histogram_circular(vals, bin_arr, hist_range=(0, 360))
+    assert hist == [[0, 0, 1, 350], [16, 30, 44, 45], []]
+
+
 def test_normalize_by_area():
     """Test the normalize_by_area method."""
     a_per = AnalysisPeriod(6, 21, 12, 6, 21, 13)
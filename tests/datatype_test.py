@@ -10,6 +10,8 @@ from ladybug.datatype import angle, area, distance, energy, energyflux, \
 
 import pytest
 import math
+import subprocess
+import sys
 PI = math.pi
 
 
@@ -21,6 +23,18 @@ def test_global_properties():
     assert isinstance(datatype.TYPESDICT, dict)
 
 
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='requires module __getattr__')
+def test_lazy_import():
+    """Test that data type modules are only imported once they are accessed."""
+    code = 'import sys; import ladybug.datatype as dt; ' \
+        'print("ladybug.datatype.temperature" in sys.modules); ' \
+        'print(dt.temperature.Temperature.__name__); print(len(dt.TYPESDICT) > 50)'
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode('utf-8').split() == ['False', 'Temperature', 'True']
+    with pytest.raises(AttributeError):
+        datatype.not_a_data_type_module
+
+
 def test_from_dict():
     """Test the from dict method."""
     sample_dict = {'name': 'Temperature',
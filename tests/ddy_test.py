@@ -186,3 +186,76 @@ def test_design_day_hourly_data():
 
     # sky cover values
     hi_data_collect = des_day.hourly_horizontal_infrared
+
+
+def test_design_day_hourly_data_edits():
+    """Test that hourly data properties update when the conditions are edited."""
+    location = Location('Test City', '-', 'USA', 34.20, -118.35, -8, 226)
+    date = Date(8, 21)
+    des_day = DesignDay.from_design_day_properties(
+        'Test Day', 'SummerDesignDay', location, date, 36.8, 13.2,
+        'Wetbulb', 20.5, 98639, 3.9, 170, 'ASHRAETau', [0.436, 2.106])
+    db_data = des_day.hourly_dry_bulb
+    rad_data = des_day.hourly_solar_radiation
+    assert des_day.hourly_dry_bulb.values == db_data.values
+    assert des_day.hourly_dry_bulb is not db_data
+
+    # editing the returned data collection does not affect the design day
+    db_data[0] = 100
+    assert des_day.hourly_dry_bulb[0] != 100
+
+    # editing a condition in place updates the hourly data
+    des_day.dry_bulb_condition.dry_bulb_max = 30
+    assert des_day.hourly_dry_bulb[14] == approx(30, rel=1e-3)
+    des_day.sky_condition.tau_b = 0.5
+    assert des_day.hourly_solar_radiation[0][11] < rad_data[0][11]
+
+    # assigning a new condition updates the hourly data
+    new_des_day = des_day.duplicate()
+    new_des_day.humidity_condition.humidity_value = 15
+    dpt_data = des_day.hourly_dew_point
+    des_day.humidity_condition = new_des_day.humidity_condition
+    assert des_day.hourly_dew_point[0] < dpt_data[0]
+    assert des_day.hourly_dew_point.values == new_des_day.hourly_dew_point.values
+
+
+def test_design_day_hourly_data_hash_collision():
+    """Test that hourly data updates when conditions change to equal hashes."""
+    location = Location('Test City', '-', 'USA', 34.20, -118.35, -8, 226)
+    date = Date(1, 21)
+    des_day = DesignDay.from_design_day_properties(
+        'Test Day', 'WinterDesignDay', location, date, -1.0, 0,
+        'Dewpoint', -10, 98639, 3.9, 170, 'ASHRAEClearSky', [0])
+    assert hash(-1.0) == hash(-2.0)  # CPython uses -2 for the hash of -1
+    assert des_day.hourly_dry_bulb[0] == approx(-1.0)
+    des_day.dry_bulb_condition.dry_bulb_max = -2.0
+    assert des_day.hourly_dry_bulb[0] == approx(-2.0)
+
+    new_des_day = des_day.duplicate()
+    new_des_day.dry_bulb_condition.dry_bulb_max = -1.0
+    profiles = list(DesignDay.hourly_profiles([des_day, new_des_day]))
+    assert profiles[0]['dry_bulb'][0] == approx(-2.0)
+    assert profiles[1]['dry_bulb'][0] == approx(-1.0)
+
+
+def test_design_day_hourly_profiles():
+    """Test the hourly_profiles method against the properties of each design day."""
+    ddy = DDY.from_ddy_file('./tests/fixtures/ddy/chicago.ddy')
+    des_days = [des_day.duplicate() for des_day in ddy.design_days * 2]
+    chk_des_days = [des_day.duplicate() for des_day in des_days]
+
+    profiles = list(DesignDay.hourly_profiles(des_days))
+    assert len(profiles) == len(des_days)
+    for profile, des_day in zip(profiles, chk_des_days):
+        assert profile['dry_bulb'].values == des_day.hourly_dry_bulb.values
+        assert profile['dew_point'].values == des_day.hourly_dew_point.values
+        assert profile['relative_humidity'].values == \
+            des_day.hourly_relative_humidity.values
+        assert profile['horizontal_infrared'].values == \
+            des_day.hourly_horizontal_infrared.values
+        dir_norm, diff_horiz, glob_horiz = des_day.hourly_solar_radiation
+        assert profile['direct_normal_radiation'].values == dir_norm.values
+        assert profile['diffuse_horizontal_radiation'].values == diff_horiz.values
+        assert profile['global_horizontal_radiation'].values == glob_horiz.values
+        assert profile['dry_bulb'].header.analysis_period == \
+            des_day.hourly_dry_bulb.header.analysis_period
@@ -0,0 +1,56 @@
+# coding=utf-8
+from ladybug.idfutil import parse_idf_objects, parse_idf_string
+
+import pytest
+
+
+IDF_TEXT = """
+ ! Site:Location, Commented Out, 0, 0, 0, 0;
+ Site:Location,
+  Chicago Ohare Intl Ap_IL_USA Design_Conditions,     !- Location Name
+      41.98,     !- Latitude {N+ S-}
+     -87.92,     !- Longitude {W- E+}
+      -6.00,     !- Time Zone Relative to GMT {GMT+/-}
+     201.00;     !- Elevation {m}
+
+ RunPeriodControl:DaylightSavingTime,
+   2nd Sunday in March,    !- StartDate
+   2nd Sunday in November;    !- EndDate
+ Timestep, 6; Version, 9.1;
+"""
+
+
+def test_parse_idf_objects():
+    """Test the parsing of all objects in an IDF string."""
+    objects = list(parse_idf_objects(IDF_TEXT))
+    assert [obj[0] for obj in objects] == \
+        ['Site:Location', 'RunPeriodControl:DaylightSavingTime', 'Timestep', 'Version']
+    assert objects[0][1] == ['Chicago Ohare Intl Ap_IL_USA Design_Conditions',
+                             '41.98', '-87.92', '-6.00', '201.00']
+    assert objects[1][1] == ['2nd Sunday in March', '2nd Sunday in November']
+    assert objects[2][1] == ['6']
+    assert objects[3][1] == ['9.1']
+
+
+def test_parse_idf_objects_types():
+    """Test the parsing of certain object types in an IDF string."""
+    objects = list(parse_idf_objects(IDF_TEXT, ('site:location', 'Timestep')))
+    assert [obj[0] for obj in objects] == ['Site:Location', 'Timestep']
+    assert list(parse_idf_objects(IDF_TEXT, ('SizingPeriod:DesignDay',))) == []
+
+
+def test_parse_idf_string():
+    """Test the parsing of a single IDF object string."""
+    loc_str = IDF_TEXT.split('RunPeriodControl')[0]
+    obj_type, obj_fields = parse_idf_string(loc_str, 'Site:Location')
+    assert obj_type == 'Site:Location'
+    assert len(obj_fields) == 5
+
+    obj_type, obj_fields = parse_idf_string('Timestep, 4')
+    assert obj_type == 'Timestep'
+    assert obj_fields == ['4']
+
+    with pytest.raises(AssertionError):
+        parse_idf_string(loc_str, 'SizingPeriod:DesignDay')
+    with pytest.raises(ValueError):
+        parse_idf_string(' ! only a comment')
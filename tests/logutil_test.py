@@ -0,0 +1,82 @@
+# coding=utf-8
+from ladybug.logutil import get_logger
+
+import pytest
+import os
+import sys
+import time
+
+
+def _read_log(log_file, text, timeout=5):
+    """Read a log file, waiting for a given text to be written to it."""
+    end_time = time.time() + timeout
+    while time.time() < end_time:
+        if os.path.isfile(log_file):
+            with open(log_file) as log_data:
+                content = log_data.read()
+            if text in content:
+                return content
+        time.sleep(0.01)
+    return ''
+
+
+def test_get_logger_lazy_file(tmpdir, monkeypatch):
+    """Test that the log file is only created when the first record is emitted."""
+    monkeypatch.setenv('HOME', str(tmpdir))
+    log_file = os.path.join(str(tmpdir), '.ladybug', 'lazy_test.log')
+    logger = get_logger('ladybug_lazy_test', filename='lazy_test.log')
+    assert not os.path.isdir(os.path.join(str(tmpdir), '.ladybug'))
+
+    logger.warning('Lazy log record')
+    assert 'Lazy log record' in _read_log(log_file, 'Lazy log record')
+    for handler in logger.handlers:
+        handler.close()
+
+
+def test_get_logger_handlers_reused():
+    """Test that calling get_logger several times does not duplicate handlers."""
+    logger = get_logger('ladybug_reuse_test', filename='reuse_test.log')
+    handler_count = len(logger.handlers)
+    assert get_logger('ladybug_reuse_test', filename='reuse_test.log') is logger
+    assert len(logger.handlers) == handler_count == 2
+
+    other_logger = get_logger('ladybug_reuse_test_2', filename='reuse_test.log')
+    assert other_logger.handlers == logger.handlers
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason='requires QueueListener')
+def test_get_logger_queue(tmpdir, monkeypatch):
+    """Test that records are written to the log file by a background thread."""
+    monkeypatch.setenv('HOME', str(tmpdir))
+    log_file = os.path.join(str(tmpdir), '.ladybug', 'queue_test.log')
+    logger = get_logger('ladybug_queue_test', filename='queue_test.log', use_queue=True)
+    assert len(logger.handlers) == 1
+    assert get_logger('ladybug_queue_test', filename='queue_test.log',
+                      use_queue=True).handlers == logger.handlers
+
+    logger.error('Queued log record')
+    content = _read_log(log_file, 'Queued log record')
+    assert 'ladybug_queue_test - ERROR - Queued log record' in content
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason='requires QueueListener')
+def test_get_logger_switch_queue(tmpdir, monkeypatch):
+    """Test that records are written once after switching use_queue on a logger."""
+    monkeypatch.setenv('HOME', str(tmpdir))
+    log_file = os.path.join(str(tmpdir), '.ladybug', 'switch_test.log')
+    logger = get_logger('ladybug_switch_test', filename='switch_test.log')
+    assert len(logger.handlers) == 2
+
+    logger = get_logger('ladybug_switch_test', filename='switch_test.log',
+                        use_queue=True)
+    assert len(logger.handlers) == 1
+    logger.warning('Queued switch record')
+    _read_log(log_file, 'Queued switch record')
+
+    logger = get_logger('ladybug_switch_test', filename='switch_test.log')
+    assert len(logger.handlers) == 2
+    logger.warning('Direct switch record')
+    time.sleep(0.1)  # give any duplicate queued record time to be written
+    content = _read_log(log_file, 'Direct switch record')
+    assert content.count('Queued switch record') == 1
+    assert content.count('Direct switch record') == 1
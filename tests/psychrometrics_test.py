@@ -4,7 +4,16 @@ from ladybug.psychrometrics import humid_ratio_from_db_rh, enthalpy_from_db_hr,
     rel_humid_from_db_enth, rel_humid_from_db_dpt, rel_humid_from_db_wb, \
     dew_point_from_db_hr, dew_point_from_db_enth, dew_point_from_db_wb, \
     db_temp_from_enth_hr, db_temp_from_rh_hr, db_temp_and_hr_from_wb_rh, \
-    dew_point_from_db_rh_fast, wet_bulb_from_db_rh_fast, wet_bulb_from_db_hr
+    dew_point_from_db_rh_fast, wet_bulb_from_db_rh_fast, wet_bulb_from_db_hr, \
+    humid_ratio_from_db_wb, \
+    humid_ratio_from_db_rh_array, enthalpy_from_db_hr_array, \
+    dew_point_from_db_rh_array, wet_bulb_from_db_rh_array, \
+    rel_humid_from_db_hr_array, rel_humid_from_db_dpt_array, \
+    rel_humid_from_db_wb_array, humid_ratio_from_db_wb_array, \
+    db_temp_from_enth_hr_array, db_temp_from_rh_hr_array, \
+    db_temp_and_hr_from_wb_rh_array, saturated_vapor_pressure, \
+    saturated_vapor_pressure_fast, saturated_vapor_pressure_array, \
+    set_fast_saturated_vapor_pressure
 
 import pytest
 
@@ -194,3 +203,100 @@ def test_wet_bulb_from_db_rh_fast():
     assert wet_bulb_from_db_rh_fast(-20, 0) == pytest.approx(-21.69, rel=1e-3)
     assert wet_bulb_from_db_rh_fast(-20, 50) == pytest.approx(-20.84, rel=1e-3)
     assert wet_bulb_from_db_rh_fast(-20, 100) == pytest.approx(-20, rel=1e-3)
+
+
+def test_array_functions():
+    """Test that the array functions match the scalar functions."""
+    db_temps = [-20, -5, 0, 20, 30]
+    rel_humids = [10, 50, 100, 50, 75]
+    pressures = [101325, 90000, 101325, 85000, 101325]
+
+    hrs = humid_ratio_from_db_rh_array(db_temps, rel_humids, pressures)
+    assert hrs == [humid_ratio_from_db_rh(t, rh, p)
+                   for t, rh, p in zip(db_temps, rel_humids, pressures)]
+    assert enthalpy_from_db_hr_array(db_temps, hrs) == \
+        [enthalpy_from_db_hr(t, hr) for t, hr in zip(db_temps, hrs)]
+    assert rel_humid_from_db_hr_array(db_temps, hrs, pressures) == \
+        [rel_humid_from_db_hr(t, hr, p) for t, hr, p in zip(db_temps, hrs, pressures)]
+
+    dpts = dew_point_from_db_rh_array(db_temps, rel_humids)
+    assert dpts == pytest.approx(
+        [dew_point_from_db_rh(t, rh) for t, rh in zip(db_temps, rel_humids)], abs=0.1)
+    assert rel_humid_from_db_dpt_array(db_temps, dpts) == \
+        [rel_humid_from_db_dpt(t, dpt) for t, dpt in zip(db_temps, dpts)]
+
+    wbs = wet_bulb_from_db_rh_array(db_temps, rel_humids)
+    assert wbs == pytest.approx(
+        [wet_bulb_from_db_rh(t, rh) for t, rh in zip(db_temps, rel_humids)], abs=0.1)
+    assert rel_humid_from_db_wb_array(db_temps, wbs) == \
+        [rel_humid_from_db_wb(t, wb) for t, wb in zip(db_temps, wbs)]
+    assert humid_ratio_from_db_wb_array(db_temps, wbs) == \
+        [humid_ratio_from_db_wb(t, wb) for t, wb in zip(db_temps, wbs)]
+
+    enths = enthalpy_from_db_hr_array(db_temps, hrs, -17.78)
+    assert db_temp_from_enth_hr_array(enths, hrs, -17.78) == \
+        [db_temp_from_enth_hr(e, hr, -17.78) for e, hr in zip(enths, hrs)]
+    assert db_temp_from_rh_hr_array(rel_humids, hrs, pressures) == \
+        [db_temp_from_rh_hr(rh, hr, p) for rh, hr, p in zip(rel_humids, hrs, pressures)]
+    db_ts, hr_vals = db_temp_and_hr_from_wb_rh_array(wbs, rel_humids)
+    for wb, rh, db_t, hr in zip(wbs, rel_humids, db_ts, hr_vals):
+        assert (db_t, hr) == db_temp_and_hr_from_wb_rh(wb, rh)
+
+
+def test_array_functions_broadcast():
+    """Test the broadcasting of single numbers in the array functions."""
+    assert humid_ratio_from_db_rh_array(20, 50) == [humid_ratio_from_db_rh(20, 50)]
+    assert humid_ratio_from_db_rh_array([20, 30], 50, 90000) == \
+        [humid_ratio_from_db_rh(20, 50, 90000), humid_ratio_from_db_rh(30, 50, 90000)]
+    assert humid_ratio_from_db_rh_array(20, (50, 100)) == \
+        [humid_ratio_from_db_rh(20, 50), humid_ratio_from_db_rh(20, 100)]
+    with pytest.raises(AssertionError):
+        humid_ratio_from_db_rh_array([20, 30], [50, 60, 70])
+
+
+def test_array_solver_tolerance():
+    """Test the tolerance of the dew point and wet bulb array solvers."""
+    db_temps = [-30, -5, 0, 12, 25, 40]
+    rel_humids = [0, 20, 50, 100, 65, 30]
+    hrs = humid_ratio_from_db_rh_array(db_temps, rel_humids)
+
+    dpts = dew_point_from_db_rh_array(db_temps, rel_humids, tolerance=1e-6)
+    assert dpts[0] == -273.15
+    assert dpts[3] == pytest.approx(12, abs=1e-6)
+    for t, dpt, rh in zip(db_temps[1:], dpts[1:], rel_humids[1:]):
+        assert rel_humid_from_db_dpt(t, dpt) == pytest.approx(rh, abs=1e-4)
+
+    wbs = wet_bulb_from_db_rh_array(db_temps, rel_humids, tolerance=1e-6)
+    assert wbs[3] == pytest.approx(12, abs=1e-6)
+    for t, wb, hr in zip(db_temps, wbs, hrs):
+        assert humid_ratio_from_db_wb(t, wb) == pytest.approx(hr, abs=1e-7)
+    coarse_wbs = wet_bulb_from_db_rh_array(db_temps, rel_humids, tolerance=0.5)
+    assert coarse_wbs == pytest.approx(wbs, abs=0.5)
+
+
+def test_saturated_vapor_pressure_fast():
+    """Test the accuracy of the saturated vapor pressure lookup table."""
+    for i in range(4001):
+        t_kelvin = 173.15 + i * 0.05
+        assert saturated_vapor_pressure_fast(t_kelvin) == \
+            pytest.approx(saturated_vapor_pressure(t_kelvin), rel=2e-7)
+    assert saturated_vapor_pressure_fast(400) == saturated_vapor_pressure(400)
+    assert saturated_vapor_pressure_fast(150) == saturated_vapor_pressure(150)
+
+
+def test_set_fast_saturated_vapor_pressure():
+    """Test turning on the fast mode of saturated_vapor_pressure."""
+    temps = [-40, -0.25, 0, 0.25, 21.3, 45]
+    exact_hr = humid_ratio_from_db_rh_array(temps, 50)
+    set_fast_saturated_vapor_pressure()
+    try:
+        assert saturated_vapor_pressure(300.1) == saturated_vapor_pressure_fast(300.1)
+        assert saturated_vapor_pressure_array([300.1]) == \
+            [saturated_vapor_pressure_fast(300.1)]
+        fast_hr = humid_ratio_from_db_rh_array(temps, 50)
+        assert fast_hr != exact_hr
+        assert fast_hr == pytest.approx(exact_hr, rel=1e-6)
+        assert humid_ratio_from_db_rh(21.3, 50) == fast_hr[4]
+    finally:
+        set_fast_saturated_vapor_pressure(False)
+    assert humid_ratio_from_db_rh_array(temps, 50) == exact_hr
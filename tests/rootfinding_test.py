@@ -1,5 +1,7 @@
 # coding=utf-8
-from ladybug.rootfinding import secant, bisect
+from ladybug.rootfinding import secant, bisect, newton_array
+
+import pytest
 
 
 def test_secant():
@@ -18,3 +20,30 @@ def test_bisect():
     
     root_val = bisect(-5, 5, funct, 0.001, 0)
     assert root_val < 1e-3
+
+
+def test_newton_array():
+    """Test the newton_array rootfinding method."""
+    targets = [0, 3, 8, 24]
+
+    def funct(indices, values):
+        errors = [(x + 1) ** 2 - 1 - targets[i] for i, x in zip(indices, values)]
+        return errors, [2 * (x + 1) for x in values]
+
+    roots = newton_array([5] * 4, funct, 0.0001)
+    assert roots == pytest.approx([0, 1, 2, 4], abs=1e-6)
+
+    bound_roots = newton_array([5] * 4, funct, 0.0001, [-0.5] * 4, [5] * 4)
+    assert bound_roots == pytest.approx([0, 1, 2, 4], abs=1e-6)
+    assert newton_array([], funct, 0.0001) == []
+
+
+def test_newton_array_zero_derivative():
+    """Test the newton_array method for a root with a zero derivative."""
+    def funct(indices, values):
+        return [(x + 1) ** 2 - 4 for x in values], [2 * (x + 1) for x in values]
+
+    with pytest.raises(ValueError):
+        newton_array([5, -1], funct, 0.0001)
+    roots = newton_array([5, -1], funct, 0.0001, [0, -1], [5, 5])
+    assert roots == pytest.approx([1, 1], abs=1e-6)
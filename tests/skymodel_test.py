@@ -1,6 +1,8 @@
 # coding=utf-8
 from ladybug.skymodel import estimate_illuminance_from_irradiance, \
-    dirint, disc, _get_dirint_coeffs
+    dirint, disc, _get_dirint_coeffs, ashrae_clear_sky, ashrae_clear_sky_monthly, \
+    ashrae_revised_clear_sky, ashrae_revised_clear_sky_monthly, \
+    zhang_huang_solar, zhang_huang_solar_array
 
 import pytest
 import math
@@ -81,3 +83,59 @@ def test_disc_overirradiance():
     assert disc_result[0] == pytest.approx(872.544, rel=1e-2)
     assert disc_result[1] == pytest.approx(1.000, rel=1e-3)
     assert disc_result[2] == pytest.approx(0.999493933, rel=1e-3)
+
+
+def test_ashrae_clear_sky_monthly():
+    """Test that ashrae_clear_sky_monthly matches ashrae_clear_sky for each month."""
+    altitudes = [-10, 0, 1e-5, 5, 30, 60, 90]
+    all_alts = altitudes * 12
+    months = [m for m in range(1, 13) for _ in altitudes]
+    dir_norm, diff_horiz = ashrae_clear_sky_monthly(all_alts, months, 1.1)
+    chk_dir_norm, chk_diff_horiz = [], []
+    for month in range(1, 13):
+        dnr, dhr = ashrae_clear_sky(altitudes, month, 1.1)
+        chk_dir_norm.extend(dnr)
+        chk_diff_horiz.extend(dhr)
+    assert dir_norm == chk_dir_norm
+    assert diff_horiz == chk_diff_horiz
+    assert dir_norm[:3] == [0, 0, 0]
+    assert dir_norm[6] == pytest.approx(1202 / math.exp(0.141) * 1.1, rel=1e-6)
+
+    with pytest.raises(AssertionError):
+        ashrae_clear_sky_monthly(altitudes, [1])
+
+
+def test_ashrae_revised_clear_sky_monthly():
+    """Test that the monthly ASHRAE revised clear sky matches each month."""
+    altitudes = [-10, 0, 5, 30, 60, 90]
+    all_alts = altitudes * 12
+    months = [m for m in range(1, 13) for _ in altitudes]
+    tau_b = [0.3 + 0.01 * i for i in range(12)]
+    tau_d = [2.0 + 0.05 * i for i in range(12)]
+    for use_2017 in (False, True):
+        dir_norm, diff_horiz = ashrae_revised_clear_sky_monthly(
+            all_alts, months, tau_b, tau_d, use_2017)
+        chk_dir_norm, chk_diff_horiz = [], []
+        for i in range(12):
+            dnr, dhr = ashrae_revised_clear_sky(altitudes, tau_b[i], tau_d[i], use_2017)
+            chk_dir_norm.extend(dnr)
+            chk_diff_horiz.extend(dhr)
+        assert dir_norm == chk_dir_norm
+        assert diff_horiz == chk_diff_horiz
+
+
+def test_zhang_huang_solar_array():
+    """Test that the Zhang-Huang array model matches the single value model."""
+    altitudes = [-5, 0, 10, 35, 60, 80]
+    cloud = [0, 2, 5, 8, 10, 3]
+    rh = [40, 55, 70, 90, 100, 60]
+    db = [5, 12, 20, 28, 31, -4]
+    db_3 = [3, 10, 21, 25, 30, -2]
+    ws = [0, 2.5, 4, 7, 1, 10]
+    ghi = zhang_huang_solar_array(altitudes, cloud, rh, db, db_3, ws)
+    chk_ghi = [zhang_huang_solar(*vals)
+               for vals in zip(altitudes, cloud, rh, db, db_3, ws)]
+    chk_ghi = [0 if val < 0 else val for val in chk_ghi]
+    assert ghi == pytest.approx(chk_ghi, abs=1e-9)
+    assert ghi[0] == 0
+    assert all(val >= 0 for val in ghi)
@@ -47,6 +47,32 @@ def test_stat_location():
     assert stat.koppen_climate_zone == 'Cfa'
 
 
+def test_lazy_import():
+    """Test that lazily importing a stat file only parses the requested sections."""
+    relative_path = './tests/fixtures/stat/chicago.stat'
+    stat = STAT(relative_path)
+    lazy_stat = STAT(relative_path, lazy=True)
+
+    assert lazy_stat.location.city == stat.location.city
+    assert len(lazy_stat._unparsed_sections) == len(STAT._section_groups)
+    assert lazy_stat.monthly_tau_beam == stat.monthly_tau_beam
+    assert 'tau' not in lazy_stat._unparsed_sections
+    assert 'design_days' in lazy_stat._unparsed_sections
+    assert lazy_stat.to_dict() == stat.to_dict()
+    assert len(lazy_stat._unparsed_sections) == 0
+
+
+def test_monthly_wind_dirs():
+    """Test that each wind direction is imported from its own row of the file."""
+    relative_path = './tests/fixtures/stat/chicago.stat'
+    stat = STAT(relative_path)
+
+    assert len(stat._monthly_wind_dirs) == 8
+    assert stat._monthly_wind_dirs[2][:3] == [2, 0, 8]  # East
+    assert stat._monthly_wind_dirs[6][:3] == [23, 32, 21]  # West
+    assert stat.monthly_wind_dirs[:3] == [315, 270, 270]
+
+
 def test_annual_heating_design_days():
     """Test the annual heating design days within the stat object."""
     relative_path = './tests/fixtures/stat/chicago.stat'
@@ -105,7 +131,7 @@ def test_annual_cooling_design_days():
     assert ann_cdd_10.humidity_condition.humidity_value == 25.8
 
 
-def test_monthly_cooling_design_days():
+def test_monthly_cooling_design_days(tmpdir):
     """Test the monthly cooling design days within the stat object."""
     relative_path = './tests/fixtures/stat/chicago.stat'
     stat = STAT(relative_path)
@@ -118,9 +144,12 @@ def test_monthly_cooling_design_days():
     assert len(m_ddy_050) == len(m_ddy_100) == len(m_ddy_020) == \
         len(m_ddy_004) == 12
 
-    ddy_path = './tests/fixtures/ddy/chicago_monthly.ddy'
+    ddy_path = os.path.join(str(tmpdir), 'chicago_monthly.ddy')
     monthly_ddy = DDY(stat.location, m_ddy_050)
     monthly_ddy.save(ddy_path)
+    saved_ddy = DDY.from_ddy_file(ddy_path)
+    fixture_ddy = DDY.from_ddy_file('./tests/fixtures/ddy/chicago_monthly.ddy')
+    assert saved_ddy.design_days == fixture_ddy.design_days
 
 
 def test_typical_extreme_weeks():
@@ -1,6 +1,6 @@
 # coding=utf-8
 from ladybug.location import Location
-from ladybug.sunpath import Sunpath, Sun
+from ladybug.sunpath import Sunpath, Sun, SunCollection
 from ladybug.dt import DateTime, Time
 from ladybug.analysisperiod import AnalysisPeriod
 
@@ -322,3 +322,131 @@ def test_north_south_pole():
     sp = Sunpath.from_location(loc)
     suns = sp.hourly_analemma_suns()
     assert len(suns) == 24
+
+
+def test_sunpath_geometry_cache():
+    """Test that the sunpath geometry is shared across equal Sunpaths."""
+    nyc = Location('New_York', country='USA', latitude=40.72, longitude=-74.02,
+                   time_zone=-5)
+    sp = Sunpath.from_location(nyc)
+    analemma_geo = sp.hourly_analemma_polyline3d(daytime_only=False)
+    analem_suns = sp.hourly_analemma_suns()
+    for pline, suns in zip(analemma_geo, analem_suns):
+        for pt, sun in zip(pline.vertices, suns):
+            assert pt == sun.position_3d()
+    positions = sp._hourly_analemma_positions()
+    assert Sunpath.from_location(nyc)._hourly_analemma_positions() is positions
+
+    sp.north_angle = 45
+    assert sp._hourly_analemma_positions() is not positions
+    sun = sp.calculate_sun(1, 21, 12)
+    assert sp._hourly_analemma_positions()[12][0] == \
+        (sun.sun_vector_reversed.x, sun.sun_vector_reversed.y,
+         sun.sun_vector_reversed.z)
+
+    arcs = sp.monthly_day_arc3d()
+    assert arcs[2] == sp.day_arc3d(3, 21)
+
+
+def test_solar_geometry_memo():
+    """Test that the solar geometry is memoized without changing the results."""
+    sp = Sunpath(40.72, -74.02, -5)
+    sun = sp.calculate_sun(6, 21, 9.5)
+    assert len(sp._solar_geometries) == 1
+    assert sp.calculate_sun(6, 21, 9.5) == sun
+    assert len(sp._solar_geometries) == 1
+
+    sp.time_zone = -4  # the memo should not return values for the old time zone
+    new_sun = sp.calculate_sun(6, 21, 9.5)
+    assert len(sp._solar_geometries) == 2
+    assert new_sun == Sunpath(40.72, -74.02, -4).calculate_sun(6, 21, 9.5)
+    assert new_sun.altitude != approx(sun.altitude, abs=1)
+
+
+def test_annual_sunrise_sunset():
+    """Test the calculate_annual_sunrise_sunset method."""
+    nyc = Location('New_York', country='USA', latitude=40.72, longitude=-74.02,
+                   time_zone=-5)
+    sp = Sunpath.from_location(nyc)
+    riseset = sp.calculate_annual_sunrise_sunset()
+    for key in ('sunrise', 'noon', 'sunset'):
+        assert len(riseset[key]) == 365
+    day_riseset = sp.calculate_sunrise_sunset(3, 21)
+    doy = DateTime(3, 21).doy - 1
+    for key in ('sunrise', 'noon', 'sunset'):
+        assert riseset[key][doy] == approx(day_riseset[key].float_hour, abs=1 / 60.0)
+
+    moys = sp.calculate_annual_sunrise_sunset(as_moys=True)
+    for key in ('sunrise', 'noon', 'sunset'):
+        assert moys[key][doy] == day_riseset[key].moy
+
+    sp.is_leap_year = True
+    assert len(sp.calculate_annual_sunrise_sunset()['noon']) == 366
+
+    sp = Sunpath(80, 0, 0)  # arctic circle with polar day and night
+    riseset = sp.calculate_annual_sunrise_sunset(is_solar_time=True)
+    assert riseset['sunrise'][0] is None and riseset['sunset'][0] is None
+    assert riseset['sunrise'][171] is None and riseset['sunset'][171] is None
+    assert riseset['noon'][0] == riseset['noon'][171] == 12
+    assert riseset['sunrise'][79] is not None
+
+
+def test_sun_collection():
+    """Test the calculate_sun_collection method and the SunCollection."""
+    nyc = Location('New_York', country='USA', latitude=40.72, longitude=-74.02,
+                   time_zone=-5)
+    sp = Sunpath.from_location(nyc, north_angle=30)
+    a_period = AnalysisPeriod(st_month=6, end_month=6, end_day=2)
+    suns = sp.calculate_sun_collection(a_period.datetimes)
+    assert isinstance(suns, SunCollection)
+    assert len(suns) == 48
+    assert suns.moys == a_period.moys
+    assert suns.north_angle == approx(30)
+
+    for i, dt in enumerate(a_period.datetimes):
+        sun = sp.calculate_sun_from_date_time(dt)
+        assert suns[i] == sun
+        assert suns.altitudes[i] == sun.altitude
+        assert suns.azimuths[i] == sun.azimuth
+        assert suns.sun_vectors[i] == tuple(sun.sun_vector)
+        assert suns.sun_vectors_reversed[i] == tuple(sun.sun_vector_reversed)
+        assert suns.is_during_day[i] == sun.is_during_day
+    assert list(suns)[-1] == suns[-1]
+
+    day_suns = suns.filter_by_is_during_day()
+    assert 0 < len(day_suns) < len(suns)
+    assert all(sun.is_during_day for sun in day_suns)
+    assert day_suns.sun_vectors == tuple(
+        vec for vec, d in zip(suns.sun_vectors, suns.is_during_day) if d)
+
+    first_day = suns[:24]
+    assert isinstance(first_day, SunCollection)
+    assert first_day.datetimes == suns.datetimes[:24]
+    assert len(suns.filter_by_pattern([True, False])) == 24
+    assert len(suns.duplicate()) == 48
+
+
+def test_sun_collection_batch():
+    """Test the calculation of sun collections for several locations."""
+    nyc = Location('New_York', country='USA', latitude=40.72, longitude=-74.02,
+                   time_zone=-5)
+    sydney = Location('Sydney', country='AUS', latitude=-33.87, longitude=151.21,
+                      time_zone=10)
+    sites = [nyc, (42.37, -71.02, -5), sydney]
+    a_period = AnalysisPeriod(st_month=3, end_month=3, end_day=7, timestep=2)
+    for processes in (1, 2):
+        batch = Sunpath.calculate_sun_collection_batch(sites, a_period,
+                                                       processes=processes)
+        assert len(batch) == 3
+        for site, suns in zip(sites, batch):
+            sp = Sunpath.from_location(site) if isinstance(site, Location) \
+                else Sunpath(*site)
+            site_suns = sp.calculate_sun_collection(a_period.datetimes)
+            assert suns.datetimes == site_suns.datetimes
+            assert suns.altitudes == site_suns.altitudes
+            assert suns.azimuths == site_suns.azimuths
+
+    suns_iter = Sunpath.iter_sun_collection_batch(sites)
+    first_suns = next(suns_iter)
+    assert len(first_suns) == 8760
+    assert len(list(suns_iter)) == 2
@@ -61,3 +61,34 @@ def test_horizontal_radial_patches():
     assert len(view_vec) == 576
     assert all(isinstance(vec, Vector3D) for vec in view_vec)
     assert isinstance(view_mesh, Mesh3D)
+
+
+def test_dome_patch_index():
+    """Test the dome_patch_index and dome_patch_indices methods."""
+    assert view_sphere.dome_patch_index(5, 0) == 0
+    assert view_sphere.dome_patch_index(5, 359) == 0
+    assert view_sphere.dome_patch_index(5, 12) == 1
+    assert view_sphere.dome_patch_index(13, 0) == 30
+    assert view_sphere.dome_patch_index(89, 180) == 144
+    assert view_sphere.dome_patch_index(-5, 0) is None
+    assert view_sphere.dome_patch_index(89, 180, 2) == 576
+
+    vectors = view_sphere.tregenza_dome_vectors
+    assert view_sphere.dome_patch_indices(vectors) == list(range(145))
+    vectors = view_sphere.reinhart_dome_vectors
+    assert view_sphere.dome_patch_indices(vectors, 2) == list(range(577))
+    assert view_sphere.dome_patch_indices([(0, 1, -0.5)]) == [None]
+
+
+def test_dome_patch_totals():
+    """Test the dome_patch_totals method."""
+    vectors = [(0, 1, 0.01), (0, 1, 0.02), (0, 0, 1), (1, 0, -0.5)]
+    totals = view_sphere.dome_patch_totals(vectors, [1, 2, 3, 4])
+    assert len(totals) == 145
+    assert totals[0] == 3
+    assert totals[144] == 3
+    assert sum(totals) == 6
+
+    totals = view_sphere.dome_patch_totals(vectors, [1, 2, 3, 4], 2)
+    assert len(totals) == 577
+    assert sum(totals) == 6
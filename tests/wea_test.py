@@ -178,6 +178,36 @@ def test_from_zhang_huang():
         pytest.approx(144.51, rel=1e-1)
 
 
+def test_from_zhang_huang_batch():
+    """Test that the Zhang-Huang batch matches Weas created for each station."""
+    epws = [EPW('./tests/fixtures/epw/chicago.epw'),
+            EPW('./tests/fixtures/epw/tokyo.epw')]
+    args = ([epw.location for epw in epws], [epw.total_sky_cover for epw in epws],
+            [epw.relative_humidity for epw in epws],
+            [epw.dry_bulb_temperature for epw in epws],
+            [epw.wind_speed for epw in epws])
+    pressures = [epws[0].atmospheric_station_pressure, None]
+    chk_weas = [
+        Wea.from_zhang_huang_solar(
+            epw.location, epw.total_sky_cover, epw.relative_humidity,
+            epw.dry_bulb_temperature, epw.wind_speed, pres)
+        for epw, pres in zip(epws, pressures)]
+
+    for processes in (1, 2):
+        weas = Wea.from_zhang_huang_solar_batch(*args, atmospheric_pressures=pressures,
+                                                processes=processes)
+        assert len(weas) == 2
+        for wea, chk_wea in zip(weas, chk_weas):
+            assert wea.location.city == chk_wea.location.city
+            assert wea.direct_normal_irradiance.values == \
+                chk_wea.direct_normal_irradiance.values
+            assert wea.diffuse_horizontal_irradiance.values == \
+                chk_wea.diffuse_horizontal_irradiance.values
+
+    with pytest.raises(AssertionError):
+        Wea.from_zhang_huang_solar_batch(args[0][:1], *args[1:])
+
+
 def test_zhang_huang_accuracy():
     """Test zhang huang solar model to ensure that average error is within
     25% of actual solar."""
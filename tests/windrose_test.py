@@ -12,7 +12,9 @@ from ladybug.dt import DateTime
 from ladybug.epw import EPW
 from ladybug.windrose import WindRose
 from ladybug.legend import LegendParameters
+from ladybug.color import Color
 
+from ladybug_geometry.geometry2d.pointvector import Point2D
 from ladybug_geometry.geometry2d.mesh import Mesh2D
 from ladybug_geometry.geometry2d.line import LineSegment2D
 from ladybug_geometry.geometry2d.polygon import Polygon2D
@@ -723,3 +725,122 @@ def test_wind_polygons():
     chk_poly_num = 4
     w.colored_mesh
     assert chk_poly_num == len(w.windrose_lines)
+
+
+def test_set_number_of_directions():
+    """Test changing the number of directions of an existing windrose."""
+    epw_path = os.path.join(os.getcwd(), 'tests/fixtures/epw/tokyo.epw')
+    epw = EPW(epw_path)
+
+    w = WindRose(epw.wind_direction, epw.wind_speed, 72)
+    for dir_count in (72, 24, 8, 36, 12, 16, 3):
+        w.number_of_directions = dir_count
+        chk_w = WindRose(epw.wind_direction, epw.wind_speed, dir_count)
+        assert w.number_of_directions == dir_count
+        assert w.angles == chk_w.angles
+        assert w.histogram_data == chk_w.histogram_data
+        assert w.prevailing_direction == chk_w.prevailing_direction
+        assert w.frequency_intervals_compass == chk_w.frequency_intervals_compass
+    assert len(w.colored_mesh.faces) == len(chk_w.colored_mesh.faces)
+
+    # Test directions that fall on the bin edges after merging bins
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    dates = [DateTime(6, 21, i) for i in range(24)]
+    dir_vals = [i * 15 for i in range(24)]
+    spd_vals = [i + 1 for i in range(24)]
+    spd_data = HourlyDiscontinuousCollection(
+        Header(Speed(), 'm/s', a_per), spd_vals, dates)
+    dir_data = HourlyDiscontinuousCollection(
+        Header(GenericType('Direction', 'deg'), 'deg', a_per), dir_vals, dates)
+    w = WindRose(dir_data, spd_data, 36)
+    w.number_of_directions = 12
+    assert w.histogram_data == WindRose(dir_data, spd_data, 12).histogram_data
+    w.number_of_directions = 4
+    assert w.histogram_data == WindRose(dir_data, spd_data, 4).histogram_data
+
+    with pytest.raises(AssertionError):
+        w.number_of_directions = 0
+
+
+def test_colored_mesh_reuse():
+    """Test that the colored mesh is only partly recomputed when properties change."""
+    epw_path = os.path.join(os.getcwd(), 'tests/fixtures/epw/tokyo.epw')
+    epw = EPW(epw_path)
+
+    w = WindRose(epw.wind_direction, epw.wind_speed, 16)
+    w.show_zeros = True
+    w.legend_parameters = LegendParameters(segment_count=10)
+    mesh = w.colored_mesh
+    stacked_data, mesh_data = w._stacked_data, w._mesh_data
+
+    # changing the legend colors does not recompute the geometry
+    w.legend_parameters = LegendParameters(segment_count=10, colors=[
+        Color(0, 0, 0), Color(255, 255, 255)])
+    new_mesh = w.colored_mesh
+    assert w._stacked_data is stacked_data and w._mesh_data is mesh_data
+    assert new_mesh.vertices == mesh.vertices
+    assert new_mesh.colors != mesh.colors
+
+    # changing the frequency spacing only recomputes the geometry
+    w.frequency_spacing_distance = 20
+    new_mesh = w.colored_mesh
+    assert w._stacked_data is stacked_data and w._mesh_data is not mesh_data
+    assert new_mesh.vertices != mesh.vertices
+
+    # changing the legend segments recomputes both
+    w.legend_parameters = LegendParameters(segment_count=5)
+    new_mesh = w.colored_mesh
+    assert w._stacked_data is not stacked_data
+    chk_w = WindRose(epw.wind_direction, epw.wind_speed, 16)
+    chk_w.show_zeros = True
+    chk_w.frequency_spacing_distance = 20
+    chk_w.legend_parameters = LegendParameters(segment_count=5)
+    chk_mesh = chk_w.colored_mesh
+    assert new_mesh.vertices == chk_mesh.vertices
+    assert new_mesh.faces == chk_mesh.faces
+    assert new_mesh.colors == chk_mesh.colors
+
+
+def test_from_periods():
+    """Test that WindRose.from_periods matches separately created WindRoses."""
+    epw_path = os.path.join(os.getcwd(), 'tests/fixtures/epw/tokyo.epw')
+    epw = EPW(epw_path)
+    periods = [AnalysisPeriod(st_month=m, end_month=m) for m in (1, 6, 12)]
+    periods.append(AnalysisPeriod(st_month=12, end_month=2, end_day=28))
+    periods.append(AnalysisPeriod(6, 1, 8, 8, 31, 17))
+    periods.append([True, False, False])
+
+    roses = WindRose.from_periods(epw.wind_direction, epw.wind_speed, periods, 16)
+    assert len(roses) == len(periods)
+    for period, rose in zip(periods, roses):
+        if isinstance(period, AnalysisPeriod):
+            dir_data = epw.wind_direction.filter_by_analysis_period(period)
+            spd_data = epw.wind_speed.filter_by_analysis_period(period)
+        else:
+            dir_data = epw.wind_direction.filter_by_pattern(period)
+            spd_data = epw.wind_speed.filter_by_pattern(period)
+        chk_rose = WindRose(dir_data, spd_data, 16)
+        assert rose.number_of_directions == 16
+        assert rose.zero_count == chk_rose.zero_count
+        assert rose.histogram_data == chk_rose.histogram_data
+        assert rose.analysis_values == chk_rose.analysis_values
+        assert rose.colored_mesh.vertices == chk_rose.colored_mesh.vertices
+        assert rose.colored_mesh.faces == chk_rose.colored_mesh.faces
+
+
+def test_colored_mesh_shared_vertices():
+    """Test that the colored mesh shares vertices like Mesh2D.from_face_vertices."""
+    epw_path = os.path.join(os.getcwd(), 'tests/fixtures/epw/tokyo.epw')
+    epw = EPW(epw_path)
+
+    for dir_count in (8, 16, 36, 72):
+        w = WindRose(epw.wind_direction, epw.wind_speed, dir_count)
+        w.show_zeros = True
+        w.frequency_hours = 20
+        mesh = w.colored_mesh
+
+        chk_mesh = Mesh2D.from_face_vertices(
+            [[Point2D(*pt) for pt in face] for face in w._poly_array], purge=True)
+        assert mesh.vertices == chk_mesh.vertices
+        assert mesh.faces == chk_mesh.faces
+        assert len(mesh.faces) == len(mesh.colors) == len(w.windrose_lines)